@@ -0,0 +1,116 @@
+"""keyset listing indexes
+
+Revision ID: a3f9c2e71b04
+Revises: d7c1c9f43a8b
+Create Date: 2026-10-16 12:00:00.000000
+
+- meetings.tenant_id (копия context[TENANT_CONTEXT_KEY]) + backfill батчами
+  по диапазонам id, каждый батч — отдельная транзакция (короткие блокировки,
+  без одного огромного UPDATE); в offline-режиме (--sql) — один UPDATE
+- индексы (…, created_at, id) под keyset-листинг встреч и security audit
+- на PostgreSQL индексы строятся CONCURRENTLY: таблица аудита большая
+  и пишется на каждый запрос
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f9c2e71b04"
+down_revision: str | None = "d7c1c9f43a8b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_MEETING_INDEXES = {
+    "ix_meetings_created_at_id": ["created_at", "id"],
+    "ix_meetings_status_created_at_id": ["status", "created_at", "id"],
+    "ix_meetings_tenant_created_at_id": ["tenant_id", "created_at", "id"],
+}
+_AUDIT_INDEXES = {
+    "ix_security_audit_events_created_at_id": ["created_at", "id"],
+    "ix_security_audit_events_outcome_created_at_id": ["outcome", "created_at", "id"],
+    "ix_security_audit_events_subject_created_at_id": ["subject", "created_at", "id"],
+}
+# прежние индексы аудита — префиксы новых
+_OLD_AUDIT_INDEXES = {
+    "ix_security_audit_events_created_at": ["created_at"],
+    "ix_security_audit_events_outcome_created_at": ["outcome", "created_at"],
+}
+
+
+_BACKFILL_BATCH_SIZE = 5000
+
+
+def _tenant_expr(dialect: str) -> str | None:
+    if dialect == "postgresql":
+        return "LEFT(context ->> :key, 128)"
+    if dialect == "sqlite":
+        return "substr(json_extract(context, '$.' || :key), 1, 128)"
+    return None
+
+
+def _backfill_tenant_id() -> None:
+    key = (os.getenv("TENANT_CONTEXT_KEY") or "").strip() or "tenant_id"
+    expr = _tenant_expr(op.get_context().dialect.name)
+    if expr is None:
+        return
+    update_sql = f"UPDATE meetings SET tenant_id = {expr} WHERE {expr} IS NOT NULL"
+    if context.is_offline_mode():
+        op.execute(sa.text(update_sql).bindparams(key=key))
+        return
+
+    # id-диапазоны по PK: следующий батч начинается после последнего id предыдущего
+    batch_upto = sa.text(
+        "SELECT max(id) FROM (SELECT id FROM meetings WHERE id > :after "
+        "ORDER BY id LIMIT :n) AS batch"
+    )
+    batch_update = sa.text(f"{update_sql} AND id > :after AND id <= :upto")
+    after = ""
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            upto = bind.execute(batch_upto, {"after": after, "n": _BACKFILL_BATCH_SIZE}).scalar()
+            if upto is None:
+                return
+            bind.execute(batch_update, {"key": key, "after": after, "upto": upto})
+            after = upto
+
+
+def _create_indexes(table: str, indexes: dict[str, list[str]]) -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in indexes.items():
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def _drop_indexes(table: str, indexes: dict[str, list[str]]) -> None:
+    with op.get_context().autocommit_block():
+        for name in indexes:
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    op.add_column("meetings", sa.Column("tenant_id", sa.String(length=128), nullable=True))
+    _backfill_tenant_id()
+    _create_indexes("meetings", _MEETING_INDEXES)
+    _create_indexes("security_audit_events", _AUDIT_INDEXES)
+    _drop_indexes("security_audit_events", _OLD_AUDIT_INDEXES)
+
+
+def downgrade() -> None:
+    _create_indexes("security_audit_events", _OLD_AUDIT_INDEXES)
+    _drop_indexes("security_audit_events", _AUDIT_INDEXES)
+    _drop_indexes("meetings", _MEETING_INDEXES)
+    op.drop_column("meetings", "tenant_id")
@@ -0,0 +1,34 @@
+"""retention checkpoints
+
+Revision ID: b81e4d09c6a2
+Revises: a3f9c2e71b04
+Create Date: 2026-10-16 15:00:00.000000
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b81e4d09c6a2"
+down_revision: str | None = "a3f9c2e71b04"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "retention_checkpoints",
+        sa.Column("policy", sa.String(length=32), primary_key=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("meeting_id", sa.String(length=64), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("retention_checkpoints")
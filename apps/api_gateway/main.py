@@ -20,6 +20,7 @@ from typing import Any
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
+from apps.api_gateway.pubsub_hub import close_pubsub_hub
 from apps.api_gateway.routers.admin import router as admin_router
 from apps.api_gateway.routers.analysis import router as analysis_router
 from apps.api_gateway.routers.artifacts import router as artifacts_router
@@ -105,6 +106,10 @@ def _create_app() -> FastAPI:
             return
         warmup_stt_provider_async()
 
+    @app.on_event("shutdown")
+    async def shutdown_pubsub_hub() -> None:
+        await close_pubsub_hub()
+
     app.include_router(meetings_router, prefix="/v1")
     app.include_router(artifacts_router, prefix="/v1")
     app.include_router(reports_router, prefix="/v1")
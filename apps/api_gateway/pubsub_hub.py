@@ -0,0 +1,168 @@
+"""
+Общий async-подписчик Redis pub/sub для WebSocket fan-out.
+
+Назначение:
+- одно соединение Redis pub/sub на процесс gateway вместо pubsub на каждый WebSocket
+- каналы ws:<meeting_id> подписываются по счётчику ссылок: первый слушатель
+  подписывает канал, последний — отписывает
+- сообщения раскладываются по asyncio.Queue каждого соединения, без потоков
+
+Медленный клиент не тормозит остальных: при переполнении его очереди
+самое старое сообщение выбрасывается (agent_ws_fanout_dropped_total).
+При обрыве соединения с Redis подписки восстанавливаются автоматически.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from contextlib import suppress
+
+from interview_analytics_agent.common.logging import get_project_logger
+from interview_analytics_agent.common.metrics import WS_FANOUT_CHANNELS, WS_FANOUT_DROPPED_TOTAL
+from interview_analytics_agent.queue.redis import async_redis_client
+
+log = get_project_logger()
+
+_QUEUE_SIZE = 256
+_POLL_TIMEOUT_SEC = 1.0
+_RECONNECT_DELAY_SEC = 1.0
+
+
+class PubSubHub:
+    def __init__(self, pubsub_factory: Callable[[], object], *, queue_size: int = _QUEUE_SIZE):
+        self._pubsub_factory = pubsub_factory
+        self._queue_size = max(1, int(queue_size))
+        self._pubsub = None
+        self._subs: dict[str, set[asyncio.Queue]] = {}
+        self._lock = asyncio.Lock()
+        self._reader: asyncio.Task | None = None
+
+    @property
+    def channels(self) -> list[str]:
+        return list(self._subs)
+
+    def _ensure_pubsub(self):
+        if self._pubsub is None:
+            self._pubsub = self._pubsub_factory()
+        return self._pubsub
+
+    def _ensure_reader(self) -> None:
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._run(), name="ws-pubsub-hub")
+
+    async def subscribe(self, channel: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        async with self._lock:
+            listeners = self._subs.get(channel)
+            if listeners is None:
+                await self._ensure_pubsub().subscribe(channel)
+                self._subs[channel] = {queue}
+                WS_FANOUT_CHANNELS.set(len(self._subs))
+            else:
+                listeners.add(queue)
+            self._ensure_reader()
+        return queue
+
+    async def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        async with self._lock:
+            listeners = self._subs.get(channel)
+            if not listeners:
+                return
+            listeners.discard(queue)
+            if listeners:
+                return
+            del self._subs[channel]
+            WS_FANOUT_CHANNELS.set(len(self._subs))
+            if self._pubsub is not None:
+                try:
+                    await self._pubsub.unsubscribe(channel)
+                except Exception as e:
+                    log.warning(
+                        "ws_pubsub_unsubscribe_failed",
+                        extra={"payload": {"channel": channel, "err": str(e)[:200]}},
+                    )
+
+    def _dispatch(self, channel: str, data) -> None:
+        for queue in self._subs.get(channel, ()):
+            if queue.full():
+                with suppress(asyncio.QueueEmpty):
+                    queue.get_nowait()
+                WS_FANOUT_DROPPED_TOTAL.inc()
+            queue.put_nowait(data)
+
+    async def _reconnect(self) -> None:
+        async with self._lock:
+            old, self._pubsub = self._pubsub, None
+            if old is not None:
+                with suppress(Exception):
+                    await old.aclose()
+            if self._subs:
+                await self._ensure_pubsub().subscribe(*self._subs)
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = self._pubsub
+            if pubsub is None or not self._subs:
+                # нечего слушать: redis-py не читает pubsub без подписок
+                await asyncio.sleep(_POLL_TIMEOUT_SEC / 10)
+                continue
+            try:
+                msg = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=_POLL_TIMEOUT_SEC
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning("ws_pubsub_read_failed", extra={"payload": {"err": str(e)[:200]}})
+                await asyncio.sleep(_RECONNECT_DELAY_SEC)
+                try:
+                    await self._reconnect()
+                except Exception as re:
+                    log.warning(
+                        "ws_pubsub_reconnect_failed", extra={"payload": {"err": str(re)[:200]}}
+                    )
+                continue
+            if not msg or msg.get("type") != "message" or not msg.get("data"):
+                continue
+            self._dispatch(str(msg.get("channel")), msg["data"])
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            with suppress(asyncio.CancelledError, Exception):
+                await self._reader
+            self._reader = None
+        if self._pubsub is not None:
+            with suppress(Exception):
+                await self._pubsub.aclose()
+            self._pubsub = None
+        self._subs.clear()
+        WS_FANOUT_CHANNELS.set(0)
+
+
+_hub: PubSubHub | None = None
+_hub_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _redis_pubsub():
+    return async_redis_client().pubsub()
+
+
+def get_pubsub_hub() -> PubSubHub:
+    """
+    Hub текущего event loop (в gateway он один; новый loop — новый hub).
+    """
+    global _hub, _hub_loop
+    loop = asyncio.get_running_loop()
+    if _hub is None or _hub_loop is not loop:
+        _hub = PubSubHub(_redis_pubsub)
+        _hub_loop = loop
+    return _hub
+
+
+async def close_pubsub_hub() -> None:
+    global _hub, _hub_loop
+    hub, _hub, _hub_loop = _hub, None, None
+    if hub is not None:
+        await hub.close()
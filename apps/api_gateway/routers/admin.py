@@ -19,6 +19,7 @@ from interview_analytics_agent.common.metrics import (
     record_sberjazz_reconcile_result,
 )
 from interview_analytics_agent.queue.redis import redis_client
+from interview_analytics_agent.queue.retry import retry_backlog
 from interview_analytics_agent.queue.streams import stream_dlq_name
 from interview_analytics_agent.services.readiness_service import evaluate_readiness
 from interview_analytics_agent.services.sberjazz_service import (
@@ -38,7 +39,7 @@ from interview_analytics_agent.services.sberjazz_service import (
     reconnect_sberjazz_meeting,
     reset_sberjazz_circuit_breaker,
 )
-from interview_analytics_agent.services.security_audit_service import list_security_audit_events
+from interview_analytics_agent.services.security_audit_service import list_security_audit_page
 from interview_analytics_agent.storage.blob import check_storage_health
 
 router = APIRouter()
@@ -58,6 +59,7 @@ class QueueHealthItem(BaseModel):
     depth: int
     pending: int
     dlq_depth: int
+    retry_backlog: int = 0
     error: str | None = None
 
 
@@ -129,6 +131,7 @@ class SecurityAuditEventResponse(BaseModel):
 
 class SecurityAuditListResponse(BaseModel):
     events: list[SecurityAuditEventResponse]
+    next_cursor: str | None = None
 
 
 class StorageHealthResponse(BaseModel):
@@ -250,6 +253,12 @@ def admin_queues_health() -> QueueHealthResponse:
             dlq_depth = 0
             err_parts.append(f"dlq:{str(e)[:160]}")
 
+        try:
+            backlog = retry_backlog(queue)
+        except Exception as e:
+            backlog = 0
+            err_parts.append(f"retry:{str(e)[:160]}")
+
         queues.append(
             QueueHealthItem(
                 queue=queue,
@@ -257,6 +266,7 @@ def admin_queues_health() -> QueueHealthResponse:
                 depth=depth,
                 pending=pending,
                 dlq_depth=dlq_depth,
+                retry_backlog=backlog,
                 error=(" | ".join(err_parts) if err_parts else None),
             )
         )
@@ -445,9 +455,12 @@ def admin_security_audit(
     limit: int = 100,
     outcome: str | None = None,
     subject: str | None = None,
+    cursor: str | None = None,
 ) -> SecurityAuditListResponse:
     try:
-        events = list_security_audit_events(limit=limit, outcome=outcome, subject=subject)
+        page = list_security_audit_page(
+            limit=limit, outcome=outcome, subject=subject, cursor=cursor
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -463,5 +476,6 @@ def admin_security_audit(
             },
         ) from e
     return SecurityAuditListResponse(
-        events=[SecurityAuditEventResponse(**event.__dict__) for event in events]
+        events=[SecurityAuditEventResponse(**event.__dict__) for event in page.items],
+        next_cursor=page.next_cursor,
     )
@@ -19,7 +19,11 @@ from interview_analytics_agent.processing.rubric_tuning import (
 )
 from interview_analytics_agent.services.report_artifacts import write_report_artifacts
 from interview_analytics_agent.storage import records
-from interview_analytics_agent.storage.db import db_session
+from interview_analytics_agent.storage.db import (
+    db_read_session,
+    db_session,
+    read_replicas_enabled,
+)
 from interview_analytics_agent.storage.repositories import MeetingRepository
 
 router = APIRouter()
@@ -70,9 +74,14 @@ class SeniorBriefResponse(BaseModel):
 
 
 def _meeting_exists(meeting_id: str) -> bool:
+    with db_read_session() as session:
+        if MeetingRepository(session).get(meeting_id) is not None:
+            return True
+    if not read_replicas_enabled():
+        return False
+    # реплика могла отстать
     with db_session() as session:
-        mrepo = MeetingRepository(session)
-        return mrepo.get(meeting_id) is not None
+        return MeetingRepository(session).get(meeting_id) is not None
 
 
 def _scorecard_for_meeting(meeting_id: str) -> dict[str, Any]:
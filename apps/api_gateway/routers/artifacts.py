@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
 from typing import Literal
 
@@ -8,6 +9,9 @@ from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field
 
 from apps.api_gateway.deps import auth_dep
+from apps.api_gateway.tenancy import tenant_list_filter
+from interview_analytics_agent.common.security import AuthContext
+from interview_analytics_agent.domain.enums import PipelineStatus
 from interview_analytics_agent.processing.aggregation import (
     build_enhanced_transcript,
     build_raw_transcript,
@@ -15,14 +19,18 @@ from interview_analytics_agent.processing.aggregation import (
 from interview_analytics_agent.processing.analytics import build_report
 from interview_analytics_agent.services.report_artifacts import write_report_artifacts
 from interview_analytics_agent.storage import records
+from interview_analytics_agent.storage.async_db import async_db_read_session
 from interview_analytics_agent.storage.db import db_session
+from interview_analytics_agent.storage.pagination import decode_cursor
 from interview_analytics_agent.storage.repositories import (
+    AsyncMeetingRepository,
     MeetingRepository,
     TranscriptSegmentRepository,
 )
 
 router = APIRouter()
 AUTH_DEP = Depends(auth_dep)
+STATUS_QUERY = Query(default=None, alias="status")
 
 
 class MeetingListItem(BaseModel):
@@ -35,6 +43,8 @@ class MeetingListItem(BaseModel):
 
 class MeetingListResponse(BaseModel):
     items: list[MeetingListItem]
+    # передать в ?cursor= за следующей страницей; None — страниц больше нет
+    next_cursor: str | None = None
 
 
 class MeetingArtifactsResponse(BaseModel):
@@ -93,26 +103,44 @@ def _rebuild_artifacts(meeting_id: str) -> dict[str, bool]:
 
 
 @router.get("/meetings", response_model=MeetingListResponse)
-def list_meetings(
+async def list_meetings(
     limit: int = Query(default=50, ge=1, le=200),
-    _=AUTH_DEP,
+    cursor: str | None = Query(default=None, max_length=512),
+    status_filter: PipelineStatus | None = STATUS_QUERY,
+    tenant_id: str | None = Query(default=None, max_length=128),
+    ctx: AuthContext = AUTH_DEP,
 ) -> MeetingListResponse:
-    with db_session() as session:
-        repo = MeetingRepository(session)
-        meetings = repo.list_recent(limit=limit)
-
-    items: list[MeetingListItem] = []
-    for meeting in meetings:
-        items.append(
-            MeetingListItem(
-                meeting_id=meeting.id,
-                status=str(meeting.status),
-                created_at=meeting.created_at,
-                finished_at=meeting.finished_at,
-                artifacts=records.list_artifacts(meeting.id),
-            )
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="invalid_cursor",
+        ) from e
+    tenant = tenant_list_filter(ctx, tenant_id)
+
+    async with async_db_read_session() as session:
+        repo = AsyncMeetingRepository(session)
+        page = await repo.list_page(
+            limit=limit, after=after, status=status_filter, tenant_id=tenant
+        )
+    meetings = page.items
+
+    # stat-ы артефактов по всем встречам — одним заходом в поток, не в event loop
+    artifacts = await asyncio.to_thread(
+        lambda: [records.list_artifacts(meeting.id) for meeting in meetings]
+    )
+    items = [
+        MeetingListItem(
+            meeting_id=meeting.id,
+            status=str(meeting.status),
+            created_at=meeting.created_at,
+            finished_at=meeting.finished_at,
+            artifacts=meeting_artifacts,
         )
-    return MeetingListResponse(items=items)
+        for meeting, meeting_artifacts in zip(meetings, artifacts, strict=True)
+    ]
+    return MeetingListResponse(items=items, next_cursor=page.next_cursor)
 
 
 @router.post("/meetings/{meeting_id}/artifacts/rebuild", response_model=MeetingArtifactsResponse)
@@ -6,6 +6,7 @@ MVP:
 - GET  /v1/meetings/{meeting_id}
 
 Авторизация: Depends(auth_dep)
+GET — async (storage.async_db): чтение не занимает поток threadpool.
 """
 
 from __future__ import annotations
@@ -26,8 +27,12 @@ from interview_analytics_agent.contracts.http_api import (
 from interview_analytics_agent.domain.enums import MeetingMode
 from interview_analytics_agent.services.meeting_service import create_meeting
 from interview_analytics_agent.services.sberjazz_service import join_sberjazz_meeting
-from interview_analytics_agent.storage.db import db_session
-from interview_analytics_agent.storage.repositories import MeetingRepository
+from interview_analytics_agent.storage.async_db import async_db_read_session, async_db_session
+from interview_analytics_agent.storage.db import db_session, read_replicas_enabled
+from interview_analytics_agent.storage.repositories import (
+    AsyncMeetingRepository,
+    MeetingRepository,
+)
 
 log = get_project_logger()
 
@@ -90,21 +95,28 @@ def start_meeting(
 
 
 @router.get("/meetings/{meeting_id}", response_model=MeetingGetResponse)
-def get_meeting(
+async def get_meeting(
     meeting_id: str,
     ctx: AuthContext = AUTH_DEP,
 ) -> MeetingGetResponse:
-    with db_session() as s:
-        repo = MeetingRepository(s)
-        m = repo.get(meeting_id)
-        if not m:
-            return MeetingGetResponse(meeting_id=meeting_id, status="not_found")
-        enforce_meeting_access(ctx, m.context)
-
-        return MeetingGetResponse(
-            meeting_id=m.id,
-            status=str(m.status),
-            raw_transcript=m.raw_transcript or "",
-            enhanced_transcript=m.enhanced_transcript or "",
-            report=m.report,
-        )
+    # реплика могла ещё не получить только что созданную встречу — тогда primary
+    scopes = (
+        (async_db_read_session, async_db_session)
+        if read_replicas_enabled()
+        else (async_db_read_session,)
+    )
+    for scope in scopes:
+        async with scope() as s:
+            m = await AsyncMeetingRepository(s).get(meeting_id)
+            if not m:
+                continue
+            enforce_meeting_access(ctx, m.context)
+
+            return MeetingGetResponse(
+                meeting_id=m.id,
+                status=str(m.status),
+                raw_transcript=m.raw_transcript or "",
+                enhanced_transcript=m.enhanced_transcript or "",
+                report=m.report,
+            )
+    return MeetingGetResponse(meeting_id=meeting_id, status="not_found")
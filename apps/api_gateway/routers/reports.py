@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -16,8 +17,10 @@ from interview_analytics_agent.services.report_artifacts import (
     write_report_artifacts,
 )
 from interview_analytics_agent.storage import records
-from interview_analytics_agent.storage.db import db_session
+from interview_analytics_agent.storage.async_db import async_db_read_session
+from interview_analytics_agent.storage.db import db_read_session, db_session
 from interview_analytics_agent.storage.repositories import (
+    AsyncMeetingRepository,
     MeetingRepository,
     TranscriptSegmentRepository,
 )
@@ -36,7 +39,24 @@ class ReportTextResponse(BaseModel):
     text: str
 
 
+def _stored_report(meeting_id: str) -> dict[str, Any] | None:
+    with db_read_session() as session:
+        meeting = MeetingRepository(session).get(meeting_id)
+        return dict(meeting.report) if meeting and meeting.report else None
+
+
+async def _stored_report_async(meeting_id: str) -> dict[str, Any] | None:
+    async with async_db_read_session() as session:
+        meeting = await AsyncMeetingRepository(session).get(meeting_id)
+        return dict(meeting.report) if meeting and meeting.report else None
+
+
 def _ensure_report(meeting_id: str) -> dict[str, Any]:
+    # готовый отчёт читаем с реплики; сборка (запись) — только на primary
+    stored = _stored_report(meeting_id)
+    if stored is not None:
+        return stored
+
     with db_session() as session:
         mrepo = MeetingRepository(session)
         srepo = TranscriptSegmentRepository(session)
@@ -81,17 +101,25 @@ def _ensure_report(meeting_id: str) -> dict[str, Any]:
     return report
 
 
+async def _ensure_report_async(meeting_id: str) -> dict[str, Any]:
+    # готовый отчёт — без потока; сборка (CPU + запись) — в пуле потоков
+    stored = await _stored_report_async(meeting_id)
+    if stored is not None:
+        return stored
+    return await asyncio.to_thread(_ensure_report, meeting_id)
+
+
 @router.get("/meetings/{meeting_id}/report", response_model=ReportResponse)
-def get_report(meeting_id: str, _=AUTH_DEP) -> ReportResponse:
-    report = _ensure_report(meeting_id)
+async def get_report(meeting_id: str, _=AUTH_DEP) -> ReportResponse:
+    report = await _ensure_report_async(meeting_id)
     return ReportResponse(meeting_id=meeting_id, report=report)
 
 
 @router.get("/meetings/{meeting_id}/report/text", response_model=ReportTextResponse)
-def get_report_text(meeting_id: str, _=AUTH_DEP) -> ReportTextResponse:
-    report = _ensure_report(meeting_id)
+async def get_report_text(meeting_id: str, _=AUTH_DEP) -> ReportTextResponse:
+    report = await _ensure_report_async(meeting_id)
     text = report_to_text(report)
-    records.write_text(meeting_id, "report.txt", text)
+    await asyncio.to_thread(records.write_text, meeting_id, "report.txt", text)
     return ReportTextResponse(meeting_id=meeting_id, text=text)
 
 
@@ -90,3 +90,25 @@ def enforce_meeting_access(ctx: AuthContext, meeting_context: dict | None) -> No
             status_code=status.HTTP_403_FORBIDDEN,
             detail={"code": ErrCode.FORBIDDEN, "message": "Tenant mismatch"},
         )
+
+
+def tenant_list_filter(ctx: AuthContext, requested: str | None) -> str | None:
+    """
+    Тенант для листингов: без enforcement — запрошенный (или все),
+    с enforcement — только свой.
+    """
+    if not tenant_enforcement_enabled():
+        return _normalize_tenant_id(requested or None)
+
+    tenant_id = resolve_tenant_id(ctx)
+    if not tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"code": ErrCode.FORBIDDEN, "message": "Tenant claim отсутствует"},
+        )
+    if requested and requested != tenant_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"code": ErrCode.FORBIDDEN, "message": "Tenant mismatch"},
+        )
+    return tenant_id
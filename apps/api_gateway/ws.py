@@ -4,21 +4,31 @@ WebSocket обработчик.
 Протокол (MVP):
 - клиент присылает JSON {"event_type":"audio.chunk", ...}
 - payload содержит base64 audio (content_b64), seq, meeting_id, sample_rate, channels, codec
+- либо, если при подключении согласован subprotocol interview-audio.v1.binary,
+  бинарные кадры: фиксированный заголовок + сырые байты аудио
+  (contracts/ws_binary.py); JSON-сообщения в этом режиме тоже принимаются
 - gateway сохраняет аудио в локальное хранилище и ставит задачу STT
 - воркеры публикуют transcript.update в Redis pubsub channel ws:<meeting_id>
-- gateway подписывается и ретранслирует клиенту
+- gateway ретранслирует клиенту через общий на процесс pub/sub hub (pubsub_hub.py)
 
 Важно:
-- в MVP не делаем сложный backpressure, только базовая дедупликация
+- event loop не блокируется ingest-ом: чтение сокета и ingest разнесены,
+  чанки соединения идут через ограниченную очередь (WS_INGEST_QUEUE_SIZE)
+  в отдельную задачу; ingest async (Redis asyncio, запись blob в пуле потоков)
+- flow control (services/flow_control.py): клиент, согласовавший subprotocol
+  interview-audio.v1.*, получает на каждый чанк ingest.ack с окном кредитов,
+  которое сужается при отставании STT; клиенты без subprotocol работают как раньше
 """
 
 from __future__ import annotations
 
 import asyncio
 import json
+from dataclasses import dataclass
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 
+from apps.api_gateway.pubsub_hub import get_pubsub_hub
 from apps.api_gateway.tenancy import enforce_meeting_access, tenant_enforcement_enabled
 from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.common.errors import ErrCode, UnauthorizedError
@@ -30,9 +40,18 @@ from interview_analytics_agent.common.security import (
     require_auth,
 )
 from interview_analytics_agent.common.tracing import start_trace
-from interview_analytics_agent.common.utils import b64_decode, safe_dict
-from interview_analytics_agent.queue.redis import redis_client
-from interview_analytics_agent.services.chunk_ingest_service import ingest_audio_chunk_bytes
+from interview_analytics_agent.common.utils import b64_decode
+from interview_analytics_agent.contracts.versions import WS_SCHEMA_VERSION
+from interview_analytics_agent.contracts.ws_binary import (
+    WS_SUBPROTOCOL_BINARY,
+    BinaryFrameError,
+    decode_audio_frame,
+    negotiate_subprotocol,
+)
+from interview_analytics_agent.services.chunk_ingest_service import (
+    ingest_audio_chunk_bytes_async,
+)
+from interview_analytics_agent.services.flow_control import forget_meeting, ingest_credits_async
 from interview_analytics_agent.storage.db import db_session
 from interview_analytics_agent.storage.repositories import MeetingRepository
 
@@ -40,6 +59,9 @@ log = get_project_logger()
 
 ws_router = APIRouter()
 
+# сколько ждать дообработки принятых чанков после отключения клиента
+_INGEST_DRAIN_TIMEOUT_SEC = 10.0
+
 
 def _is_service_ctx(ctx: AuthContext) -> bool:
     return ctx.auth_type == "service_api_key" or (
@@ -98,38 +120,23 @@ def _audit_ws_deny(
 
 async def _forward_pubsub_to_ws(ws: WebSocket, meeting_id: str) -> None:
     """
-    Фоновая задача: читает pubsub канал ws:<meeting_id> и шлёт сообщения в websocket.
-    Реализация через asyncio.to_thread, потому что redis_client() синхронный.
+    Фоновая задача: получает сообщения канала ws:<meeting_id> из общего
+    pub/sub hub процесса (apps/api_gateway/pubsub_hub.py) и шлёт их в websocket.
     """
     channel = f"ws:{meeting_id}"
-    r = redis_client()
-    pubsub = r.pubsub()
-    pubsub.subscribe(channel)
+    hub = get_pubsub_hub()
+    queue = await hub.subscribe(channel)
 
     try:
         while True:
-            msg = await asyncio.to_thread(pubsub.get_message, True, 1.0)
-            if not msg:
-                await asyncio.sleep(0.01)
-                continue
-            if msg.get("type") != "message":
-                continue
-
-            data = msg.get("data")
-            if not data:
-                continue
-
+            data = await queue.get()
             # data ожидаем как JSON-строку
             try:
                 await ws.send_text(data)
             except Exception:
                 break
     finally:
-        try:
-            pubsub.unsubscribe(channel)
-            pubsub.close()
-        except Exception:
-            pass
+        await hub.unsubscribe(channel, queue)
 
 
 async def _authorize_ws(ws: WebSocket, *, service_only: bool) -> AuthContext | None:
@@ -199,56 +206,196 @@ async def _authorize_ws(ws: WebSocket, *, service_only: bool) -> AuthContext | N
     return ctx
 
 
+async def _send_error(ws: WebSocket, code: str, message: str) -> None:
+    await ws.send_text(json.dumps({"event_type": "error", "code": code, "message": message}))
+
+
+@dataclass
+class _IncomingChunk:
+    meeting_id: str
+    seq: int
+    audio_bytes: bytes
+    idempotency_key: str | None = None
+    trace_id: str | None = None
+
+
+async def _parse_incoming(
+    ws: WebSocket, message: dict, *, binary_mode: bool
+) -> _IncomingChunk | None:
+    """
+    Разобрать входящее сообщение (JSON audio.chunk или бинарный кадр).
+    None — сообщение отклонено, клиенту уже отправлен error.
+    """
+    data = message.get("bytes")
+    if data is not None:
+        if not binary_mode:
+            await _send_error(
+                ws,
+                "binary_not_negotiated",
+                f"Бинарные кадры требуют subprotocol {WS_SUBPROTOCOL_BINARY}",
+            )
+            return None
+        try:
+            frame = decode_audio_frame(data)
+        except BinaryFrameError as e:
+            await _send_error(ws, "bad_frame", str(e))
+            return None
+        if not frame.meeting_id:
+            await _send_error(ws, "no_meeting_id", "meeting_id обязателен")
+            return None
+        return _IncomingChunk(
+            meeting_id=frame.meeting_id,
+            seq=frame.seq,
+            audio_bytes=frame.audio,
+            idempotency_key=frame.idempotency_key,
+        )
+
+    try:
+        event = json.loads(message.get("text") or "")
+    except Exception:
+        await _send_error(ws, "bad_json", "Невалидный JSON")
+        return None
+
+    if event.get("event_type") != "audio.chunk":
+        await _send_error(ws, "bad_event", "Неизвестный event_type")
+        return None
+
+    meeting_id = event.get("meeting_id")
+    if not meeting_id:
+        await _send_error(ws, "no_meeting_id", "meeting_id обязателен")
+        return None
+
+    try:
+        audio_bytes = b64_decode(event.get("content_b64", ""))
+    except Exception:
+        await _send_error(ws, "bad_audio", "content_b64 не декодируется")
+        return None
+
+    return _IncomingChunk(
+        meeting_id=meeting_id,
+        seq=int(event.get("seq", 0)),
+        audio_bytes=audio_bytes,
+        idempotency_key=event.get("idempotency_key"),
+        trace_id=event.get("trace_id"),
+    )
+
+
+async def _send_ack(ws: WebSocket, chunk: _IncomingChunk, *, duplicate: bool) -> None:
+    credits = await ingest_credits_async(chunk.meeting_id, source="ws")
+    await ws.send_text(
+        json.dumps(
+            {
+                "schema_version": WS_SCHEMA_VERSION,
+                "event_type": "ingest.ack",
+                "meeting_id": chunk.meeting_id,
+                "seq": chunk.seq,
+                "duplicate": duplicate,
+                "credits": credits.credits,
+                "throttled": credits.throttled,
+                "retry_after_ms": credits.retry_after_ms,
+            }
+        )
+    )
+
+
+async def _ingest_one(
+    ws: WebSocket, chunk: _IncomingChunk, *, inline_mode: bool, flow_control: bool
+) -> None:
+    try:
+        with start_trace(
+            trace_id=chunk.trace_id,
+            meeting_id=chunk.meeting_id,
+            source="ws.ingest",
+        ):
+            result = await ingest_audio_chunk_bytes_async(
+                meeting_id=chunk.meeting_id,
+                seq=chunk.seq,
+                audio_bytes=chunk.audio_bytes,
+                idempotency_key=chunk.idempotency_key,
+                idempotency_scope="audio_chunk_ws",
+                idempotency_prefix="ws",
+            )
+    except Exception as e:
+        log.error(
+            "ws_ingest_failed",
+            extra={"payload": {"meeting_id": chunk.meeting_id, "err": str(e)[:200]}},
+        )
+        await _send_error(ws, "storage_error", "Ошибка записи чанка")
+        return
+
+    if flow_control:
+        await _send_ack(ws, chunk, duplicate=result.is_duplicate)
+
+    if result.is_duplicate:
+        return
+
+    if inline_mode:
+        for payload in list(getattr(result, "inline_updates", None) or []):
+            await ws.send_text(json.dumps(payload, ensure_ascii=False))
+
+
+async def _ingest_worker(
+    ws: WebSocket, queue: asyncio.Queue, *, inline_mode: bool, flow_control: bool
+) -> None:
+    """
+    Ingest чанков одного соединения по порядку, отдельно от чтения сокета.
+    None в очереди — соединение закрыто, дообработать остаток и выйти.
+    """
+    while True:
+        chunk = await queue.get()
+        if chunk is None:
+            return
+        try:
+            await _ingest_one(ws, chunk, inline_mode=inline_mode, flow_control=flow_control)
+        except Exception as e:
+            # клиент мог уже отключиться — ответ не доставить, но чанк принят
+            log.warning(
+                "ws_ingest_reply_failed",
+                extra={"payload": {"meeting_id": chunk.meeting_id, "err": str(e)[:200]}},
+            )
+
+
+async def _stop_ingest_worker(queue: asyncio.Queue, task: asyncio.Task) -> None:
+    try:
+        await asyncio.wait_for(queue.put(None), timeout=_INGEST_DRAIN_TIMEOUT_SEC)
+        await asyncio.wait_for(task, timeout=_INGEST_DRAIN_TIMEOUT_SEC)
+    except (TimeoutError, asyncio.CancelledError):
+        task.cancel()
+    except Exception as e:
+        log.warning("ws_ingest_worker_failed", extra={"payload": {"err": str(e)[:200]}})
+
+
 async def _websocket_endpoint_impl(ws: WebSocket, *, service_only: bool) -> None:
     ctx = await _authorize_ws(ws, service_only=service_only)
     if ctx is None:
         return
 
     inline_mode = (get_settings().queue_mode or "").strip().lower() == "inline"
-    await ws.accept()
+    subprotocol = negotiate_subprotocol(ws.scope.get("subprotocols"))
+    binary_mode = subprotocol == WS_SUBPROTOCOL_BINARY
+    # ingest.ack с кредитами шлём только клиентам, согласовавшим протокол
+    flow_control = subprotocol is not None
+    await ws.accept(subprotocol=subprotocol)
 
     meeting_id: str | None = None
     meeting_checked = False
     forward_task: asyncio.Task | None = None
+    chunk: _IncomingChunk | None = None
+    ingest_queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, get_settings().ws_ingest_queue_size))
+    ingest_task = asyncio.create_task(
+        _ingest_worker(ws, ingest_queue, inline_mode=inline_mode, flow_control=flow_control)
+    )
 
     try:
         while True:
-            raw = await ws.receive_text()
-            try:
-                event = json.loads(raw)
-            except Exception:
-                await ws.send_text(
-                    json.dumps(
-                        {"event_type": "error", "code": "bad_json", "message": "Невалидный JSON"}
-                    )
-                )
-                continue
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", status.WS_1000_NORMAL_CLOSURE))
 
-            et = event.get("event_type")
-            if et != "audio.chunk":
-                await ws.send_text(
-                    json.dumps(
-                        {
-                            "event_type": "error",
-                            "code": "bad_event",
-                            "message": "Неизвестный event_type",
-                        }
-                    )
-                )
-                continue
-
-            meeting_id = event.get("meeting_id")
-            if not meeting_id:
-                await ws.send_text(
-                    json.dumps(
-                        {
-                            "event_type": "error",
-                            "code": "no_meeting_id",
-                            "message": "meeting_id обязателен",
-                        }
-                    )
-                )
+            chunk = await _parse_incoming(ws, message, binary_mode=binary_mode)
+            if chunk is None:
                 continue
+            meeting_id = chunk.meeting_id
 
             if not meeting_checked and tenant_enforcement_enabled() and not service_only:
                 def _check_meeting(target_meeting_id: str = meeting_id) -> tuple[bool, str | None]:
@@ -268,15 +415,7 @@ async def _websocket_endpoint_impl(ws: WebSocket, *, service_only: bool) -> None
 
                 ok, err = await asyncio.to_thread(_check_meeting)
                 if not ok:
-                    await ws.send_text(
-                        json.dumps(
-                            {
-                                "event_type": "error",
-                                "code": "forbidden",
-                                "message": err or "Доступ запрещён",
-                            }
-                        )
-                    )
+                    await _send_error(ws, "forbidden", err or "Доступ запрещён")
                     await ws.close(
                         code=status.WS_1008_POLICY_VIOLATION,
                         reason=err or "forbidden",
@@ -289,60 +428,8 @@ async def _websocket_endpoint_impl(ws: WebSocket, *, service_only: bool) -> None
             if forward_task is None and not inline_mode:
                 forward_task = asyncio.create_task(_forward_pubsub_to_ws(ws, meeting_id))
 
-            seq = int(event.get("seq", 0))
-            content_b64 = event.get("content_b64", "")
-            idem_key = event.get("idempotency_key")
-
-            try:
-                audio_bytes = b64_decode(content_b64)
-            except Exception:
-                await ws.send_text(
-                    json.dumps(
-                        {
-                            "event_type": "error",
-                            "code": "bad_audio",
-                            "message": "content_b64 не декодируется",
-                        }
-                    )
-                )
-                continue
-
-            try:
-                with start_trace(
-                    trace_id=event.get("trace_id"),
-                    meeting_id=meeting_id,
-                    source="ws.ingest",
-                ):
-                    result = ingest_audio_chunk_bytes(
-                        meeting_id=meeting_id,
-                        seq=seq,
-                        audio_bytes=audio_bytes,
-                        idempotency_key=idem_key,
-                        idempotency_scope="audio_chunk_ws",
-                        idempotency_prefix="ws",
-                    )
-            except Exception as e:
-                log.error(
-                    "ws_ingest_failed",
-                    extra={"payload": {"meeting_id": meeting_id, "err": str(e)[:200]}},
-                )
-                await ws.send_text(
-                    json.dumps(
-                        {
-                            "event_type": "error",
-                            "code": "storage_error",
-                            "message": "Ошибка записи чанка",
-                        }
-                    )
-                )
-                continue
-
-            if result.is_duplicate:
-                continue
-
-            if inline_mode:
-                for payload in list(getattr(result, "inline_updates", None) or []):
-                    await ws.send_text(json.dumps(payload, ensure_ascii=False))
+            # ждём только если очередь соединения заполнена: backpressure на этот сокет
+            await ingest_queue.put(chunk)
 
     except WebSocketDisconnect:
         pass
@@ -352,13 +439,18 @@ async def _websocket_endpoint_impl(ws: WebSocket, *, service_only: bool) -> None
             extra={
                 "payload": {
                     "err": str(e)[:200],
-                    "event": safe_dict(event) if 'event' in locals() else None,
+                    "meeting_id": meeting_id,
+                    "seq": chunk.seq if chunk else None,
+                    "binary_mode": binary_mode,
                 }
             },
         )
     finally:
+        await _stop_ingest_worker(ingest_queue, ingest_task)
         if forward_task:
             forward_task.cancel()
+        if meeting_id:
+            forget_meeting(meeting_id)
 
 
 @ws_router.websocket("/ws")
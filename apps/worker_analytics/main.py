@@ -5,6 +5,7 @@ Worker Analytics.
 - читаем из Redis Stream q:analytics (consumer group)
 - читаем сегменты встречи
 - собираем enhanced_transcript
+- scorecard досчитывается только по изменённым сегментам (services.scorecard_state)
 - строим report через processing.analytics (LLM orchestrator)
 - сохраняем в Meeting.enhanced_transcript и Meeting.report
 - ставим задачу delivery
@@ -13,8 +14,8 @@ Worker Analytics.
 from __future__ import annotations
 
 import time
-from contextlib import suppress
 
+from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.common.logging import get_project_logger, setup_logging
 from interview_analytics_agent.common.metrics import QUEUE_TASKS_TOTAL, track_stage_latency
 from interview_analytics_agent.common.otel import maybe_setup_otel
@@ -25,11 +26,24 @@ from interview_analytics_agent.processing.aggregation import (
     build_raw_transcript,
 )
 from interview_analytics_agent.processing.analytics import build_report
+from interview_analytics_agent.queue.coalesce import clear_coalesced
 from interview_analytics_agent.queue.dispatcher import Q_ANALYTICS, enqueue_delivery
 from interview_analytics_agent.queue.retry import requeue_with_backoff
-from interview_analytics_agent.queue.streams import ack_task, consumer_name, read_task
+from interview_analytics_agent.queue.runtime import (
+    WorkerRuntime,
+    install_signal_handlers,
+    shutdown_requested,
+)
+from interview_analytics_agent.queue.streams import StreamTask, consumer_name
 from interview_analytics_agent.services.readiness_service import enforce_startup_readiness
 from interview_analytics_agent.services.report_artifacts import write_report_artifacts
+from interview_analytics_agent.services.scorecard_state import (
+    changed_scorecard_segments,
+    clear_scorecard_dirty,
+    load_scorecard_accumulator,
+    load_scorecard_dirty,
+    save_scorecard_accumulator,
+)
 from interview_analytics_agent.storage.db import db_session
 from interview_analytics_agent.storage.repositories import (
     MeetingRepository,
@@ -40,103 +54,125 @@ log = get_project_logger()
 GROUP_ANALYTICS = "g:analytics"
 
 
-def run_loop() -> None:
-    consumer = consumer_name("worker-analytics")
-    log.info("worker_analytics_started", extra={"payload": {"queue": Q_ANALYTICS}})
+def _handle_task(msg: StreamTask) -> bool:
+    """
+    Обработать одну задачу. True — задачу можно ACK-нуть.
+    """
+    should_ack = False
+    try:
+        task = msg.payload
+        meeting_id = task["meeting_id"]
+        with (
+            start_trace_from_payload(task, meeting_id=meeting_id, source="worker.analytics"),
+            track_stage_latency("worker-analytics", "analytics"),
+        ):
+            # снимаем маркер до чтения сегментов: новые чанки запланируют следующий запуск
+            clear_coalesced(queue=Q_ANALYTICS, meeting_id=meeting_id)
+            scorecard_acc = load_scorecard_accumulator(meeting_id)
+            scorecard_dirty = load_scorecard_dirty(meeting_id)
+            with db_session() as session:
+                mrepo = MeetingRepository(session)
+                srepo = TranscriptSegmentRepository(session)
+
+                m = mrepo.get(meeting_id)
+                ctx = (m.context if m else {}) or {}
+
+                segs = srepo.list_by_meeting(meeting_id)
+                raw = build_raw_transcript(segs)
+                enhanced = build_enhanced_transcript(segs)
+                # в scorecard — только изменённые сегменты, не вся встреча
+                changed = changed_scorecard_segments(
+                    srepo, meeting_id, scorecard_acc, scorecard_dirty, all_segments=segs
+                )
+                seg_payload = [
+                    {
+                        "seq": seg.seq,
+                        "speaker": seg.speaker,
+                        "start_ms": seg.start_ms,
+                        "end_ms": seg.end_ms,
+                        "raw_text": seg.raw_text,
+                        "enhanced_text": seg.enhanced_text,
+                    }
+                    for seg in changed
+                ]
+
+                report = build_report(
+                    enhanced_transcript=enhanced,
+                    meeting_context=ctx,
+                    transcript_segments=seg_payload,
+                    scorecard_accumulator=scorecard_acc,
+                )
 
-    while True:
-        msg = read_task(stream=Q_ANALYTICS, group=GROUP_ANALYTICS, consumer=consumer, block_ms=5000)
-        if not msg:
-            continue
+                if m:
+                    m.raw_transcript = raw
+                    m.enhanced_transcript = enhanced
+                    m.report = report
+                    m.status = PipelineStatus.processing
+                    mrepo.save(m)
+
+            # dirty снимаем только под сохранённый снапшот, иначе изменения потеряются
+            if save_scorecard_accumulator(meeting_id, scorecard_acc):
+                clear_scorecard_dirty(meeting_id, scorecard_dirty)
+            write_report_artifacts(
+                meeting_id=meeting_id,
+                raw_text=raw,
+                clean_text=enhanced,
+                report=report,
+            )
 
-        should_ack = False
+            enqueue_delivery(meeting_id=meeting_id)
+        should_ack = True
+        QUEUE_TASKS_TOTAL.labels(
+            service="worker-analytics", queue=Q_ANALYTICS, result="success"
+        ).inc()
+
+    except Exception as e:
+        log.error(
+            "worker_analytics_error",
+            extra={"payload": {"err": str(e)[:200], "task": task if "task" in locals() else None}},
+        )
+        QUEUE_TASKS_TOTAL.labels(
+            service="worker-analytics", queue=Q_ANALYTICS, result="error"
+        ).inc()
         try:
-            task = msg.payload
-            meeting_id = task["meeting_id"]
-            with (
-                start_trace_from_payload(task, meeting_id=meeting_id, source="worker.analytics"),
-                track_stage_latency("worker-analytics", "analytics"),
-            ):
-                with db_session() as session:
-                    mrepo = MeetingRepository(session)
-                    srepo = TranscriptSegmentRepository(session)
-
-                    m = mrepo.get(meeting_id)
-                    ctx = (m.context if m else {}) or {}
-
-                    segs = srepo.list_by_meeting(meeting_id)
-                    raw = build_raw_transcript(segs)
-                    enhanced = build_enhanced_transcript(segs)
-                    seg_payload = [
-                        {
-                            "seq": seg.seq,
-                            "speaker": seg.speaker,
-                            "start_ms": seg.start_ms,
-                            "end_ms": seg.end_ms,
-                            "raw_text": seg.raw_text,
-                            "enhanced_text": seg.enhanced_text,
-                        }
-                        for seg in segs
-                    ]
-
-                    report = build_report(
-                        enhanced_transcript=enhanced,
-                        meeting_context=ctx,
-                        transcript_segments=seg_payload,
-                    )
-
-                    if m:
-                        m.raw_transcript = raw
-                        m.enhanced_transcript = enhanced
-                        m.report = report
-                        m.status = PipelineStatus.processing
-                        mrepo.save(m)
-
-                write_report_artifacts(
-                    meeting_id=meeting_id,
-                    raw_text=raw,
-                    clean_text=enhanced,
-                    report=report,
-                )
-
-                enqueue_delivery(meeting_id=meeting_id)
+            task = task if "task" in locals() else {}
+            requeue_with_backoff(
+                queue_name=Q_ANALYTICS, task_payload=task, max_attempts=3, backoff_sec=2
+            )
             should_ack = True
             QUEUE_TASKS_TOTAL.labels(
-                service="worker-analytics", queue=Q_ANALYTICS, result="success"
+                service="worker-analytics", queue=Q_ANALYTICS, result="retry"
             ).inc()
+        except Exception:
+            pass
+    return should_ack
 
-        except Exception as e:
-            log.error(
-                "worker_analytics_error",
-                extra={
-                    "payload": {"err": str(e)[:200], "task": task if "task" in locals() else None}
-                },
-            )
-            QUEUE_TASKS_TOTAL.labels(
-                service="worker-analytics", queue=Q_ANALYTICS, result="error"
-            ).inc()
-            try:
-                task = task if "task" in locals() else {}
-                requeue_with_backoff(
-                    queue_name=Q_ANALYTICS, task_payload=task, max_attempts=3, backoff_sec=2
-                )
-                should_ack = True
-                QUEUE_TASKS_TOTAL.labels(
-                    service="worker-analytics", queue=Q_ANALYTICS, result="retry"
-                ).inc()
-            except Exception:
-                pass
-        finally:
-            if should_ack:
-                with suppress(Exception):
-                    ack_task(stream=Q_ANALYTICS, group=GROUP_ANALYTICS, entry_id=msg.entry_id)
+
+def run_loop() -> None:
+    s = get_settings()
+    consumer = consumer_name("worker-analytics")
+    log.info("worker_analytics_started", extra={"payload": {"queue": Q_ANALYTICS}})
+
+    WorkerRuntime(
+        service="worker-analytics",
+        stream=Q_ANALYTICS,
+        group=GROUP_ANALYTICS,
+        consumer=consumer,
+        handler=_handle_task,
+        concurrency=s.worker_concurrency,
+        batch_size=s.queue_read_batch_size,
+        block_ms=5000,
+        shutdown_grace_sec=s.worker_shutdown_grace_sec,
+        retry_poll_interval_sec=s.queue_retry_poll_interval_sec,
+    ).run()
 
 
 def main() -> None:
     setup_logging()
     maybe_setup_otel()
     enforce_startup_readiness(service_name="worker-analytics")
-    while True:
+    install_signal_handlers()
+    while not shutdown_requested():
         try:
             run_loop()
         except Exception as e:
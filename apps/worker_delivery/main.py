@@ -12,7 +12,7 @@ Worker Delivery.
 from __future__ import annotations
 
 import time
-from contextlib import suppress
+from functools import partial
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -26,7 +26,12 @@ from interview_analytics_agent.delivery.email.sender import SMTPEmailProvider
 from interview_analytics_agent.domain.enums import PipelineStatus
 from interview_analytics_agent.queue.dispatcher import Q_DELIVERY, enqueue_retention
 from interview_analytics_agent.queue.retry import requeue_with_backoff
-from interview_analytics_agent.queue.streams import ack_task, consumer_name, read_task
+from interview_analytics_agent.queue.runtime import (
+    WorkerRuntime,
+    install_signal_handlers,
+    shutdown_requested,
+)
+from interview_analytics_agent.queue.streams import StreamTask, consumer_name
 from interview_analytics_agent.services.readiness_service import enforce_startup_readiness
 from interview_analytics_agent.storage.db import db_session
 from interview_analytics_agent.storage.repositories import MeetingRepository
@@ -59,135 +64,142 @@ def _jinja() -> Environment:
     )
 
 
-def run_loop() -> None:
-    settings = get_settings()
-    consumer = consumer_name("worker-delivery")
-    env = _jinja()
-    smtp = SMTPEmailProvider()
-
-    log.info("worker_delivery_started", extra={"payload": {"queue": Q_DELIVERY}})
-
-    while True:
-        msg = read_task(stream=Q_DELIVERY, group=GROUP_DELIVERY, consumer=consumer, block_ms=5000)
-        if not msg:
-            continue
+def _handle_task(msg: StreamTask, *, settings, env: Environment, smtp: SMTPEmailProvider) -> bool:
+    """
+    Обработать одну задачу. True — задачу можно ACK-нуть.
+    """
+    should_ack = False
+    try:
+        task = msg.payload
+        meeting_id = task["meeting_id"]
+        with (
+            start_trace_from_payload(task, meeting_id=meeting_id, source="worker.delivery"),
+            track_stage_latency("worker-delivery", "delivery"),
+        ):
+            with db_session() as session:
+                mrepo = MeetingRepository(session)
+                m = mrepo.get(meeting_id)
+
+                report = (m.report if m else None) or {
+                    "summary": "",
+                    "bullets": [],
+                    "risk_flags": [],
+                    "recommendation": "",
+                }
+                raw_transcript = (m.raw_transcript if m else None) or ""
+                enhanced_transcript = (m.enhanced_transcript if m else None) or ""
+                recipients = []
+                if m and isinstance(m.context, dict):
+                    # Если ты захочешь — потом положим recipients в context при /meetings/start
+                    recipients = m.context.get("recipients", []) or []
+
+                html = env.get_template("report.html.j2").render(
+                    meeting_id=meeting_id,
+                    report=report,
+                    has_raw=bool(raw_transcript.strip()),
+                    has_enhanced=bool(enhanced_transcript.strip()),
+                )
+                txt = env.get_template("report.txt.j2").render(
+                    meeting_id=meeting_id,
+                    report=report,
+                    has_raw=bool(raw_transcript.strip()),
+                    has_enhanced=bool(enhanced_transcript.strip()),
+                )
+                attachments = _build_transcript_attachments(
+                    raw_text=raw_transcript, enhanced_text=enhanced_transcript
+                )
 
-        should_ack = False
-        try:
-            task = msg.payload
-            meeting_id = task["meeting_id"]
-            with (
-                start_trace_from_payload(task, meeting_id=meeting_id, source="worker.delivery"),
-                track_stage_latency("worker-delivery", "delivery"),
-            ):
-                with db_session() as session:
-                    mrepo = MeetingRepository(session)
-                    m = mrepo.get(meeting_id)
-
-                    report = (m.report if m else None) or {
-                        "summary": "",
-                        "bullets": [],
-                        "risk_flags": [],
-                        "recommendation": "",
-                    }
-                    raw_transcript = (m.raw_transcript if m else None) or ""
-                    enhanced_transcript = (m.enhanced_transcript if m else None) or ""
-                    recipients = []
-                    if m and isinstance(m.context, dict):
-                        # Если ты захочешь — потом положим recipients в context при /meetings/start
-                        recipients = m.context.get("recipients", []) or []
-
-                    html = env.get_template("report.html.j2").render(
-                        meeting_id=meeting_id,
-                        report=report,
-                        has_raw=bool(raw_transcript.strip()),
-                        has_enhanced=bool(enhanced_transcript.strip()),
+                if settings.delivery_manual_mode_only:
+                    log.warning(
+                        "delivery_manual_mode_skip_auto",
+                        extra={"payload": {"meeting_id": meeting_id}},
                     )
-                    txt = env.get_template("report.txt.j2").render(
+                elif settings.delivery_provider == "email" and recipients:
+                    smtp.send_report(
                         meeting_id=meeting_id,
-                        report=report,
-                        has_raw=bool(raw_transcript.strip()),
-                        has_enhanced=bool(enhanced_transcript.strip()),
+                        recipients=recipients,
+                        subject=f"Отчёт по встрече {meeting_id}",
+                        html_body=html,
+                        text_body=txt,
+                        attachments=attachments,
                     )
-                    attachments = _build_transcript_attachments(
-                        raw_text=raw_transcript, enhanced_text=enhanced_transcript
+                    log.info(
+                        "delivery_done",
+                        extra={"payload": {"meeting_id": meeting_id, "recipients": recipients}},
                     )
-
-                    if settings.delivery_manual_mode_only:
-                        log.warning(
-                            "delivery_manual_mode_skip_auto",
-                            extra={"payload": {"meeting_id": meeting_id}},
-                        )
-                    elif settings.delivery_provider == "email" and recipients:
-                        smtp.send_report(
-                            meeting_id=meeting_id,
-                            recipients=recipients,
-                            subject=f"Отчёт по встрече {meeting_id}",
-                            html_body=html,
-                            text_body=txt,
-                            attachments=attachments,
-                        )
-                        log.info(
-                            "delivery_done",
-                            extra={"payload": {"meeting_id": meeting_id, "recipients": recipients}},
-                        )
-                    else:
-                        # В MVP, если нет получателей — считаем доставку пропущенной
-                        log.warning(
-                            "delivery_skipped",
-                            extra={
-                                "payload": {
-                                    "meeting_id": meeting_id,
-                                    "provider": settings.delivery_provider,
-                                    "recipients": recipients,
-                                },
+                else:
+                    # В MVP, если нет получателей — считаем доставку пропущенной
+                    log.warning(
+                        "delivery_skipped",
+                        extra={
+                            "payload": {
+                                "meeting_id": meeting_id,
+                                "provider": settings.delivery_provider,
+                                "recipients": recipients,
                             },
-                        )
+                        },
+                    )
 
-                    if m:
-                        m.status = PipelineStatus.done
-                        mrepo.save(m)
+                if m:
+                    m.status = PipelineStatus.done
+                    mrepo.save(m)
 
-                enqueue_retention(
-                    entity_type="meeting", entity_id=meeting_id, reason="delivered_or_skipped"
-                )
+            enqueue_retention(
+                entity_type="meeting", entity_id=meeting_id, reason="delivered_or_skipped"
+            )
+        should_ack = True
+        QUEUE_TASKS_TOTAL.labels(
+            service="worker-delivery", queue=Q_DELIVERY, result="success"
+        ).inc()
+
+    except Exception as e:
+        log.error(
+            "worker_delivery_error",
+            extra={"payload": {"err": str(e)[:200], "task": task if "task" in locals() else None}},
+        )
+        QUEUE_TASKS_TOTAL.labels(service="worker-delivery", queue=Q_DELIVERY, result="error").inc()
+        try:
+            task = task if "task" in locals() else {}
+            requeue_with_backoff(
+                queue_name=Q_DELIVERY, task_payload=task, max_attempts=3, backoff_sec=2
+            )
             should_ack = True
             QUEUE_TASKS_TOTAL.labels(
-                service="worker-delivery", queue=Q_DELIVERY, result="success"
+                service="worker-delivery", queue=Q_DELIVERY, result="retry"
             ).inc()
+        except Exception:
+            pass
+    return should_ack
 
-        except Exception as e:
-            log.error(
-                "worker_delivery_error",
-                extra={
-                    "payload": {"err": str(e)[:200], "task": task if "task" in locals() else None}
-                },
-            )
-            QUEUE_TASKS_TOTAL.labels(
-                service="worker-delivery", queue=Q_DELIVERY, result="error"
-            ).inc()
-            try:
-                task = task if "task" in locals() else {}
-                requeue_with_backoff(
-                    queue_name=Q_DELIVERY, task_payload=task, max_attempts=3, backoff_sec=2
-                )
-                should_ack = True
-                QUEUE_TASKS_TOTAL.labels(
-                    service="worker-delivery", queue=Q_DELIVERY, result="retry"
-                ).inc()
-            except Exception:
-                pass
-        finally:
-            if should_ack:
-                with suppress(Exception):
-                    ack_task(stream=Q_DELIVERY, group=GROUP_DELIVERY, entry_id=msg.entry_id)
+
+def run_loop() -> None:
+    settings = get_settings()
+    consumer = consumer_name("worker-delivery")
+    env = _jinja()
+    smtp = SMTPEmailProvider()
+
+    log.info("worker_delivery_started", extra={"payload": {"queue": Q_DELIVERY}})
+
+    WorkerRuntime(
+        service="worker-delivery",
+        stream=Q_DELIVERY,
+        group=GROUP_DELIVERY,
+        consumer=consumer,
+        handler=partial(_handle_task, settings=settings, env=env, smtp=smtp),
+        concurrency=settings.worker_concurrency,
+        batch_size=settings.queue_read_batch_size,
+        block_ms=5000,
+        shutdown_grace_sec=settings.worker_shutdown_grace_sec,
+        retry_poll_interval_sec=settings.queue_retry_poll_interval_sec,
+    ).run()
 
 
 def main() -> None:
     setup_logging()
     maybe_setup_otel()
     enforce_startup_readiness(service_name="worker-delivery")
-    while True:
+    install_signal_handlers()
+    while not shutdown_requested():
         try:
             run_loop()
         except Exception as e:
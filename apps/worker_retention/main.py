@@ -3,100 +3,112 @@ Worker Retention.
 
 Алгоритм (MVP):
 - читаем из Redis Stream q:retention (consumer group)
-- запускает apply_retention по БД (очистка текстов по cutoff)
-- (позже) удаление объектов из локальное хранилище
+- запускает apply_retention: батчи по cutoff с checkpoint-ами
+  (очистка текстов, удаление chunk blob-ов и каталогов records)
 """
 
 from __future__ import annotations
 
 import time
-from contextlib import suppress
 
+from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.common.logging import get_project_logger, setup_logging
 from interview_analytics_agent.common.metrics import QUEUE_TASKS_TOTAL, track_stage_latency
 from interview_analytics_agent.common.otel import maybe_setup_otel
 from interview_analytics_agent.common.tracing import start_trace_from_payload
 from interview_analytics_agent.queue.dispatcher import Q_RETENTION
 from interview_analytics_agent.queue.retry import requeue_with_backoff
-from interview_analytics_agent.queue.streams import ack_task, consumer_name, read_task
+from interview_analytics_agent.queue.runtime import (
+    WorkerRuntime,
+    install_signal_handlers,
+    shutdown_requested,
+)
+from interview_analytics_agent.queue.streams import StreamTask, consumer_name
 from interview_analytics_agent.services.readiness_service import enforce_startup_readiness
-from interview_analytics_agent.storage.db import db_session
 from interview_analytics_agent.storage.retention import apply_retention
 
 log = get_project_logger()
 GROUP_RETENTION = "g:retention"
 
 
-def run_loop() -> None:
-    consumer = consumer_name("worker-retention")
-    log.info("worker_retention_started", extra={"payload": {"queue": Q_RETENTION}})
+def _handle_task(msg: StreamTask) -> bool:
+    """
+    Обработать одну задачу. True — задачу можно ACK-нуть.
+    """
+    should_ack = False
+    try:
+        task = msg.payload
+        meeting_id = str(task.get("entity_id") or "").strip() or None
+        with (
+            start_trace_from_payload(task, meeting_id=meeting_id, source="worker.retention"),
+            track_stage_latency("worker-retention", "retention"),
+        ):
+            result = apply_retention()
 
-    while True:
-        msg = read_task(
-            stream=Q_RETENTION, group=GROUP_RETENTION, consumer=consumer, block_ms=10000
-        )
-        if not msg:
-            continue
+            log.info(
+                "retention_applied",
+                extra={
+                    "payload": {
+                        "task": {
+                            "entity_type": task.get("entity_type"),
+                            "entity_id": task.get("entity_id"),
+                        },
+                        "result": result.__dict__,
+                    }
+                },
+            )
+        should_ack = True
+        QUEUE_TASKS_TOTAL.labels(
+            service="worker-retention", queue=Q_RETENTION, result="success"
+        ).inc()
 
-        should_ack = False
+    except Exception as e:
+        log.error(
+            "worker_retention_error",
+            extra={"payload": {"err": str(e)[:200], "task": task if "task" in locals() else None}},
+        )
+        QUEUE_TASKS_TOTAL.labels(
+            service="worker-retention", queue=Q_RETENTION, result="error"
+        ).inc()
         try:
-            task = msg.payload
-            meeting_id = str(task.get("entity_id") or "").strip() or None
-            with (
-                start_trace_from_payload(task, meeting_id=meeting_id, source="worker.retention"),
-                track_stage_latency("worker-retention", "retention"),
-            ):
-                with db_session() as session:
-                    apply_retention(session)
-
-                log.info(
-                    "retention_applied",
-                    extra={
-                        "payload": {
-                            "task": {
-                                "entity_type": task.get("entity_type"),
-                                "entity_id": task.get("entity_id"),
-                            }
-                        }
-                    },
-                )
+            task = task if "task" in locals() else {}
+            requeue_with_backoff(
+                queue_name=Q_RETENTION, task_payload=task, max_attempts=3, backoff_sec=3
+            )
             should_ack = True
             QUEUE_TASKS_TOTAL.labels(
-                service="worker-retention", queue=Q_RETENTION, result="success"
+                service="worker-retention", queue=Q_RETENTION, result="retry"
             ).inc()
+        except Exception:
+            pass
+    return should_ack
 
-        except Exception as e:
-            log.error(
-                "worker_retention_error",
-                extra={
-                    "payload": {"err": str(e)[:200], "task": task if "task" in locals() else None}
-                },
-            )
-            QUEUE_TASKS_TOTAL.labels(
-                service="worker-retention", queue=Q_RETENTION, result="error"
-            ).inc()
-            try:
-                task = task if "task" in locals() else {}
-                requeue_with_backoff(
-                    queue_name=Q_RETENTION, task_payload=task, max_attempts=3, backoff_sec=3
-                )
-                should_ack = True
-                QUEUE_TASKS_TOTAL.labels(
-                    service="worker-retention", queue=Q_RETENTION, result="retry"
-                ).inc()
-            except Exception:
-                pass
-        finally:
-            if should_ack:
-                with suppress(Exception):
-                    ack_task(stream=Q_RETENTION, group=GROUP_RETENTION, entry_id=msg.entry_id)
+
+def run_loop() -> None:
+    s = get_settings()
+    consumer = consumer_name("worker-retention")
+    log.info("worker_retention_started", extra={"payload": {"queue": Q_RETENTION}})
+
+    WorkerRuntime(
+        service="worker-retention",
+        stream=Q_RETENTION,
+        group=GROUP_RETENTION,
+        consumer=consumer,
+        handler=_handle_task,
+        concurrency=s.worker_concurrency,
+        batch_size=s.queue_read_batch_size,
+        block_ms=10000,
+        shutdown_grace_sec=s.worker_shutdown_grace_sec,
+        retry_poll_interval_sec=s.queue_retry_poll_interval_sec,
+    ).run()
 
 
 def main() -> None:
     setup_logging()
     maybe_setup_otel()
     enforce_startup_readiness(service_name="worker-retention")
-    while True:
+    install_signal_handlers()
+    while not shutdown_requested():
         try:
             run_loop()
         except Exception as e:
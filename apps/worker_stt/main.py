@@ -11,13 +11,20 @@ Worker STT.
 
 Важно:
 - это MVP: один чанк -> один сегмент (seq)
+- STT_BATCH_SIZE > 1: чанки задач, одновременно находящихся в работе,
+  распознаются одним батчем (stt.batching.BatchingSTTProvider)
+- перед моделью смотрим кэш результатов по sha256 аудио (stt.result_cache)
+- тихие чанки отсекает гейт (stt.silence_gate) до модели и до батча:
+  сегмент пишется пустым, диаризация для него не считается
+- встреча создаётся и переводится в processing один раз (storage.meeting_cache):
+  на обычном чанке таблица meetings не трогается
 """
 
 from __future__ import annotations
 
 import json
 import time
-from contextlib import suppress
+from functools import partial
 
 from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.common.logging import get_project_logger, setup_logging
@@ -28,17 +35,28 @@ from interview_analytics_agent.domain.enums import PipelineStatus
 from interview_analytics_agent.queue.dispatcher import Q_STT, enqueue_enhancer
 from interview_analytics_agent.queue.redis import redis_client
 from interview_analytics_agent.queue.retry import requeue_with_backoff
-from interview_analytics_agent.queue.streams import ack_task, consumer_name, read_task
+from interview_analytics_agent.queue.runtime import (
+    WorkerRuntime,
+    install_signal_handlers,
+    shutdown_requested,
+)
+from interview_analytics_agent.queue.streams import StreamTask, consumer_name
+from interview_analytics_agent.services.flow_control import note_chunk_done
+from interview_analytics_agent.services.incremental_enhancer import mark_segment_dirty
 from interview_analytics_agent.services.readiness_service import enforce_startup_readiness
 from interview_analytics_agent.storage.blob import get_bytes
 from interview_analytics_agent.storage.db import db_session
-from interview_analytics_agent.storage.models import TranscriptSegment
+from interview_analytics_agent.storage.meeting_cache import KnownMeetingsCache
 from interview_analytics_agent.storage.repositories import (
     MeetingRepository,
     TranscriptSegmentRepository,
 )
+from interview_analytics_agent.stt.audio import try_decode_audio
+from interview_analytics_agent.stt.batching import BatchingSTTProvider
 from interview_analytics_agent.stt.diarization import resolve_speaker
 from interview_analytics_agent.stt.mock import MockSTTProvider
+from interview_analytics_agent.stt.result_cache import with_result_cache
+from interview_analytics_agent.stt.silence_gate import with_silence_gate
 
 log = get_project_logger()
 
@@ -78,109 +96,150 @@ def _publish_update(meeting_id: str, payload: dict) -> None:
     redis_client().publish(f"ws:{meeting_id}", json.dumps(payload, ensure_ascii=False))
 
 
-def run_loop() -> None:
-    s = get_settings()
-    stt = _build_stt_provider()
-    consumer = consumer_name("worker-stt")
-
-    log.info("worker_stt_started", extra={"payload": {"queue": Q_STT, "provider": s.stt_provider}})
-
-    while True:
-        msg = read_task(stream=Q_STT, group=GROUP_STT, consumer=consumer, block_ms=5000)
-        if not msg:
-            continue
-
-        should_ack = False
-        try:
-            task = msg.payload
-            meeting_id = task["meeting_id"]
-            with (
-                start_trace_from_payload(task, meeting_id=meeting_id, source="worker.stt"),
-                track_stage_latency("worker-stt", "stt"),
-            ):
-                chunk_seq = int(task.get("chunk_seq", 0))
-                blob_key = task.get("blob_key") or None
-
-                audio = get_bytes(blob_key)
-
-                # sample_rate из задачи может отсутствовать, для whisper мы всё равно ресемплим в 16k
-                res = stt.transcribe_chunk(audio=audio, sample_rate=16000)
-                speaker = resolve_speaker(
+def _handle_task(msg: StreamTask, stt, known_meetings: KnownMeetingsCache) -> bool:
+    """
+    Обработать одну задачу. True — задачу можно ACK-нуть.
+    """
+    should_ack = False
+    try:
+        task = msg.payload
+        meeting_id = task["meeting_id"]
+        with (
+            start_trace_from_payload(task, meeting_id=meeting_id, source="worker.stt"),
+            track_stage_latency("worker-stt", "stt"),
+        ):
+            chunk_seq = int(task.get("chunk_seq", 0))
+            blob_key = task.get("blob_key") or None
+
+            audio = get_bytes(blob_key)
+            # декодируем один раз: тот же PCM уходит и в STT, и в диаризацию
+            decoded = try_decode_audio(audio)
+
+            # sample_rate из задачи может отсутствовать, для whisper мы всё равно ресемплим в 16k
+            res = stt.transcribe_chunk(audio=audio, sample_rate=16000, decoded=decoded)
+            # эмбеддинг тишины только испортил бы центроиды спикеров
+            speaker = (
+                None
+                if res.silent
+                else resolve_speaker(
                     hint=res.speaker,
                     raw_text=res.text,
                     seq=chunk_seq,
                     meeting_id=meeting_id,
                     audio_bytes=audio,
+                    decoded=decoded,
                 )
+            )
 
-                with db_session() as session:
-                    mrepo = MeetingRepository(session)
-                    srepo = TranscriptSegmentRepository(session)
-
-                    # гарантируем Meeting (иначе FK упадёт) + ставим статус processing
-                    m = mrepo.ensure(
-                        meeting_id=meeting_id, meeting_context={"source": "auto_worker_stt"}
-                    )
-                    m.status = PipelineStatus.processing
-                    mrepo.save(m)
-                    seg = TranscriptSegment(
+            with db_session() as session:
+                if not known_meetings.known(meeting_id):
+                    # гарантируем Meeting (иначе FK упадёт) + processing, один раз на встречу
+                    MeetingRepository(session).ensure_exists(
                         meeting_id=meeting_id,
-                        seq=chunk_seq,
-                        speaker=speaker,
-                        start_ms=None,
-                        end_ms=None,
-                        raw_text=res.text or "",
-                        enhanced_text=res.text or "",
-                        confidence=res.confidence,
+                        meeting_context={"source": "auto_worker_stt"},
+                        status=PipelineStatus.processing,
                     )
-                    srepo.upsert_by_meeting_seq(seg)
-
-                _publish_update(
-                    meeting_id,
-                    {
-                        "schema_version": "v1",
-                        "event_type": "transcript.update",
-                        "meeting_id": meeting_id,
-                        "seq": chunk_seq,
-                        "speaker": speaker,
-                        "raw_text": res.text or "",
-                        "enhanced_text": res.text or "",
-                        "confidence": res.confidence,
-                    },
+                TranscriptSegmentRepository(session).upsert_many(
+                    [
+                        {
+                            "meeting_id": meeting_id,
+                            "seq": chunk_seq,
+                            "speaker": speaker,
+                            "start_ms": None,
+                            "end_ms": None,
+                            "raw_text": res.text or "",
+                            "enhanced_text": res.text or "",
+                            "confidence": res.confidence,
+                        }
+                    ]
                 )
+            known_meetings.remember(meeting_id)
+
+            # на каждую запись, не только перезапись: чанк мог прийти позже, чем
+            # enhancer сдвинул hwm выше его seq, — ниже hwm он виден только через dirty
+            mark_segment_dirty(meeting_id=meeting_id, seq=chunk_seq)
+
+            _publish_update(
+                meeting_id,
+                {
+                    "schema_version": "v1",
+                    "event_type": "transcript.update",
+                    "meeting_id": meeting_id,
+                    "seq": chunk_seq,
+                    "speaker": speaker,
+                    "raw_text": res.text or "",
+                    "enhanced_text": res.text or "",
+                    "confidence": res.confidence,
+                },
+            )
 
-                enqueue_enhancer(meeting_id=meeting_id)
+            enqueue_enhancer(meeting_id=meeting_id)
+        note_chunk_done(meeting_id)
+        should_ack = True
+        QUEUE_TASKS_TOTAL.labels(service="worker-stt", queue=Q_STT, result="success").inc()
+
+    except Exception as e:
+        if "meeting_id" in locals():
+            known_meetings.forget(meeting_id)
+        log.error(
+            "worker_stt_error",
+            extra={"payload": {"err": str(e)[:250], "task": task if "task" in locals() else None}},
+        )
+        QUEUE_TASKS_TOTAL.labels(service="worker-stt", queue=Q_STT, result="error").inc()
+        try:
+            task = task if "task" in locals() else {}
+            scheduled = requeue_with_backoff(
+                queue_name=Q_STT, task_payload=task, max_attempts=3, backoff_sec=1
+            )
+            if not scheduled and task.get("meeting_id"):
+                # ушла в DLQ: чанк больше не ждёт STT
+                note_chunk_done(task["meeting_id"])
             should_ack = True
-            QUEUE_TASKS_TOTAL.labels(service="worker-stt", queue=Q_STT, result="success").inc()
+            QUEUE_TASKS_TOTAL.labels(service="worker-stt", queue=Q_STT, result="retry").inc()
+        except Exception:
+            pass
+    return should_ack
 
-        except Exception as e:
-            log.error(
-                "worker_stt_error",
-                extra={
-                    "payload": {"err": str(e)[:250], "task": task if "task" in locals() else None}
-                },
-            )
-            QUEUE_TASKS_TOTAL.labels(service="worker-stt", queue=Q_STT, result="error").inc()
-            try:
-                task = task if "task" in locals() else {}
-                requeue_with_backoff(
-                    queue_name=Q_STT, task_payload=task, max_attempts=3, backoff_sec=1
-                )
-                should_ack = True
-                QUEUE_TASKS_TOTAL.labels(service="worker-stt", queue=Q_STT, result="retry").inc()
-            except Exception:
-                pass
-        finally:
-            if should_ack:
-                with suppress(Exception):
-                    ack_task(stream=Q_STT, group=GROUP_STT, entry_id=msg.entry_id)
+
+def run_loop() -> None:
+    s = get_settings()
+    stt = _build_stt_provider()
+    concurrency = s.worker_concurrency
+    if s.stt_batch_size > 1:
+        # батч собирается из задач, которые одновременно в работе
+        stt = BatchingSTTProvider(
+            stt, max_batch=s.stt_batch_size, max_wait_ms=s.stt_batch_max_wait_ms
+        )
+        concurrency = max(concurrency, s.stt_batch_size)
+    stt = with_silence_gate(with_result_cache(stt, s), s)
+    consumer = consumer_name("worker-stt")
+
+    log.info("worker_stt_started", extra={"payload": {"queue": Q_STT, "provider": s.stt_provider}})
+
+    WorkerRuntime(
+        service="worker-stt",
+        stream=Q_STT,
+        group=GROUP_STT,
+        consumer=consumer,
+        handler=partial(
+            _handle_task,
+            stt=stt,
+            known_meetings=KnownMeetingsCache(ttl_sec=s.worker_stt_meeting_cache_ttl_sec),
+        ),
+        concurrency=concurrency,
+        batch_size=s.queue_read_batch_size,
+        block_ms=5000,
+        shutdown_grace_sec=s.worker_shutdown_grace_sec,
+        retry_poll_interval_sec=s.queue_retry_poll_interval_sec,
+    ).run()
 
 
 def main() -> None:
     setup_logging()
     maybe_setup_otel()
     enforce_startup_readiness(service_name="worker-stt")
-    while True:
+    install_signal_handlers()
+    while not shutdown_requested():
         try:
             run_loop()
         except Exception as e:
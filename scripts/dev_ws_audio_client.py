@@ -1,6 +1,188 @@
+#!/usr/bin/env python3
 """
 Dev-клиент WebSocket для отправки аудио чанков.
-Заглушка — реализация будет позже.
+
+- режет WAV (PCM) на чанки по --chunk-ms, каждый чанк — самостоятельный WAV
+- шлёт бинарными кадрами (subprotocol interview-audio.v1.binary) или JSON
+  с content_b64 (--json)
+- соблюдает flow control: не отправляет больше чанков, чем разрешил
+  последний ingest.ack (credits), при throttled ждёт retry_after_ms
+- печатает ответы сервера (ingest.ack, transcript.update, error) как JSON lines
+
+Пример:
+    python scripts/dev_ws_audio_client.py --file sample.wav --meeting-id dev-1 --api-key dev-user-key
 """
 
-print("WS dev client placeholder")
+from __future__ import annotations
+
+import argparse
+import base64
+import io
+import json
+import os
+import sys
+import time
+import wave
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from interview_analytics_agent.contracts.ws_binary import (  # noqa: E402
+    WS_SUBPROTOCOL_BINARY,
+    WS_SUBPROTOCOL_JSON,
+    BinaryAudioFrame,
+    encode_audio_frame,
+)
+
+
+def _args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="WebSocket audio dev client")
+    p.add_argument("--url", default=os.getenv("WS_URL", "ws://127.0.0.1:8010/v1/ws"))
+    p.add_argument("--api-key", default=os.getenv("API_KEY"))
+    p.add_argument("--meeting-id", required=True)
+    p.add_argument("--file", required=True, help="WAV (PCM) файл")
+    p.add_argument("--chunk-ms", type=int, default=2000)
+    p.add_argument("--start-seq", type=int, default=1)
+    p.add_argument("--json", action="store_true", help="JSON + content_b64 вместо бинарных кадров")
+    p.add_argument("--realtime", action="store_true", help="Не быстрее реального времени")
+    p.add_argument("--drain-sec", type=float, default=5.0, help="Сколько слушать после отправки")
+    return p.parse_args()
+
+
+def _wav_chunks(path: str, chunk_ms: int) -> list[tuple[bytes, int, int]]:
+    """[(wav_bytes, sample_rate, channels)] — каждый чанк декодируется отдельно."""
+    out: list[tuple[bytes, int, int]] = []
+    with wave.open(path, "rb") as src:
+        params = src.getparams()
+        frames_per_chunk = max(1, params.framerate * chunk_ms // 1000)
+        while True:
+            frames = src.readframes(frames_per_chunk)
+            if not frames:
+                break
+            buf = io.BytesIO()
+            with wave.open(buf, "wb") as dst:
+                dst.setnchannels(params.nchannels)
+                dst.setsampwidth(params.sampwidth)
+                dst.setframerate(params.framerate)
+                dst.writeframes(frames)
+            out.append((buf.getvalue(), params.framerate, params.nchannels))
+    return out
+
+
+class _FlowWindow:
+    """Сколько чанков можно отправить: credits последнего ack минус отправленные после него."""
+
+    def __init__(self) -> None:
+        self.credits = 1  # до первого ack — по одному чанку
+        self.sent_since_ack = 0
+        self.retry_at = 0.0
+
+    def can_send(self) -> bool:
+        if time.monotonic() < self.retry_at:
+            return False
+        # после паузы при credits=0 — один пробный чанк, его ack откроет окно
+        return self.sent_since_ack < max(1, self.credits)
+
+    def on_sent(self) -> None:
+        self.sent_since_ack += 1
+
+    def on_error(self) -> None:
+        # чанк не принят — ack на него не придёт, слот окна освобождается
+        self.sent_since_ack = max(0, self.sent_since_ack - 1)
+
+    def on_ack(self, event: dict) -> None:
+        self.credits = int(event.get("credits") or 0)
+        self.sent_since_ack = 0
+        if event.get("throttled"):
+            self.retry_at = time.monotonic() + int(event.get("retry_after_ms") or 1000) / 1000.0
+
+
+def _print_event(raw: str | bytes) -> dict:
+    try:
+        event = json.loads(raw)
+    except Exception:
+        event = {"event_type": "unparsed", "raw": str(raw)[:200]}
+    print(json.dumps(event, ensure_ascii=False), flush=True)
+    return event
+
+
+def main() -> int:
+    try:
+        from websockets.sync.client import connect
+    except ImportError:
+        print("нужен пакет websockets (pip install websockets)", file=sys.stderr)
+        return 2
+
+    args = _args()
+    chunks = _wav_chunks(args.file, args.chunk_ms)
+    headers = {"X-API-Key": args.api_key} if args.api_key else None
+    protocol = WS_SUBPROTOCOL_JSON if args.json else WS_SUBPROTOCOL_BINARY
+    window = _FlowWindow()
+
+    with connect(args.url, additional_headers=headers, subprotocols=[protocol]) as ws:
+        started = time.monotonic()
+        for i, (audio, sample_rate, channels) in enumerate(chunks):
+            seq = args.start_seq + i
+            while not window.can_send():
+                try:
+                    event = _print_event(ws.recv(timeout=0.1))
+                except TimeoutError:
+                    continue
+                if event.get("event_type") == "ingest.ack":
+                    window.on_ack(event)
+                elif event.get("event_type") == "error":
+                    window.on_error()
+
+            if args.realtime:
+                delay = started + i * args.chunk_ms / 1000.0 - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+            idem = f"dev-{args.meeting_id}-{seq}"
+            if args.json:
+                ws.send(
+                    json.dumps(
+                        {
+                            "schema_version": "v1",
+                            "event_type": "audio.chunk",
+                            "meeting_id": args.meeting_id,
+                            "seq": seq,
+                            "timestamp_ms": int(time.time() * 1000),
+                            "codec": "wav",
+                            "sample_rate": sample_rate,
+                            "channels": channels,
+                            "content_b64": base64.b64encode(audio).decode("ascii"),
+                            "idempotency_key": idem,
+                        }
+                    )
+                )
+            else:
+                ws.send(
+                    encode_audio_frame(
+                        BinaryAudioFrame(
+                            meeting_id=args.meeting_id,
+                            seq=seq,
+                            audio=audio,
+                            codec="wav",
+                            sample_rate=sample_rate,
+                            channels=channels,
+                            idempotency_key=idem,
+                        )
+                    )
+                )
+            window.on_sent()
+
+        deadline = time.monotonic() + args.drain_sec
+        while time.monotonic() < deadline:
+            try:
+                _print_event(ws.recv(timeout=max(0.0, deadline - time.monotonic())))
+            except TimeoutError:
+                break
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
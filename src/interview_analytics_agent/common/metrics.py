@@ -68,6 +68,81 @@ QUEUE_PENDING = Gauge(
     ["queue", "group"],
 )
 
+QUEUE_RETRY_BACKLOG = Gauge(
+    "agent_queue_retry_backlog",
+    "Количество задач, ожидающих отложенного повтора",
+    ["queue"],
+)
+
+QUEUE_RETRY_EVENTS_TOTAL = Counter(
+    "agent_queue_retry_events_total",
+    "События отложенных ретраев",
+    ["queue", "event"],  # scheduled|promoted|dlq
+)
+
+QUEUE_DELAYED_BACKLOG = Gauge(
+    "agent_queue_delayed_backlog",
+    "Количество отложенных (coalesced) задач, ожидающих постановки в stream",
+    ["queue"],
+)
+
+QUEUE_COALESCE_TOTAL = Counter(
+    "agent_queue_coalesce_total",
+    "Коалесинг задач по встрече",
+    ["queue", "result"],  # scheduled|merged
+)
+
+WORKER_INFLIGHT_TASKS = Gauge(
+    "agent_worker_inflight_tasks",
+    "Количество задач, прочитанных воркером и ещё не завершённых",
+    ["service"],
+)
+
+INGEST_THROTTLED_TOTAL = Counter(
+    "agent_ingest_throttled_total",
+    "Ответы ingest с нулевым окном кредитов (клиент должен притормозить)",
+    ["source"],  # ws|connector|http
+)
+
+INGEST_THROTTLED_MEETINGS = Gauge(
+    "agent_ingest_throttled_meetings",
+    "Встречи, которым процесс сейчас выдаёт нулевое окно кредитов",
+)
+
+WS_FANOUT_CHANNELS = Gauge(
+    "agent_ws_fanout_channels",
+    "Каналы ws:<meeting_id>, на которые подписан общий pub/sub gateway",
+)
+
+WS_FANOUT_DROPPED_TOTAL = Counter(
+    "agent_ws_fanout_dropped_total",
+    "Сообщения, выброшенные из переполненной очереди медленного WebSocket-клиента",
+)
+
+STT_BATCH_SIZE = Histogram(
+    "agent_stt_batch_size",
+    "Размер батча чанков в одном вызове STT",
+    buckets=(1, 2, 4, 8, 16, 32),
+)
+
+STT_SILENCE_GATE_TOTAL = Counter(
+    "agent_stt_silence_gate_total",
+    "Чанки перед STT по решению гейта тишины (доля skipped = отсечённые без модели)",
+    ["result"],  # skipped|passed
+)
+
+STT_CACHE_TOTAL = Counter(
+    "agent_stt_cache_total",
+    "Обращения к кэшу результатов STT по содержимому аудио",
+    ["backend", "result"],  # result: hit|miss
+)
+
+STT_INFERENCE_SLOTS_BUSY = Gauge(
+    "agent_stt_inference_slots_busy",
+    "Занятые слоты инференса Whisper-модели в процессе",
+    ["model"],
+)
+
 METRICS_COLLECTION_ERRORS_TOTAL = Counter(
     "agent_metrics_collection_errors_total",
     "Ошибки сборки служебных метрик",
@@ -96,6 +171,37 @@ SBERJAZZ_CIRCUIT_BREAKER_RESETS_TOTAL = Counter(
     ["source", "reason"],  # source=admin|auto
 )
 
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "agent_db_pool_checkout_wait_seconds",
+    "Ожидание соединения из пула SQLAlchemy (сек)",
+    ["engine"],  # primary|replica
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+DB_POOL_IN_USE = Gauge(
+    "agent_db_pool_in_use",
+    "Соединений пула, выданных сессиям",
+    ["engine"],
+)
+
+DB_POOL_SATURATION = Gauge(
+    "agent_db_pool_saturation",
+    "Заполненность пула: выданные / (pool_size + max_overflow)",
+    ["engine"],
+)
+
+RETENTION_MEETINGS_TOTAL = Counter(
+    "agent_retention_meetings_total",
+    "Встречи, обработанные ретеншном",
+    ["policy"],  # text|audio
+)
+
+BLOB_PUT_TOTAL = Counter(
+    "agent_blob_put_total",
+    "Записи в blob storage",
+    ["result"],  # written|deduplicated|unchanged|copied
+)
+
 STORAGE_HEALTH = Gauge(
     "agent_storage_health",
     "Состояние blob storage (1=healthy, 0=unhealthy)",
@@ -191,6 +297,13 @@ def _stream_len(r, stream: str) -> int:
         return 0
 
 
+def _zset_len(r, key: str) -> int:
+    try:
+        return int(r.zcard(key))
+    except Exception:
+        return 0
+
+
 def _xpending_count(r, stream: str, group: str) -> int:
     try:
         pending = r.xpending(stream, group)
@@ -204,12 +317,18 @@ def _xpending_count(r, stream: str, group: str) -> int:
 def refresh_queue_metrics() -> None:
     try:
         from interview_analytics_agent.queue.redis import redis_client
-        from interview_analytics_agent.queue.streams import stream_dlq_name
+        from interview_analytics_agent.queue.streams import (
+            stream_delayed_name,
+            stream_dlq_name,
+            stream_retry_name,
+        )
 
         r = redis_client()
         for queue, group in _QUEUE_GROUPS.items():
             QUEUE_DEPTH.labels(queue=queue).set(_stream_len(r, queue))
             DLQ_DEPTH.labels(queue=queue).set(_stream_len(r, stream_dlq_name(queue)))
+            QUEUE_RETRY_BACKLOG.labels(queue=queue).set(_zset_len(r, stream_retry_name(queue)))
+            QUEUE_DELAYED_BACKLOG.labels(queue=queue).set(_zset_len(r, stream_delayed_name(queue)))
             QUEUE_PENDING.labels(queue=queue, group=group).set(_xpending_count(r, queue, group))
     except Exception:
         METRICS_COLLECTION_ERRORS_TOTAL.labels(source="queue_metrics").inc()
@@ -0,0 +1,121 @@
+"""
+Бинарный протокол аудио-чанков для WebSocket (client -> server).
+
+Зачем:
+- без base64 (+33% к размеру) и JSON-парсинга аудио на event loop gateway
+- режим согласуется subprotocol-ом при подключении (WS_SUBPROTOCOL_BINARY);
+  без него соединение работает в JSON-режиме (audio.chunk с content_b64)
+
+Кадр (binary message), big-endian:
+    magic        2s   b"IA"
+    version      u8   WS_BINARY_VERSION
+    channels     u8
+    seq          u32
+    sample_rate  u32
+    meeting_len  u8   длина meeting_id (utf-8)
+    codec_len    u8   длина codec (utf-8)
+    idem_len     u8   длина idempotency_key (utf-8), 0 = нет
+    meeting_id | codec | idempotency_key | audio bytes (до конца кадра)
+
+Ответы сервера (transcript.update, error) остаются текстовыми JSON.
+"""
+
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+
+WS_SUBPROTOCOL_JSON = "interview-audio.v1.json"
+WS_SUBPROTOCOL_BINARY = "interview-audio.v1.binary"
+WS_SUBPROTOCOLS = (WS_SUBPROTOCOL_BINARY, WS_SUBPROTOCOL_JSON)
+
+WS_BINARY_MAGIC = b"IA"
+WS_BINARY_VERSION = 1
+
+_HEADER = struct.Struct("!2sBBIIBBB")
+HEADER_SIZE = _HEADER.size
+
+
+class BinaryFrameError(ValueError):
+    """Кадр не соответствует бинарному протоколу."""
+
+
+@dataclass(frozen=True)
+class BinaryAudioFrame:
+    meeting_id: str
+    seq: int
+    audio: bytes
+    codec: str = "pcm"
+    sample_rate: int = 16000
+    channels: int = 1
+    idempotency_key: str | None = None
+
+
+def _utf8(value: str, field: str) -> bytes:
+    raw = value.encode("utf-8")
+    if len(raw) > 255:
+        raise BinaryFrameError(f"{field} длиннее 255 байт")
+    return raw
+
+
+def encode_audio_frame(frame: BinaryAudioFrame) -> bytes:
+    meeting = _utf8(frame.meeting_id, "meeting_id")
+    codec = _utf8(frame.codec or "", "codec")
+    idem = _utf8(frame.idempotency_key or "", "idempotency_key")
+    header = _HEADER.pack(
+        WS_BINARY_MAGIC,
+        WS_BINARY_VERSION,
+        int(frame.channels),
+        int(frame.seq),
+        int(frame.sample_rate),
+        len(meeting),
+        len(codec),
+        len(idem),
+    )
+    return b"".join((header, meeting, codec, idem, frame.audio))
+
+
+def decode_audio_frame(data: bytes) -> BinaryAudioFrame:
+    if len(data) < HEADER_SIZE:
+        raise BinaryFrameError("кадр короче заголовка")
+    magic, version, channels, seq, sample_rate, m_len, c_len, i_len = _HEADER.unpack_from(data)
+    if magic != WS_BINARY_MAGIC:
+        raise BinaryFrameError("неверная сигнатура кадра")
+    if version != WS_BINARY_VERSION:
+        raise BinaryFrameError(f"неподдерживаемая версия кадра: {version}")
+    end = HEADER_SIZE + m_len + c_len + i_len
+    if len(data) < end:
+        raise BinaryFrameError("кадр короче заголовка")
+
+    view = memoryview(data)
+    pos = HEADER_SIZE
+    try:
+        meeting_id = bytes(view[pos : pos + m_len]).decode("utf-8")
+        pos += m_len
+        codec = bytes(view[pos : pos + c_len]).decode("utf-8")
+        pos += c_len
+        idem = bytes(view[pos : pos + i_len]).decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise BinaryFrameError("строковое поле не в utf-8") from e
+
+    return BinaryAudioFrame(
+        meeting_id=meeting_id,
+        seq=seq,
+        audio=bytes(view[end:]),
+        codec=codec,
+        sample_rate=sample_rate,
+        channels=channels,
+        idempotency_key=idem or None,
+    )
+
+
+def negotiate_subprotocol(offered: list[str] | None) -> str | None:
+    """
+    Выбрать subprotocol из предложенных клиентом (бинарный в приоритете).
+    None — клиент ничего из наших не предложил: JSON-режим без subprotocol.
+    """
+    offered_set = {p.strip() for p in offered or [] if p and p.strip()}
+    for proto in WS_SUBPROTOCOLS:
+        if proto in offered_set:
+            return proto
+    return None
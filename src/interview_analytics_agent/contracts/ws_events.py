@@ -17,7 +17,7 @@ from .versions import WS_SCHEMA_VERSION
 # =============================================================================
 # ТИПЫ СОБЫТИЙ
 # =============================================================================
-WSEventType = Literal["audio.chunk", "transcript.update", "error"]
+WSEventType = Literal["audio.chunk", "transcript.update", "ingest.ack", "error"]
 
 
 # =============================================================================
@@ -36,7 +36,7 @@ class AudioChunkEvent:
     sample_rate: int
     channels: int
 
-    content_b64: str  # base64 аудио (MVP)
+    content_b64: str  # base64 аудио (MVP); без base64 — бинарные кадры, см. ws_binary.py
     speaker_hint: str | None = None
     idempotency_key: str | None = None
 
@@ -58,6 +58,25 @@ class TranscriptUpdateEvent:
     confidence: float | None = None
 
 
+# =============================================================================
+# ВЫХОД: ingest.ack (server -> client, только при согласованном subprotocol)
+# =============================================================================
+@dataclass
+class IngestAckEvent:
+    schema_version: Literal[WS_SCHEMA_VERSION]
+    event_type: Literal["ingest.ack"]
+
+    meeting_id: str
+    seq: int
+    duplicate: bool
+
+    # сколько ещё чанков можно отправить, не дожидаясь следующего ack;
+    # 0 — подождать retry_after_ms (STT не успевает)
+    credits: int
+    throttled: bool
+    retry_after_ms: int = 0
+
+
 # =============================================================================
 # ВЫХОД: error (server -> client)
 # =============================================================================
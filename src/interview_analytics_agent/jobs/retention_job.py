@@ -6,7 +6,6 @@
 """
 
 from interview_analytics_agent.common.logging import get_project_logger
-from interview_analytics_agent.storage.db import db_session
 from interview_analytics_agent.storage.retention import apply_retention
 
 log = get_project_logger()
@@ -14,6 +13,5 @@ log = get_project_logger()
 
 def run() -> None:
     log.info("retention_job_started")
-    with db_session() as s:
-        apply_retention(s)
-    log.info("retention_job_finished")
+    result = apply_retention()
+    log.info("retention_job_finished", extra={"payload": {"result": result.__dict__}})
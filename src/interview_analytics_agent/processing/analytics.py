@@ -13,7 +13,10 @@ from typing import Any
 
 from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.processing.decision import build_decision_summary
-from interview_analytics_agent.processing.scorecard import build_interview_scorecard
+from interview_analytics_agent.processing.scorecard import (
+    ScorecardAccumulator,
+    build_interview_scorecard,
+)
 
 
 def _build_orchestrator():
@@ -43,12 +46,14 @@ def _with_scorecard(
     enhanced_transcript: str,
     meeting_context: dict[str, Any],
     transcript_segments: list[dict[str, Any]] | None,
+    scorecard_accumulator: ScorecardAccumulator | None = None,
 ) -> dict[str, Any]:
     scorecard = build_interview_scorecard(
         enhanced_transcript=enhanced_transcript,
         meeting_context=meeting_context,
         report=base_report,
         transcript_segments=transcript_segments,
+        accumulator=scorecard_accumulator,
     )
     out = dict(base_report)
     decision = build_decision_summary(scorecard=scorecard, report=out)
@@ -72,10 +77,15 @@ def build_report(
     enhanced_transcript: str,
     meeting_context: dict,
     transcript_segments: list[dict[str, Any]] | None = None,
+    scorecard_accumulator: ScorecardAccumulator | None = None,
 ) -> dict[str, Any]:
     """
     Сборка отчёта по интервью.
 
+    scorecard_accumulator — сохранённое состояние scorecard встречи: в него
+    досчитываются только новые сегменты (обновляется на месте). С ним
+    transcript_segments — только новые/изменённые сегменты, а не вся встреча.
+
     Возвращаемый формат (MVP):
     - summary: str
     - bullets: list[str]
@@ -101,6 +111,7 @@ def build_report(
             enhanced_transcript=enhanced_transcript,
             meeting_context=meeting_context,
             transcript_segments=transcript_segments,
+            scorecard_accumulator=scorecard_accumulator,
         )
 
     orch = _build_orchestrator()
@@ -117,6 +128,7 @@ def build_report(
             enhanced_transcript=enhanced_transcript,
             meeting_context=meeting_context,
             transcript_segments=transcript_segments,
+            scorecard_accumulator=scorecard_accumulator,
         )
 
     system = (
@@ -141,4 +153,5 @@ def build_report(
         enhanced_transcript=enhanced_transcript,
         meeting_context=meeting_context,
         transcript_segments=transcript_segments,
+        scorecard_accumulator=scorecard_accumulator,
     )
@@ -0,0 +1,121 @@
+"""
+Compiled multi-group keyword matcher.
+
+Built once per keyword set; one call returns hits for every group at once
+(instead of rows x groups x keywords substring scans).
+
+How it works:
+- texts of a batch are joined with a separator and scanned in a single pass;
+  hit positions are mapped back to texts by bisect
+- with pyahocorasick installed the scan is an Aho–Corasick automaton (C),
+  it reports every occurrence including overlapping ones
+- fallback: one regex shaped as a trie (longest keyword at each position);
+  after a hit the scan resumes at the next character and keywords contained
+  in the matched one are implied by it
+
+Semantics are exactly `kw in text` per keyword; per group, hits keep
+the group's keyword order.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from collections.abc import Mapping
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore[assignment]
+
+_SEP = "\x00"
+
+
+def _trie_pattern(keywords: list[str]) -> str:
+    trie: dict = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def _build(node: dict) -> str:
+        terminal = "" in node
+        alts = [re.escape(ch) + _build(sub) for ch, sub in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        # greedy optional tail -> the longest keyword at this position wins
+        return f"(?:{body})?" if terminal else body
+
+    return _build(trie)
+
+
+class KeywordMatcher:
+    def __init__(self, groups: Mapping[str, tuple[str, ...]]) -> None:
+        self.groups: dict[str, tuple[str, ...]] = {
+            gid: tuple(dict.fromkeys(k for k in kws if k and _SEP not in k))
+            for gid, kws in groups.items()
+        }
+        # keyword -> [(group, position in group)]
+        self._owners: dict[str, list[tuple[str, int]]] = {}
+        for gid, kws in self.groups.items():
+            for idx, kw in enumerate(kws):
+                self._owners.setdefault(kw, []).append((gid, idx))
+        keywords = sorted(self._owners)
+        self.keywords: tuple[str, ...] = tuple(keywords)
+
+        self._contained: dict[str, tuple[str, ...]] = {
+            kw: tuple(other for other in keywords if other != kw and other in kw) for kw in keywords
+        }
+        self._pattern = re.compile(_trie_pattern(keywords)) if keywords else None
+        self._automaton = None
+        if ahocorasick is not None and keywords:
+            automaton = ahocorasick.Automaton()
+            for kw in keywords:
+                automaton.add_word(kw, kw)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def _hits(self, found: set[str]) -> dict[str, list[str]]:
+        hits: dict[str, list[tuple[int, str]]] = {}
+        for kw in found:
+            for gid, idx in self._owners[kw]:
+                hits.setdefault(gid, []).append((idx, kw))
+        return {gid: [kw for _, kw in sorted(items)] for gid, items in hits.items()}
+
+    def match_many(self, texts: list[str]) -> list[dict[str, list[str]]]:
+        """
+        For each (already normalized) text: groups with at least one hit -> matched keywords.
+        """
+        if not texts or self._pattern is None:
+            return [{} for _ in texts]
+        texts = [t.replace(_SEP, " ") if _SEP in t else t for t in texts]
+        starts: list[int] = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        buf = _SEP.join(texts)
+        found: dict[int, set[str]] = {}
+        if self._automaton is not None:
+            for end, kw in self._automaton.iter(buf):
+                row = bisect_right(starts, end) - 1
+                found.setdefault(row, set()).add(kw)
+        else:
+            contained = self._contained
+            search = self._pattern.search
+            m = search(buf)
+            while m is not None:
+                kw = m.group()
+                pos = m.start()
+                row_found = found.setdefault(bisect_right(starts, pos) - 1, set())
+                row_found.add(kw)
+                row_found.update(contained[kw])
+                m = search(buf, pos + 1)
+
+        return [self._hits(found[row]) if row in found else {} for row in range(len(texts))]
+
+    def match(self, text: str) -> dict[str, list[str]]:
+        return self.match_many([text])[0]
@@ -4,18 +4,28 @@ Comparable interview scorecard builder (evidence-first).
 Goal:
 - make interview summaries objective and comparable for senior reviewers
 - require explicit evidence snippets per competency
+
+Evidence is collected into a ScorecardAccumulator: each row is scanned once,
+scores are recomputed from the accumulated hit counts/evidence, so a live
+meeting only pays for its new segments on every refresh.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
+from interview_analytics_agent.processing.keyword_matcher import KeywordMatcher
 from interview_analytics_agent.processing.pii import mask_pii
 from interview_analytics_agent.processing.rubric_tuning import load_weight_overrides
 
 DEFAULT_RUBRIC_ID = "interview_core_v1"
 SCALE_MIN = 1.0
 SCALE_MAX = 5.0
+MAX_EVIDENCE_ITEMS = 3
+ACCUMULATOR_VERSION = 2
 
 
 BASE_RUBRIC: list[dict[str, Any]] = [
@@ -184,6 +194,7 @@ def _segment_rows(
     *,
     enhanced_transcript: str,
     transcript_segments: list[dict[str, Any]] | None,
+    transcript_fallback: bool = True,
 ) -> list[dict[str, Any]]:
     if transcript_segments:
         rows: list[dict[str, Any]] = []
@@ -202,6 +213,8 @@ def _segment_rows(
             )
         if rows:
             return rows
+    if not transcript_fallback:
+        return []
 
     rows = []
     for idx, raw in enumerate((enhanced_transcript or "").splitlines(), start=1):
@@ -220,36 +233,144 @@ def _segment_rows(
     return rows
 
 
-def _collect_evidence(
-    *,
-    rows: list[dict[str, Any]],
-    keywords: tuple[str, ...],
-    max_items: int = 3,
-) -> tuple[list[dict[str, Any]], int]:
-    evidence: list[dict[str, Any]] = []
-    total_hits = 0
-    key_norm = tuple(_norm(k) for k in keywords if _norm(k))
-    for row in rows:
-        text = str(row.get("text") or "")
-        text_norm = _norm(text)
-        if not text_norm:
-            continue
-        matches = [kw for kw in key_norm if kw in text_norm]
-        if not matches:
-            continue
-        total_hits += len(matches)
-        if len(evidence) < max_items:
-            evidence.append(
+def _rubric_keywords() -> dict[str, tuple[str, ...]]:
+    return {
+        item["id"]: tuple(_norm(k) for k in item["keywords"] if _norm(k))
+        for item in BASE_RUBRIC
+    }
+
+
+@lru_cache(maxsize=1)
+def rubric_matcher() -> KeywordMatcher:
+    """
+    Compiled keyword matcher for BASE_RUBRIC, built once per process.
+
+    Weight overrides (rubric_tuning) only change weights, never keywords,
+    so one matcher serves every overrides version.
+    """
+    return KeywordMatcher(_rubric_keywords())
+
+
+def _covers(intervals: list[list[int]], seq: int) -> bool:
+    idx = bisect_right(intervals, [seq, float("inf")]) - 1
+    return idx >= 0 and intervals[idx][0] <= seq <= intervals[idx][1]
+
+
+def _merge_intervals(intervals: list[list[int]], seqs: Iterable[int]) -> list[list[int]]:
+    merged: list[list[int]] = []
+    for lo, hi in sorted([*intervals, *([s, s] for s in seqs)]):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], hi)
+        else:
+            merged.append([lo, hi])
+    return merged
+
+
+class ScorecardAccumulator:
+    """
+    Incremental per-competency evidence state for one meeting.
+
+    - fold() is fed only new or changed rows and skips seqs it has already folded
+    - only folded seq ranges are kept (a handful of intervals), not per-row state;
+      a changed row that is already folded needs reset() and a full refold,
+      which the caller decides via has_folded() (see services.scorecard_state)
+    - evidence keeps the MAX_EVIDENCE_ITEMS lowest seqs, as a full scan in seq order would
+    - to_dict()/from_dict() give a JSON-serializable snapshot
+    """
+
+    def __init__(self, *, rubric_id: str = DEFAULT_RUBRIC_ID) -> None:
+        self.rubric_id = rubric_id
+        self.reset()
+
+    def reset(self) -> None:
+        self.hits: dict[str, int] = {item["id"]: 0 for item in BASE_RUBRIC}
+        self.evidence: dict[str, list[dict[str, Any]]] = {item["id"]: [] for item in BASE_RUBRIC}
+        self.folded: list[list[int]] = []
+
+    @property
+    def empty(self) -> bool:
+        return not self.folded
+
+    def has_folded(self, seqs: Iterable[int]) -> bool:
+        return any(_covers(self.folded, int(seq)) for seq in seqs)
+
+    def _fold_row(self, row: dict[str, Any], matches_by_cid: dict[str, list[str]]) -> None:
+        seq = int(row.get("seq") or 0)
+        for cid, matches in matches_by_cid.items():
+            if cid not in self.hits:
+                continue
+            self.hits[cid] += len(matches)
+            items = self.evidence[cid]
+            if len(items) >= MAX_EVIDENCE_ITEMS and seq >= items[-1]["seq"]:
+                continue
+            items.append(
                 {
-                    "seq": int(row.get("seq") or 0),
+                    "seq": seq,
                     "speaker": row.get("speaker"),
                     "start_ms": row.get("start_ms"),
                     "end_ms": row.get("end_ms"),
-                    "quote": _safe_quote(text),
+                    "quote": _safe_quote(str(row.get("text") or "")),
                     "matched_keywords": matches,
                 }
             )
-    return evidence, total_hits
+            items.sort(key=lambda x: x["seq"])
+            del items[MAX_EVIDENCE_ITEMS:]
+
+    def fold(self, rows: list[dict[str, Any]], *, matcher: KeywordMatcher | None = None) -> int:
+        """
+        Fold rows in; returns how many rows were actually scanned.
+        """
+        fresh: dict[int, dict[str, Any]] = {}
+        for row in rows:
+            seq = int(row.get("seq") or 0)
+            if seq not in fresh and not _covers(self.folded, seq):
+                fresh[seq] = row
+        if not fresh:
+            return 0
+
+        ordered = [fresh[seq] for seq in sorted(fresh)]
+        matcher = matcher or rubric_matcher()
+        # all new rows go through the matcher in one batch
+        matched = matcher.match_many([_norm(str(row.get("text") or "")) for row in ordered])
+        for row, matches_by_cid in zip(ordered, matched, strict=True):
+            self._fold_row(row, matches_by_cid)
+        self.folded = _merge_intervals(self.folded, fresh)
+        return len(ordered)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": ACCUMULATOR_VERSION,
+            "rubric_id": self.rubric_id,
+            "hits": dict(self.hits),
+            "evidence": {cid: list(items) for cid, items in self.evidence.items()},
+            "folded": [list(iv) for iv in self.folded],
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: dict[str, Any] | None, *, rubric_id: str = DEFAULT_RUBRIC_ID
+    ) -> ScorecardAccumulator:
+        """
+        Restore a snapshot; an incompatible one (version, rubric, competencies) yields empty state.
+        """
+        acc = cls(rubric_id=rubric_id)
+        if not isinstance(data, dict):
+            return acc
+        if data.get("version") != ACCUMULATOR_VERSION or data.get("rubric_id") != rubric_id:
+            return acc
+        hits = data.get("hits") or {}
+        evidence = data.get("evidence") or {}
+        if set(hits) != set(acc.hits) or set(evidence) != set(acc.evidence):
+            return acc
+        try:
+            acc.hits = {cid: int(v) for cid, v in hits.items()}
+            acc.evidence = {cid: list(items) for cid, items in evidence.items()}
+            acc.folded = _merge_intervals(
+                [[int(lo), int(hi)] for lo, hi in data.get("folded") or []], ()
+            )
+        except (TypeError, ValueError):
+            acc.reset()
+        return acc
 
 
 def _risk_penalty(report: dict[str, Any] | None) -> float:
@@ -280,11 +401,23 @@ def build_interview_scorecard(
     report: dict[str, Any] | None,
     transcript_segments: list[dict[str, Any]] | None = None,
     rubric_id: str = DEFAULT_RUBRIC_ID,
+    accumulator: ScorecardAccumulator | None = None,
 ) -> dict[str, Any]:
+    """
+    Pass a persisted accumulator together with only the new/changed segments
+    (it is updated in place); transcript lines are then never used as a fallback.
+    """
     context = dict(meeting_context or {})
-    rows = _segment_rows(enhanced_transcript=enhanced_transcript, transcript_segments=transcript_segments)
+    rows = _segment_rows(
+        enhanced_transcript=enhanced_transcript,
+        transcript_segments=transcript_segments,
+        transcript_fallback=accumulator is None,
+    )
     penalty = _risk_penalty(report)
     overrides = load_weight_overrides()
+    if accumulator is None:
+        accumulator = ScorecardAccumulator(rubric_id=rubric_id)
+    accumulator.fold(rows, matcher=rubric_matcher())
     weights = _effective_weights(context, overrides)
 
     competencies: list[dict[str, Any]] = []
@@ -293,7 +426,8 @@ def build_interview_scorecard(
     confidence_weighted = 0.0
 
     for item in BASE_RUBRIC:
-        evidence, hits = _collect_evidence(rows=rows, keywords=item["keywords"])
+        evidence = [dict(e) for e in accumulator.evidence[item["id"]]]
+        hits = accumulator.hits[item["id"]]
         score, confidence, status = _competency_score(
             evidence_count=len(evidence),
             keyword_hits=hits,
@@ -0,0 +1,83 @@
+"""
+Коалесинг задач по встрече.
+
+Зачем нужно:
+- worker_stt ставит enhancer после каждого чанка, enhancer — analytics
+- обе стадии обрабатывают встречу целиком, поэтому N чанков подряд
+  достаточно обработать одним запуском
+
+Реализация:
+- маркер pending:<queue>:<meeting_id> (SET NX) — "по встрече уже есть задача в ожидании"
+- если маркера не было, задача кладётся в sorted set <queue>:delayed с due = now + quiet
+- промоутер (WorkerRuntime) переносит созревшие задачи в stream
+- воркер снимает маркер в начале обработки: чанки, пришедшие во время
+  обработки, запланируют следующий запуск
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from interview_analytics_agent.common.metrics import QUEUE_COALESCE_TOTAL
+
+from .redis import redis_client
+from .streams import now_ms, promote_due, stream_delayed_name
+
+# SET NX маркера + ZADD задачи одним атомарным вызовом.
+_SCHEDULE_LUA = """
+if redis.call('SET', KEYS[1], '1', 'NX', 'EX', tonumber(ARGV[3])) then
+  redis.call('ZADD', KEYS[2], tonumber(ARGV[2]), ARGV[1])
+  return 1
+end
+return 0
+"""
+
+# Маркер живёт дольше quiet-периода: если воркер умрёт до снятия маркера,
+# следующая задача по встрече всё равно будет поставлена.
+_MARKER_TTL_EXTRA_SEC = 300
+
+_schedule_script = None
+
+
+def pending_marker_key(queue: str, meeting_id: str) -> str:
+    return f"pending:{queue}:{meeting_id}"
+
+
+def schedule_coalesced(
+    *, queue: str, meeting_id: str, payload: dict[str, Any], quiet_sec: float
+) -> bool:
+    """
+    Запланировать задачу по встрече, если по ней ещё нет ожидающей.
+
+    Возвращает True, если задача поставлена, False — если слита с уже ожидающей.
+    """
+    global _schedule_script
+    r = redis_client()
+    if _schedule_script is None:
+        _schedule_script = r.register_script(_SCHEDULE_LUA)
+    quiet_ms = max(0, int(float(quiet_sec) * 1000))
+    scheduled = bool(
+        _schedule_script(
+            keys=[pending_marker_key(queue, meeting_id), stream_delayed_name(queue)],
+            args=[
+                json.dumps(payload, ensure_ascii=False),
+                now_ms() + quiet_ms,
+                int(quiet_ms / 1000) + _MARKER_TTL_EXTRA_SEC,
+            ],
+            client=r,
+        )
+    )
+    QUEUE_COALESCE_TOTAL.labels(queue=queue, result="scheduled" if scheduled else "merged").inc()
+    return scheduled
+
+
+def clear_coalesced(*, queue: str, meeting_id: str) -> None:
+    """
+    Снять маркер ожидания (вызывает воркер перед чтением данных встречи).
+    """
+    redis_client().delete(pending_marker_key(queue, meeting_id))
+
+
+def promote_due_coalesced(queue: str, *, limit: int = 100) -> int:
+    return promote_due(zset_key=stream_delayed_name(queue), stream=queue, limit=limit)
@@ -5,6 +5,7 @@
 - Единые имена очередей
 - Унифицированная упаковка задач в JSON
 - Удобные функции enqueue_* для всех стадий пайплайна
+- Коалесинг enhancer/analytics по встрече (см. queue.coalesce)
 """
 
 from __future__ import annotations
@@ -16,6 +17,7 @@ from interview_analytics_agent.common.time import utc_now_iso
 from interview_analytics_agent.common.tracing import inject_trace_context
 from interview_analytics_agent.services.local_pipeline import process_chunk_inline
 
+from .coalesce import schedule_coalesced
 from .streams import enqueue
 
 log = get_project_logger()
@@ -37,20 +39,25 @@ def _now_iso() -> str:
     return utc_now_iso()
 
 
-def enqueue_stt(*, meeting_id: str, chunk_seq: int, blob_key: str) -> str:
-    """
-    Поставить задачу STT на обработку аудио-чанка.
-    """
-    event_id = new_event_id("stt")
+def stt_payload(*, meeting_id: str, chunk_seq: int, blob_key: str) -> dict:
     payload = {
         "schema_version": "v1",
-        "event_id": event_id,
+        "event_id": new_event_id("stt"),
         "meeting_id": meeting_id,
         "chunk_seq": chunk_seq,
         "blob_key": blob_key,
         "timestamp": _now_iso(),
     }
     inject_trace_context(payload, meeting_id=meeting_id, source="queue.stt")
+    return payload
+
+
+def enqueue_stt(*, meeting_id: str, chunk_seq: int, blob_key: str) -> str:
+    """
+    Поставить задачу STT на обработку аудио-чанка.
+    """
+    payload = stt_payload(meeting_id=meeting_id, chunk_seq=chunk_seq, blob_key=blob_key)
+    event_id = payload["event_id"]
     if (get_settings().queue_mode or "").strip().lower() == "inline":
         process_chunk_inline(meeting_id=meeting_id, chunk_seq=chunk_seq, blob_key=blob_key)
         log.info(
@@ -67,32 +74,63 @@ def enqueue_stt(*, meeting_id: str, chunk_seq: int, blob_key: str) -> str:
     return event_id
 
 
-def enqueue_enhancer(*, meeting_id: str) -> str:
+def _enqueue_meeting_stage(
+    *, queue: str, meeting_id: str, payload: dict, event_name: str, coalesce: bool
+) -> None:
+    quiet_sec = float(get_settings().pipeline_coalesce_quiet_sec or 0)
+    if coalesce and quiet_sec > 0:
+        scheduled = schedule_coalesced(
+            queue=queue, meeting_id=meeting_id, payload=payload, quiet_sec=quiet_sec
+        )
+        log.info(
+            f"{event_name}_scheduled" if scheduled else f"{event_name}_coalesced",
+            extra={"payload": {"meeting_id": meeting_id, "event_id": payload["event_id"]}},
+        )
+        return
+
+    enqueue(queue, payload)
+    log.info(
+        event_name,
+        extra={"payload": {"meeting_id": meeting_id, "event_id": payload["event_id"]}},
+    )
+
+
+def enqueue_enhancer(*, meeting_id: str, coalesce: bool = True) -> str:
     """
     Поставить задачу улучшения текста.
+
+    coalesce=True: задачи по одной встрече в пределах quiet-периода
+    схлопываются в один запуск.
     """
     event_id = new_event_id("enh")
     payload = {"schema_version": "v1", "event_id": event_id, "meeting_id": meeting_id}
     inject_trace_context(payload, meeting_id=meeting_id, source="queue.enhancer")
-    enqueue(Q_ENHANCER, payload)
-    log.info(
-        "enqueue_enhancer",
-        extra={"payload": {"meeting_id": meeting_id, "event_id": event_id}},
+    _enqueue_meeting_stage(
+        queue=Q_ENHANCER,
+        meeting_id=meeting_id,
+        payload=payload,
+        event_name="enqueue_enhancer",
+        coalesce=coalesce,
     )
     return event_id
 
 
-def enqueue_analytics(*, meeting_id: str) -> str:
+def enqueue_analytics(*, meeting_id: str, coalesce: bool = True) -> str:
     """
     Поставить задачу аналитики/отчёта.
+
+    coalesce=True: задачи по одной встрече в пределах quiet-периода
+    схлопываются в один запуск.
     """
     event_id = new_event_id("anl")
     payload = {"schema_version": "v1", "event_id": event_id, "meeting_id": meeting_id}
     inject_trace_context(payload, meeting_id=meeting_id, source="queue.analytics")
-    enqueue(Q_ANALYTICS, payload)
-    log.info(
-        "enqueue_analytics",
-        extra={"payload": {"meeting_id": meeting_id, "event_id": event_id}},
+    _enqueue_meeting_stage(
+        queue=Q_ANALYTICS,
+        meeting_id=meeting_id,
+        payload=payload,
+        event_name="enqueue_analytics",
+        coalesce=coalesce,
     )
     return event_id
 
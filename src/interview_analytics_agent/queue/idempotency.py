@@ -9,15 +9,24 @@
 Реализация:
 - хранение ключей в Redis с TTL
 - ключ формируется как "<scope>:<meeting_id>:<idempotency_key>"
+- постановка с дедупом в два шага (каждый — один EVALSHA на пачку):
+  reserve_once — SET NX ключей с коротким TTL, commit_once — XADD задач
+  (+ счётчики) и TTL ключа на полный срок. Между ними вызывающий делает
+  работу только для новых ключей (например, пишет blob); при ошибке —
+  release_once, иначе резерв истечёт сам через RESERVE_TTL_SEC
 """
 
 from __future__ import annotations
 
+import json
 import time
+from dataclasses import dataclass
+from typing import Any
 
 from interview_analytics_agent.common.config import get_settings
 
-from .redis import redis_client
+from .redis import async_redis_client, redis_client
+from .streams import PAYLOAD_FIELD
 
 _settings = get_settings()
 _LOCAL_IDEM_KEYS: dict[str, float] = {}
@@ -25,6 +34,69 @@ _LOCAL_IDEM_KEYS: dict[str, float] = {}
 # TTL по умолчанию (сек) для идемпотентных ключей
 DEFAULT_TTL_SEC = 60 * 60 * 24  # 24 часа
 
+# TTL резерва: если процесс упал между reserve_once и commit_once,
+# повтор того же чанка снова пройдёт дедуп после истечения резерва.
+RESERVE_TTL_SEC = 5 * 60
+
+# SET NX каждого ключа пачки. KEYS: idem_1..idem_n; ARGV: ttl
+_RESERVE_ONCE_LUA = """
+local out = {}
+for i = 1, #KEYS do
+  if redis.call('SET', KEYS[i], 'pending', 'NX', 'EX', tonumber(ARGV[1])) then
+    out[i] = 1
+  else
+    out[i] = 0
+  end
+end
+return out
+"""
+
+# Для каждой зарезервированной задачи: ключ на полный TTL, XADD в stream
+# и INCR счётчика (KEYS[1+n+i], если счётчики переданы).
+# KEYS: stream, idem_1..idem_n[, counter_1..counter_n]
+# ARGV: n, idem_ttl, payload field, counter_ttl, payload_1..payload_n
+_COMMIT_ONCE_LUA = """
+local n = tonumber(ARGV[1])
+local counters = #KEYS > n + 1
+for i = 1, n do
+  redis.call('SET', KEYS[1 + i], '1', 'EX', tonumber(ARGV[2]))
+  redis.call('XADD', KEYS[1], '*', ARGV[3], ARGV[4 + i])
+  if counters then
+    redis.call('INCR', KEYS[1 + n + i])
+    redis.call('EXPIRE', KEYS[1 + n + i], tonumber(ARGV[4]))
+  end
+end
+return n
+"""
+
+# (lua, async) -> Script; регистрируется при первом вызове
+_scripts: dict[tuple[str, bool], Any] = {}
+
+
+def _script(lua: str, r: Any, *, is_async: bool = False) -> Any:
+    key = (lua, is_async)
+    if key not in _scripts:
+        _scripts[key] = r.register_script(lua)
+    return _scripts[key]
+
+
+@dataclass(frozen=True)
+class OnceTask:
+    """
+    Задача для reserve_once / commit_once.
+
+    idem_key — полный ключ Redis (см. idem_redis_key);
+    counter_key — счётчик, увеличиваемый при постановке (или None).
+    """
+
+    idem_key: str
+    payload: dict[str, Any]
+    counter_key: str | None = None
+
+
+def idem_redis_key(scope: str, meeting_id: str, idem_key: str) -> str:
+    return f"idem:{scope}:{meeting_id}:{idem_key}"
+
 
 def check_and_set(
     scope: str, meeting_id: str, idem_key: str, ttl_sec: int = DEFAULT_TTL_SEC
@@ -35,19 +107,128 @@ def check_and_set(
 
     Использует SET NX.
     """
-    key = f"idem:{scope}:{meeting_id}:{idem_key}"
+    key = idem_redis_key(scope, meeting_id, idem_key)
     if (_settings.queue_mode or "").strip().lower() == "inline":
-        now = time.monotonic()
-        expires = _LOCAL_IDEM_KEYS.get(key, 0.0)
-        if expires > now:
-            return False
-        _LOCAL_IDEM_KEYS[key] = now + max(1, int(ttl_sec))
-        if len(_LOCAL_IDEM_KEYS) > 20_000:
-            for k, exp in list(_LOCAL_IDEM_KEYS.items()):
-                if exp <= now:
-                    _LOCAL_IDEM_KEYS.pop(k, None)
-        return True
+        return _check_and_set_local(key, ttl_sec)
 
     r = redis_client()
     ok = r.set(name=key, value="1", nx=True, ex=ttl_sec)
     return bool(ok)
+
+
+def _check_and_set_local(key: str, ttl_sec: int) -> bool:
+    now = time.monotonic()
+    expires = _LOCAL_IDEM_KEYS.get(key, 0.0)
+    if expires > now:
+        return False
+    _LOCAL_IDEM_KEYS[key] = now + max(1, int(ttl_sec))
+    if len(_LOCAL_IDEM_KEYS) > 20_000:
+        for k, exp in list(_LOCAL_IDEM_KEYS.items()):
+            if exp <= now:
+                _LOCAL_IDEM_KEYS.pop(k, None)
+    return True
+
+
+def _commit_once_call(
+    stream: str, tasks: list[OnceTask], *, ttl_sec: int, counter_ttl_sec: int
+) -> tuple[list[str], list[Any]]:
+    counters = [t.counter_key for t in tasks]
+    if any(counters) and not all(counters):
+        raise ValueError("counter_key must be set for all tasks or for none")
+    keys = [stream, *(t.idem_key for t in tasks)]
+    if all(counters):
+        keys.extend(counters)
+    args: list[Any] = [
+        len(tasks),
+        max(1, int(ttl_sec)),
+        PAYLOAD_FIELD,
+        max(1, int(counter_ttl_sec)),
+    ]
+    args.extend(json.dumps(t.payload, ensure_ascii=False) for t in tasks)
+    return keys, args
+
+
+def reserve_once(tasks: list[OnceTask], *, ttl_sec: int = RESERVE_TTL_SEC) -> list[bool]:
+    """
+    Дедуп пачки одним EVALSHA: SET NX ключей на ttl_sec.
+
+    Возвращает по флагу на задачу: True — ключ новый (зарезервирован),
+    False — дубликат. Зарезервированные задачи нужно довести commit_once
+    или отпустить release_once.
+    """
+    if not tasks:
+        return []
+    r = redis_client()
+    flags = (
+        _script(_RESERVE_ONCE_LUA, r)(
+            keys=[t.idem_key for t in tasks], args=[max(1, int(ttl_sec))], client=r
+        )
+        or []
+    )
+    return [bool(int(f)) for f in flags]
+
+
+async def reserve_once_async(
+    tasks: list[OnceTask], *, ttl_sec: int = RESERVE_TTL_SEC
+) -> list[bool]:
+    """
+    То же, что reserve_once, через async Redis.
+    """
+    if not tasks:
+        return []
+    r = async_redis_client()
+    flags = (
+        await _script(_RESERVE_ONCE_LUA, r, is_async=True)(
+            keys=[t.idem_key for t in tasks], args=[max(1, int(ttl_sec))], client=r
+        )
+        or []
+    )
+    return [bool(int(f)) for f in flags]
+
+
+def commit_once(
+    stream: str,
+    tasks: list[OnceTask],
+    *,
+    ttl_sec: int = DEFAULT_TTL_SEC,
+    counter_ttl_sec: int = DEFAULT_TTL_SEC,
+) -> None:
+    """
+    Постановка зарезервированных задач в stream одним EVALSHA на всю пачку.
+    """
+    if not tasks:
+        return
+    r = redis_client()
+    keys, args = _commit_once_call(stream, tasks, ttl_sec=ttl_sec, counter_ttl_sec=counter_ttl_sec)
+    _script(_COMMIT_ONCE_LUA, r)(keys=keys, args=args, client=r)
+
+
+async def commit_once_async(
+    stream: str,
+    tasks: list[OnceTask],
+    *,
+    ttl_sec: int = DEFAULT_TTL_SEC,
+    counter_ttl_sec: int = DEFAULT_TTL_SEC,
+) -> None:
+    """
+    То же, что commit_once, через async Redis.
+    """
+    if not tasks:
+        return
+    r = async_redis_client()
+    keys, args = _commit_once_call(stream, tasks, ttl_sec=ttl_sec, counter_ttl_sec=counter_ttl_sec)
+    await _script(_COMMIT_ONCE_LUA, r, is_async=True)(keys=keys, args=args, client=r)
+
+
+def release_once(tasks: list[OnceTask]) -> None:
+    """
+    Снять резерв (работа между reserve_once и commit_once не удалась):
+    повтор тех же задач снова пройдёт дедуп.
+    """
+    if tasks:
+        redis_client().delete(*(t.idem_key for t in tasks))
+
+
+async def release_once_async(tasks: list[OnceTask]) -> None:
+    if tasks:
+        await async_redis_client().delete(*(t.idem_key for t in tasks))
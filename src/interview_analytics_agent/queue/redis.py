@@ -4,16 +4,22 @@ Redis-клиент для очередей и pub/sub.
 Назначение:
 - Единая точка подключения к Redis
 - Используется диспетчером задач и воркерами
+- async_redis_client() — для event loop gateway (async ingest, WebSocket)
 """
 
 from __future__ import annotations
 
+import asyncio
+
 import redis
+import redis.asyncio as aioredis
 
 from interview_analytics_agent.common.config import get_settings
 
 _settings = get_settings()
 _client: redis.Redis | None = None
+_async_client: aioredis.Redis | None = None
+_async_loop: asyncio.AbstractEventLoop | None = None
 
 
 def redis_client() -> redis.Redis:
@@ -24,3 +30,15 @@ def redis_client() -> redis.Redis:
     if _client is None:
         _client = redis.Redis.from_url(_settings.redis_url, decode_responses=True)
     return _client
+
+
+def async_redis_client() -> aioredis.Redis:
+    """
+    Async Redis client текущего event loop (соединения asyncio привязаны к loop).
+    """
+    global _async_client, _async_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_loop is not loop:
+        _async_client = aioredis.Redis.from_url(_settings.redis_url, decode_responses=True)
+        _async_loop = loop
+    return _async_client
@@ -3,36 +3,66 @@ Retry/DLQ утилиты для очередей.
 
 Назначение:
 - аккуратно перекидывать задачи обратно в очередь с ограниченным числом попыток
-- делать простой backoff (sleep) между повторными постановками
+- откладывать повтор без sleep: задача кладётся в sorted set <queue>:retry
+  (score = время, когда её можно снова брать), промоутер переносит созревшие
+  задачи обратно в stream
+- экспоненциальный backoff с jitter, база задаётся на каждую очередь
 - DLQ как отдельный stream <queue>:dlq
 
 Важно:
-- это синхронная реализация (подходит для наших воркеров)
+- requeue_with_backoff никогда не блокирует consumer-поток
+- промоутер запускает WorkerRuntime своей очереди (см. queue.runtime)
 """
 
 from __future__ import annotations
 
-import time
+import random
 from typing import Any
 
+from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.common.logging import get_project_logger
-from interview_analytics_agent.queue.streams import enqueue, stream_dlq_name
+from interview_analytics_agent.common.metrics import QUEUE_RETRY_BACKLOG, QUEUE_RETRY_EVENTS_TOTAL
+from interview_analytics_agent.queue.redis import redis_client
+from interview_analytics_agent.queue.streams import (
+    enqueue,
+    now_ms,
+    promote_due,
+    schedule_at,
+    stream_dlq_name,
+    stream_retry_name,
+)
 
 log = get_project_logger()
 
 
+def backoff_delay_sec(*, attempts: int, base_sec: float, max_sec: float | None = None) -> float:
+    """
+    Экспоненциальный backoff с jitter ("equal jitter"):
+    delay = base * 2^(attempts-1), ограничен max_sec, случайно в [delay/2, delay].
+    """
+    if base_sec <= 0:
+        return 0.0
+    cap = float(max_sec if max_sec is not None else get_settings().queue_retry_max_backoff_sec)
+    delay = min(cap, float(base_sec) * (2 ** max(0, int(attempts) - 1)))
+    return random.uniform(delay / 2.0, delay)
+
+
 def requeue_with_backoff(
     *,
     queue_name: str,
     task_payload: dict[str, Any],
     max_attempts: int = 3,
-    backoff_sec: int = 1,
+    backoff_sec: float = 1,
 ) -> bool:
     """
     Повторно поставить задачу в очередь, увеличивая attempts.
 
+    backoff_sec — база экспоненциального backoff для этой очереди.
+    Задача не ставится сразу: она попадает в <queue>:retry и вернётся в stream,
+    когда созреет (promote_due_retries).
+
     Возвращает:
-    - True: задача поставлена обратно в очередь
+    - True: задача запланирована на повтор
     - False: задача отправлена в DLQ
     """
     attempts = int(task_payload.get("attempts", 0)) + 1
@@ -42,6 +72,7 @@ def requeue_with_backoff(
         # В DLQ — чтобы не зациклиться
         dlq = stream_dlq_name(queue_name)
         enqueue(dlq, task_payload)
+        QUEUE_RETRY_EVENTS_TOTAL.labels(queue=queue_name, event="dlq").inc()
         log.warning(
             "task_moved_to_dlq",
             extra={
@@ -55,11 +86,13 @@ def requeue_with_backoff(
         )
         return False
 
-    # Backoff
-    if backoff_sec and backoff_sec > 0:
-        time.sleep(backoff_sec)
-
-    enqueue(queue_name, task_payload)
+    delay_sec = backoff_delay_sec(attempts=attempts, base_sec=backoff_sec)
+    if delay_sec <= 0:
+        enqueue(queue_name, task_payload)
+    else:
+        due_ms = now_ms() + int(delay_sec * 1000)
+        schedule_at(stream_retry_name(queue_name), task_payload, due_ms)
+    QUEUE_RETRY_EVENTS_TOTAL.labels(queue=queue_name, event="scheduled").inc()
     log.warning(
         "task_requeued",
         extra={
@@ -67,8 +100,30 @@ def requeue_with_backoff(
                 "queue": queue_name,
                 "attempts": attempts,
                 "max_attempts": max_attempts,
-                "backoff_sec": backoff_sec,
+                "backoff_sec": round(delay_sec, 3),
             }
         },
     )
     return True
+
+
+def promote_due_retries(queue_name: str, *, limit: int = 100) -> int:
+    """
+    Перенести созревшие задачи из <queue>:retry обратно в stream.
+
+    Возвращает количество перенесённых задач.
+    """
+    moved = promote_due(zset_key=stream_retry_name(queue_name), stream=queue_name, limit=limit)
+    if moved:
+        QUEUE_RETRY_EVENTS_TOTAL.labels(queue=queue_name, event="promoted").inc(moved)
+        log.info("retry_tasks_promoted", extra={"payload": {"queue": queue_name, "count": moved}})
+    return moved
+
+
+def retry_backlog(queue_name: str) -> int:
+    """
+    Сколько задач очереди ждут повтора.
+    """
+    n = int(redis_client().zcard(stream_retry_name(queue_name)))
+    QUEUE_RETRY_BACKLOG.labels(queue=queue_name).set(n)
+    return n
@@ -0,0 +1,231 @@
+"""
+Общий runtime для stream-воркеров.
+
+Назначение:
+- читать задачи пачками (read_tasks) и выполнять их в пуле потоков
+- ограничивать число задач в работе (concurrency)
+- ACK-ать каждую задачу по её собственному результату (bulk XACK по готовым)
+- в работе держать не больше concurrency задач (read_tasks возвращает не больше
+  count зависших и новых вместе)
+- heartbeat задач в работе (touch_tasks раз в heartbeat_interval_sec): долгая
+  задача не выглядит зависшей, и XAUTOCLAIM других воркеров её не заберёт
+- при SIGTERM/SIGINT перестать читать новые задачи и дождаться текущих
+- в фоне переносить созревшие отложенные ретраи и coalesced-задачи своей очереди в stream
+
+Контракт обработчика:
+- handler(msg) -> bool; True — задачу можно ACK-нуть
+- ретраи/DLQ обработчик делает сам (requeue_with_backoff), как и раньше
+- задачи без ACK остаются в PEL и будут подобраны через XAUTOCLAIM
+"""
+
+from __future__ import annotations
+
+import signal
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import suppress
+
+from interview_analytics_agent.common.logging import get_project_logger
+from interview_analytics_agent.common.metrics import WORKER_INFLIGHT_TASKS
+
+from .coalesce import promote_due_coalesced
+from .retry import promote_due_retries
+from .streams import StreamTask, ack_tasks, read_tasks, touch_tasks
+
+log = get_project_logger()
+
+TaskHandler = Callable[[StreamTask], bool]
+
+_SHUTDOWN = threading.Event()
+
+# Пока в работе есть задачи, не блокируемся на XREADGROUP дольше этого,
+# чтобы вовремя ACK-нуть завершённые.
+_BUSY_BLOCK_MS = 500
+
+# Заметно меньше min_idle_claim_ms read_tasks (60 с), чтобы idle задачи в работе
+# не доходил до порога reclaim; 0 — без heartbeat.
+_HEARTBEAT_INTERVAL_SEC = 15.0
+
+
+def request_shutdown() -> None:
+    _SHUTDOWN.set()
+
+
+def shutdown_requested() -> bool:
+    return _SHUTDOWN.is_set()
+
+
+def install_signal_handlers() -> None:
+    """
+    SIGTERM/SIGINT -> graceful shutdown (только из main thread).
+    """
+
+    def _on_signal(signum, frame) -> None:
+        _ = frame
+        log.warning("worker_shutdown_requested", extra={"payload": {"signal": int(signum)}})
+        request_shutdown()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        with suppress(ValueError):
+            signal.signal(sig, _on_signal)
+
+
+class WorkerRuntime:
+    def __init__(
+        self,
+        *,
+        service: str,
+        stream: str,
+        group: str,
+        consumer: str,
+        handler: TaskHandler,
+        concurrency: int = 1,
+        batch_size: int = 16,
+        block_ms: int = 5000,
+        shutdown_grace_sec: float = 30.0,
+        retry_poll_interval_sec: float = 1.0,
+        heartbeat_interval_sec: float = _HEARTBEAT_INTERVAL_SEC,
+    ) -> None:
+        self.service = service
+        self.stream = stream
+        self.group = group
+        self.consumer = consumer
+        self.handler = handler
+        self.concurrency = max(1, int(concurrency))
+        self.batch_size = max(1, int(batch_size))
+        self.block_ms = max(0, int(block_ms))
+        self.shutdown_grace_sec = max(0.0, float(shutdown_grace_sec))
+        self.retry_poll_interval_sec = max(0.0, float(retry_poll_interval_sec))
+        self.heartbeat_interval_sec = max(0.0, float(heartbeat_interval_sec))
+        self._last_heartbeat = time.monotonic()
+        # все слоты заняты — просыпаемся хотя бы к очередному heartbeat
+        self._idle_wait_sec = min(1.0, self.heartbeat_interval_sec or 1.0)
+        self._inflight: dict[Future, StreamTask] = {}
+        self._stopped = threading.Event()
+
+    def _run_one(self, msg: StreamTask) -> bool:
+        try:
+            return bool(self.handler(msg))
+        except Exception as e:
+            # обработчики сами ловят ошибки; сюда попадает только то, что "протекло"
+            log.error(
+                "worker_task_unhandled_error",
+                extra={
+                    "payload": {
+                        "service": self.service,
+                        "entry_id": msg.entry_id,
+                        "err": str(e)[:200],
+                    }
+                },
+            )
+            return False
+
+    def _reap(self, done: set[Future] | None = None) -> None:
+        if done is None:
+            done = {f for f in self._inflight if f.done()}
+        if not done:
+            return
+        ack_ids: list[str] = []
+        for fut in done:
+            msg = self._inflight.pop(fut)
+            if not fut.cancelled() and fut.result():
+                ack_ids.append(msg.entry_id)
+        WORKER_INFLIGHT_TASKS.labels(service=self.service).set(len(self._inflight))
+        if ack_ids:
+            with suppress(Exception):
+                ack_tasks(stream=self.stream, group=self.group, entry_ids=ack_ids)
+
+    def _submit(self, pool: ThreadPoolExecutor, msgs: list[StreamTask]) -> None:
+        for msg in msgs:
+            self._inflight[pool.submit(self._run_one, msg)] = msg
+        WORKER_INFLIGHT_TASKS.labels(service=self.service).set(len(self._inflight))
+
+    def _heartbeat(self) -> None:
+        if not self._inflight or self.heartbeat_interval_sec <= 0:
+            return
+        now = time.monotonic()
+        if now - self._last_heartbeat < self.heartbeat_interval_sec:
+            return
+        self._last_heartbeat = now
+        try:
+            touch_tasks(
+                stream=self.stream,
+                group=self.group,
+                consumer=self.consumer,
+                entry_ids=[msg.entry_id for msg in self._inflight.values()],
+            )
+        except Exception as e:
+            log.warning(
+                "worker_heartbeat_failed",
+                extra={"payload": {"service": self.service, "err": str(e)[:200]}},
+            )
+
+    def _promote_loop(self) -> None:
+        while not self._stopped.is_set() and not shutdown_requested():
+            try:
+                promote_due_retries(self.stream)
+                promote_due_coalesced(self.stream)
+            except Exception as e:
+                log.warning(
+                    "retry_promote_failed",
+                    extra={"payload": {"queue": self.stream, "err": str(e)[:200]}},
+                )
+            self._stopped.wait(self.retry_poll_interval_sec)
+
+    def _drain(self, pool: ThreadPoolExecutor) -> None:
+        pending = set(self._inflight)
+        if pending:
+            log.info(
+                "worker_draining",
+                extra={"payload": {"service": self.service, "inflight": len(pending)}},
+            )
+            done, _ = wait(pending, timeout=self.shutdown_grace_sec)
+            self._reap(done)
+        # Не успевшие задачи остаются без ACK и будут переобработаны через XAUTOCLAIM.
+        pool.shutdown(wait=False, cancel_futures=True)
+        if self._inflight:
+            log.warning(
+                "worker_drain_timeout",
+                extra={"payload": {"service": self.service, "unacked": len(self._inflight)}},
+            )
+
+    def run(self) -> None:
+        """
+        Крутить цикл до request_shutdown(), затем дождаться задач в работе.
+        """
+        pool = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix=f"{self.service}-task"
+        )
+        if self.retry_poll_interval_sec > 0:
+            threading.Thread(
+                target=self._promote_loop, name=f"{self.service}-retry", daemon=True
+            ).start()
+        try:
+            while not shutdown_requested():
+                self._reap()
+                self._heartbeat()
+
+                free = self.concurrency - len(self._inflight)
+                if free <= 0:
+                    wait(
+                        set(self._inflight),
+                        timeout=self._idle_wait_sec,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    continue
+
+                block_ms = min(self.block_ms, _BUSY_BLOCK_MS) if self._inflight else self.block_ms
+                msgs = read_tasks(
+                    stream=self.stream,
+                    group=self.group,
+                    consumer=self.consumer,
+                    count=min(self.batch_size, free),
+                    block_ms=block_ms,
+                )
+                if msgs:
+                    self._submit(pool, msgs)
+        finally:
+            self._stopped.set()
+            self._drain(pool)
@@ -3,9 +3,13 @@ Redis Streams utilities for task queues.
 
 Features:
 - XADD producer API
-- consumer groups with auto-create
-- ACK support
+- consumer groups with auto-create (cached per process)
+- ACK support (single and bulk)
 - auto-claim for stale pending tasks
+- batched reads: XAUTOCLAIM + XREADGROUP in one script round-trip,
+  at most count entries in total
+- heartbeat for in-flight entries (XCLAIM JUSTID resets idle time)
+- delayed entries: sorted set (score = due time) promoted into the stream
 """
 
 from __future__ import annotations
@@ -13,15 +17,25 @@ from __future__ import annotations
 import json
 import os
 import socket
+import time
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 import redis
 
+from interview_analytics_agent.common.logging import get_project_logger
+
 from .redis import redis_client
 
-_PAYLOAD_FIELD = "payload"
+log = get_project_logger()
+
+PAYLOAD_FIELD = "payload"
 _GROUP_ERR_PREFIX = "BUSYGROUP"
+_NOGROUP_ERR_PREFIX = "NOGROUP"
+
+# (stream, group), для которых XGROUP CREATE уже выполнен в этом процессе.
+_READY_GROUPS: set[tuple[str, str]] = set()
 
 
 @dataclass(frozen=True)
@@ -41,7 +55,26 @@ def stream_dlq_name(stream: str) -> str:
     return f"{stream}:dlq"
 
 
-def ensure_group(stream: str, group: str) -> None:
+def stream_retry_name(stream: str) -> str:
+    # sorted set отложенных ретраев (score = due time, ms)
+    return f"{stream}:retry"
+
+
+def stream_delayed_name(stream: str) -> str:
+    # sorted set отложенных (coalesced) задач (score = due time, ms)
+    return f"{stream}:delayed"
+
+
+def ensure_group(stream: str, group: str, *, force: bool = False) -> None:
+    """
+    Создать consumer group (идемпотентно).
+
+    Результат кешируется на процесс: повторные вызовы не ходят в Redis,
+    пока кеш не сброшен (force=True или NOGROUP при чтении).
+    """
+    key = (stream, group)
+    if not force and key in _READY_GROUPS:
+        return
     r = redis_client()
     try:
         # id=0 позволяет забирать pending при восстановлении.
@@ -49,21 +82,115 @@ def ensure_group(stream: str, group: str) -> None:
     except redis.ResponseError as e:
         if _GROUP_ERR_PREFIX not in str(e):
             raise
+    _READY_GROUPS.add(key)
+
+
+def _is_nogroup(err: Exception) -> bool:
+    return isinstance(err, redis.ResponseError) and _NOGROUP_ERR_PREFIX in str(err)
 
 
 def enqueue(stream: str, payload: dict[str, Any]) -> str:
     raw = json.dumps(payload, ensure_ascii=False)
-    return str(redis_client().xadd(stream, {_PAYLOAD_FIELD: raw}))
+    return str(redis_client().xadd(stream, {PAYLOAD_FIELD: raw}))
+
+
+# Атомарно: забрать созревшие записи из ZSET и XADD их в stream.
+# Несколько промоутеров одной очереди не продублируют задачу.
+_PROMOTE_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+for _, raw in ipairs(due) do
+  redis.call('XADD', KEYS[2], '*', ARGV[3], raw)
+  redis.call('ZREM', KEYS[1], raw)
+end
+return #due
+"""
+
+_promote_script = None
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def schedule_at(zset_key: str, payload: dict[str, Any], due_ms: int) -> None:
+    """
+    Отложить задачу: она попадёт в stream, когда promote_due увидит due_ms <= now.
+    """
+    raw = json.dumps(payload, ensure_ascii=False)
+    redis_client().zadd(zset_key, {raw: int(due_ms)})
+
+
+def promote_due(*, zset_key: str, stream: str, limit: int = 100) -> int:
+    """
+    Перенести созревшие записи из sorted set в stream (один EVALSHA).
+
+    Возвращает количество перенесённых задач.
+    """
+    global _promote_script
+    r = redis_client()
+    if _promote_script is None:
+        _promote_script = r.register_script(_PROMOTE_LUA)
+    return int(
+        _promote_script(
+            keys=[zset_key, stream],
+            args=[now_ms(), max(1, int(limit)), PAYLOAD_FIELD],
+            client=r,
+        )
+        or 0
+    )
 
 
 def _parse_entry(stream: str, entry_id: str, fields: dict[str, Any]) -> StreamTask:
-    raw = fields.get(_PAYLOAD_FIELD)
+    raw = fields.get(PAYLOAD_FIELD)
     if raw is None:
-        raise ValueError(f"Missing '{_PAYLOAD_FIELD}' in stream entry")
+        raise ValueError(f"Missing '{PAYLOAD_FIELD}' in stream entry")
     payload = json.loads(raw)
     return StreamTask(stream=stream, entry_id=str(entry_id), payload=payload)
 
 
+def _parse_entries(*, stream: str, group: str, entries: list[Any] | None) -> list[StreamTask]:
+    """
+    Разобрать пачку записей stream.
+
+    Битые записи (нет payload / невалидный JSON) не могут быть обработаны никогда,
+    поэтому логируем и сразу ACK-аем их, чтобы они не крутились через XAUTOCLAIM.
+    """
+    tasks: list[StreamTask] = []
+    broken: list[str] = []
+    for entry_id, fields in entries or []:
+        if fields is None:
+            # запись удалена из stream (XDEL/XTRIM), но осталась в PEL
+            broken.append(str(entry_id))
+            continue
+        try:
+            tasks.append(_parse_entry(stream, str(entry_id), fields))
+        except (ValueError, TypeError) as e:
+            broken.append(str(entry_id))
+            log.warning(
+                "stream_entry_malformed",
+                extra={
+                    "payload": {"stream": stream, "entry_id": str(entry_id), "err": str(e)[:200]}
+                },
+            )
+    if broken:
+        ack_tasks(stream=stream, group=group, entry_ids=broken)
+    return tasks
+
+
+def _entries_from_xreadgroup(rows: Any) -> list[Any]:
+    if not rows:
+        return []
+    _, entries = rows[0]
+    return list(entries or [])
+
+
+def _entries_from_xautoclaim(res: Any) -> list[Any]:
+    # Redis >= 7: [next_id, claimed, deleted]; Redis 6.2: [next_id, claimed]
+    if not res or len(res) < 2:
+        return []
+    return list(res[1] or [])
+
+
 def _read_new(stream: str, group: str, consumer: str, block_ms: int) -> StreamTask | None:
     r = redis_client()
     rows = r.xreadgroup(
@@ -73,13 +200,8 @@ def _read_new(stream: str, group: str, consumer: str, block_ms: int) -> StreamTa
         count=1,
         block=block_ms,
     )
-    if not rows:
-        return None
-    _, entries = rows[0]
-    if not entries:
-        return None
-    entry_id, fields = entries[0]
-    return _parse_entry(stream, str(entry_id), fields)
+    tasks = _parse_entries(stream=stream, group=group, entries=_entries_from_xreadgroup(rows))
+    return tasks[0] if tasks else None
 
 
 def _claim_stale(
@@ -89,7 +211,7 @@ def _claim_stale(
     min_idle_ms: int,
 ) -> StreamTask | None:
     r = redis_client()
-    next_id, claimed, _ = r.xautoclaim(
+    res = r.xautoclaim(
         name=stream,
         groupname=group,
         consumername=consumer,
@@ -97,11 +219,8 @@ def _claim_stale(
         start_id="0-0",
         count=1,
     )
-    _ = next_id
-    if not claimed:
-        return None
-    entry_id, fields = claimed[0]
-    return _parse_entry(stream, str(entry_id), fields)
+    tasks = _parse_entries(stream=stream, group=group, entries=_entries_from_xautoclaim(res))
+    return tasks[0] if tasks else None
 
 
 def read_task(
@@ -114,18 +233,147 @@ def read_task(
 ) -> StreamTask | None:
     ensure_group(stream, group)
 
-    # Сначала подбираем "зависшие" pending, потом берём новые.
-    stale = _claim_stale(
-        stream=stream,
-        group=group,
-        consumer=consumer,
-        min_idle_ms=min_idle_claim_ms,
+    try:
+        # Сначала подбираем "зависшие" pending, потом берём новые.
+        stale = _claim_stale(
+            stream=stream,
+            group=group,
+            consumer=consumer,
+            min_idle_ms=min_idle_claim_ms,
+        )
+        if stale:
+            return stale
+
+        return _read_new(stream=stream, group=group, consumer=consumer, block_ms=block_ms)
+    except redis.ResponseError as e:
+        # stream/group удалили снаружи — сбрасываем кеш, следующий poll пересоздаст группу
+        if _is_nogroup(e):
+            _READY_GROUPS.discard((stream, group))
+            return None
+        raise
+
+
+# Атомарно и за один round-trip: XAUTOCLAIM зависших, затем XREADGROUP новых
+# на остаток — в сумме не больше ARGV[4] записей.
+_READ_BATCH_LUA = """
+local claimed = redis.call('XAUTOCLAIM', KEYS[1], ARGV[1], ARGV[2], ARGV[3], '0-0', 'COUNT', ARGV[4])
+local stale = claimed[2]
+local fresh = {}
+local left = tonumber(ARGV[4]) - #stale
+if left > 0 then
+  local rows = redis.call('XREADGROUP', 'GROUP', ARGV[1], ARGV[2], 'COUNT', left, 'STREAMS', KEYS[1], '>')
+  if rows then
+    fresh = rows[1][2]
+  end
+end
+return {stale, fresh}
+"""
+
+_read_batch_script = None
+
+
+def _entries_from_script(rows: Any) -> list[Any]:
+    # ответ скрипта без callback-ов redis-py: поля записи — плоский список [f1, v1, ...]
+    entries: list[Any] = []
+    for entry_id, flat in rows or []:
+        fields = None if flat is None else dict(zip(flat[::2], flat[1::2], strict=False))
+        entries.append((entry_id, fields))
+    return entries
+
+
+def _read_batch(
+    *,
+    stream: str,
+    group: str,
+    consumer: str,
+    count: int,
+    block_ms: int,
+    min_idle_claim_ms: int,
+) -> list[StreamTask]:
+    global _read_batch_script
+    r = redis_client()
+    if _read_batch_script is None:
+        _read_batch_script = r.register_script(_READ_BATCH_LUA)
+
+    stale, fresh = _read_batch_script(
+        keys=[stream],
+        args=[group, consumer, int(min_idle_claim_ms), int(count)],
+        client=r,
     )
-    if stale:
-        return stale
+    entries = _entries_from_script(stale) + _entries_from_script(fresh)
+    if not entries and block_ms > 0:
+        # Очередь пуста — ждём новые записи блокирующим чтением (в Lua BLOCK недоступен).
+        rows = r.xreadgroup(
+            groupname=group,
+            consumername=consumer,
+            streams={stream: ">"},
+            count=count,
+            block=block_ms,
+        )
+        entries = _entries_from_xreadgroup(rows)
 
-    return _read_new(stream=stream, group=group, consumer=consumer, block_ms=block_ms)
+    return _parse_entries(stream=stream, group=group, entries=entries)
+
+
+def read_tasks(
+    *,
+    stream: str,
+    group: str,
+    consumer: str,
+    count: int = 16,
+    block_ms: int = 5000,
+    min_idle_claim_ms: int = 60_000,
+) -> list[StreamTask]:
+    """
+    Прочитать пачку задач из stream.
+
+    Возвращает не больше count задач: сначала "зависшие" (XAUTOCLAIM),
+    остаток — новые. Все они уже в PEL этого consumer'а, поэтому каждую нужно
+    либо ACK-нуть, либо оставить на reclaim; пока задача в работе, её idle
+    сбрасывает touch_tasks.
+    Пустой список — за block_ms ничего не пришло.
+    """
+    count = max(1, int(count))
+    ensure_group(stream, group)
+    try:
+        return _read_batch(
+            stream=stream,
+            group=group,
+            consumer=consumer,
+            count=count,
+            block_ms=block_ms,
+            min_idle_claim_ms=min_idle_claim_ms,
+        )
+    except redis.ResponseError as e:
+        if _is_nogroup(e):
+            _READY_GROUPS.discard((stream, group))
+            return []
+        raise
 
 
 def ack_task(*, stream: str, group: str, entry_id: str) -> int:
     return int(redis_client().xack(stream, group, entry_id))
+
+
+def ack_tasks(*, stream: str, group: str, entry_ids: Iterable[str]) -> int:
+    """
+    ACK пачки задач одним XACK.
+    """
+    ids = [str(x) for x in entry_ids]
+    if not ids:
+        return 0
+    return int(redis_client().xack(stream, group, *ids))
+
+
+def touch_tasks(*, stream: str, group: str, consumer: str, entry_ids: Iterable[str]) -> int:
+    """
+    Heartbeat задач в работе: XCLAIM ... JUSTID на себя сбрасывает idle,
+    и XAUTOCLAIM других consumer-ов не заберёт долгую задачу.
+    """
+    ids = [str(x) for x in entry_ids]
+    if not ids:
+        return 0
+    res = redis_client().xclaim(
+        stream, group, consumer, min_idle_time=0, message_ids=ids, justid=True
+    )
+    return len(res or [])
@@ -394,6 +394,7 @@ def transcribe_with_local_whisper(
 ) -> str:
     from interview_analytics_agent.stt.whisper_local import WhisperLocalProvider
 
+    # модель берётся из пула процесса (stt.model_pool): повторные вызовы не грузят её заново
     provider = WhisperLocalProvider(model_size=model_size, language=language)
     audio_bytes = audio_path.read_bytes()
     result = provider.transcribe_chunk(audio=audio_bytes, sample_rate=16000)
@@ -4,20 +4,47 @@
 Используется в:
 - HTTP ingest endpoints
 - WebSocket ingest
-- внутренний live-ingest коннектора
+- внутренний live-ingest коннектора (ingest_audio_chunks_bulk — пачкой)
+
+Вне inline-режима (на пачку — два EVALSHA, queue.idempotency):
+- сначала дедуп: reserve_once (SET NX idem с коротким TTL)
+- blob пишется только для новых чанков и до постановки (воркер читает его
+  сразу после XADD): повтор чанка не трогает blob уже принятого
+- затем commit_once: XADD в q:stt и flow:inflight:<meeting_id>
+- не удалась запись blob или постановка — резерв снимается (release_once),
+  повтор чанка пройдёт заново
+
+ingest_audio_chunk_bytes_async — для event loop (WebSocket): async Redis,
+запись blob и inline-обработка в пуле потоков.
 """
 
 from __future__ import annotations
 
+import asyncio
+from contextlib import suppress
 from dataclasses import dataclass
 
 from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.common.ids import new_idempotency_key
+from interview_analytics_agent.common.logging import get_project_logger
 from interview_analytics_agent.common.utils import b64_decode
-from interview_analytics_agent.queue.dispatcher import enqueue_stt
-from interview_analytics_agent.queue.idempotency import check_and_set
+from interview_analytics_agent.queue.dispatcher import Q_STT, stt_payload
+from interview_analytics_agent.queue.idempotency import (
+    OnceTask,
+    check_and_set,
+    commit_once,
+    commit_once_async,
+    idem_redis_key,
+    release_once,
+    release_once_async,
+    reserve_once,
+    reserve_once_async,
+)
+from interview_analytics_agent.services.flow_control import INFLIGHT_TTL_SEC, inflight_key
 from interview_analytics_agent.services.local_pipeline import process_chunk_inline
-from interview_analytics_agent.storage.blob import put_bytes
+from interview_analytics_agent.storage.blob import put_bytes, put_bytes_async
+
+log = get_project_logger()
 
 
 @dataclass
@@ -31,6 +58,126 @@ class ChunkIngestResult:
     inline_updates: list[dict] | None = None
 
 
+@dataclass(frozen=True)
+class ChunkIngestItem:
+    seq: int
+    audio_bytes: bytes
+    idempotency_key: str | None = None
+
+
+def _blob_key(meeting_id: str, seq: int) -> str:
+    return f"meetings/{meeting_id}/chunks/{seq}.bin"
+
+
+def _inline_mode() -> bool:
+    return (get_settings().queue_mode or "").strip().lower() == "inline"
+
+
+def _result(
+    meeting_id: str,
+    seq: int,
+    idem_key: str,
+    *,
+    is_duplicate: bool,
+    inline_updates: list[dict] | None = None,
+) -> ChunkIngestResult:
+    return ChunkIngestResult(
+        accepted=True,
+        meeting_id=meeting_id,
+        seq=seq,
+        idempotency_key=idem_key,
+        blob_key=_blob_key(meeting_id, seq),
+        is_duplicate=is_duplicate,
+        inline_updates=inline_updates or [],
+    )
+
+
+def _stt_task(meeting_id: str, seq: int, idem_key: str, scope: str) -> OnceTask:
+    return OnceTask(
+        idem_key=idem_redis_key(scope, meeting_id, idem_key),
+        payload=stt_payload(
+            meeting_id=meeting_id, chunk_seq=seq, blob_key=_blob_key(meeting_id, seq)
+        ),
+        counter_key=inflight_key(meeting_id),
+    )
+
+
+def _log_enqueued(tasks: list[OnceTask], enqueued: list[bool]) -> None:
+    for task, ok in zip(tasks, enqueued, strict=True):
+        if ok:
+            log.info(
+                "enqueue_stt",
+                extra={
+                    "payload": {
+                        "meeting_id": task.payload["meeting_id"],
+                        "chunk_seq": task.payload["chunk_seq"],
+                        "event_id": task.payload["event_id"],
+                    }
+                },
+            )
+
+
+def _ingest_inline(
+    *, meeting_id: str, seq: int, audio_bytes: bytes, idem_key: str, scope: str
+) -> ChunkIngestResult:
+    if not check_and_set(scope, meeting_id, idem_key):
+        return _result(meeting_id, seq, idem_key, is_duplicate=True)
+    blob_key = _blob_key(meeting_id, seq)
+    put_bytes(blob_key, audio_bytes)
+    inline_updates = process_chunk_inline(
+        meeting_id=meeting_id,
+        chunk_seq=seq,
+        audio_bytes=audio_bytes,
+        blob_key=blob_key,
+    )
+    return _result(meeting_id, seq, idem_key, is_duplicate=False, inline_updates=inline_updates)
+
+
+def ingest_audio_chunks_bulk(
+    *,
+    meeting_id: str,
+    chunks: list[ChunkIngestItem],
+    idempotency_scope: str = "audio_chunk_http",
+    idempotency_prefix: str = "http-chunk",
+) -> list[ChunkIngestResult]:
+    """
+    Пачка чанков одной встречи: два EVALSHA на всю пачку (резерв + постановка)
+    вместо SET NX + XADD + INCR на каждый чанк. Результаты — в порядке chunks.
+    """
+    idem_keys = [c.idempotency_key or new_idempotency_key(idempotency_prefix) for c in chunks]
+    if _inline_mode():
+        return [
+            _ingest_inline(
+                meeting_id=meeting_id,
+                seq=c.seq,
+                audio_bytes=c.audio_bytes,
+                idem_key=k,
+                scope=idempotency_scope,
+            )
+            for c, k in zip(chunks, idem_keys, strict=True)
+        ]
+
+    tasks = [
+        _stt_task(meeting_id, c.seq, k, idempotency_scope)
+        for c, k in zip(chunks, idem_keys, strict=True)
+    ]
+    enqueued = reserve_once(tasks)
+    accepted = [(c, t) for c, t, ok in zip(chunks, tasks, enqueued, strict=True) if ok]
+    try:
+        for c, _ in accepted:
+            put_bytes(_blob_key(meeting_id, c.seq), c.audio_bytes)
+        commit_once(Q_STT, [t for _, t in accepted], counter_ttl_sec=INFLIGHT_TTL_SEC)
+    except Exception:
+        with suppress(Exception):
+            release_once([t for _, t in accepted])
+        raise
+    _log_enqueued(tasks, enqueued)
+    return [
+        _result(meeting_id, c.seq, k, is_duplicate=not ok)
+        for c, k, ok in zip(chunks, idem_keys, enqueued, strict=True)
+    ]
+
+
 def ingest_audio_chunk_bytes(
     *,
     meeting_id: str,
@@ -40,41 +187,54 @@ def ingest_audio_chunk_bytes(
     idempotency_scope: str = "audio_chunk_http",
     idempotency_prefix: str = "http-chunk",
 ) -> ChunkIngestResult:
-    settings = get_settings()
-    idem_key = idempotency_key or new_idempotency_key(idempotency_prefix)
-    blob_key = f"meetings/{meeting_id}/chunks/{seq}.bin"
+    [result] = ingest_audio_chunks_bulk(
+        meeting_id=meeting_id,
+        chunks=[ChunkIngestItem(seq=seq, audio_bytes=audio_bytes, idempotency_key=idempotency_key)],
+        idempotency_scope=idempotency_scope,
+        idempotency_prefix=idempotency_prefix,
+    )
+    return result
 
-    if not check_and_set(idempotency_scope, meeting_id, idem_key):
-        return ChunkIngestResult(
-            accepted=True,
-            meeting_id=meeting_id,
-            seq=seq,
-            idempotency_key=idem_key,
-            blob_key=blob_key,
-            is_duplicate=True,
-            inline_updates=[],
-        )
 
-    put_bytes(blob_key, audio_bytes)
-    inline_updates: list[dict] | None = None
-    if (settings.queue_mode or "").strip().lower() == "inline":
-        inline_updates = process_chunk_inline(
+async def ingest_audio_chunk_bytes_async(
+    *,
+    meeting_id: str,
+    seq: int,
+    audio_bytes: bytes,
+    idempotency_key: str | None = None,
+    idempotency_scope: str = "audio_chunk_http",
+    idempotency_prefix: str = "http-chunk",
+) -> ChunkIngestResult:
+    idem_key = idempotency_key or new_idempotency_key(idempotency_prefix)
+    if _inline_mode():
+        return await asyncio.to_thread(
+            _ingest_inline,
             meeting_id=meeting_id,
-            chunk_seq=seq,
+            seq=seq,
             audio_bytes=audio_bytes,
-            blob_key=blob_key,
+            idem_key=idem_key,
+            scope=idempotency_scope,
         )
-    else:
-        enqueue_stt(meeting_id=meeting_id, chunk_seq=seq, blob_key=blob_key)
-    return ChunkIngestResult(
-        accepted=True,
-        meeting_id=meeting_id,
-        seq=seq,
-        idempotency_key=idem_key,
-        blob_key=blob_key,
-        is_duplicate=False,
-        inline_updates=inline_updates or [],
-    )
+
+    tasks = [_stt_task(meeting_id, seq, idem_key, idempotency_scope)]
+    enqueued = await reserve_once_async(tasks)
+    if enqueued[0]:
+        try:
+            await put_bytes_async(_blob_key(meeting_id, seq), audio_bytes)
+            await commit_once_async(Q_STT, tasks, counter_ttl_sec=INFLIGHT_TTL_SEC)
+        except Exception:
+            with suppress(Exception):
+                await release_once_async(tasks)
+            raise
+    _log_enqueued(tasks, enqueued)
+    return _result(meeting_id, seq, idem_key, is_duplicate=not enqueued[0])
+
+
+def decode_chunk_b64(content_b64: str) -> bytes:
+    try:
+        return b64_decode(content_b64)
+    except Exception as e:
+        raise ValueError("content_b64 decode failed") from e
 
 
 def ingest_audio_chunk_b64(
@@ -86,14 +246,10 @@ def ingest_audio_chunk_b64(
     idempotency_scope: str = "audio_chunk_http",
     idempotency_prefix: str = "http-chunk",
 ) -> ChunkIngestResult:
-    try:
-        audio_bytes = b64_decode(content_b64)
-    except Exception as e:
-        raise ValueError("content_b64 decode failed") from e
     return ingest_audio_chunk_bytes(
         meeting_id=meeting_id,
         seq=seq,
-        audio_bytes=audio_bytes,
+        audio_bytes=decode_chunk_b64(content_b64),
         idempotency_key=idempotency_key,
         idempotency_scope=idempotency_scope,
         idempotency_prefix=idempotency_prefix,
@@ -0,0 +1,185 @@
+"""
+Credit-based flow control для realtime ingest аудио.
+
+Назначение:
+- gateway отвечает на каждый чанк окном кредитов: сколько ещё чанков клиент
+  может отправить, не дожидаясь следующего ack
+- окно сужается до 0, когда STT не успевает:
+  - общий backlog q:stt (ещё не выданные воркерам + pending в g:stt)
+  - чанки встречи в работе (flow:inflight:<meeting_id>: +1 в скрипте постановки
+    chunk_ingest_service, -1 в worker_stt)
+- клиенты (WS с согласованным subprotocol, live-pull коннектора) подстраивают
+  темп отправки/размер пачки; при credits=0 ждут retry_after_ms
+
+Формула:
+    credits = min(window,
+                  floor(window * (1 - backlog / high_water)),
+                  meeting_max_inflight - inflight)
+
+В QUEUE_MODE=inline очередей нет: всегда полное окно.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+
+from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.common.logging import get_project_logger
+from interview_analytics_agent.common.metrics import (
+    INGEST_THROTTLED_MEETINGS,
+    INGEST_THROTTLED_TOTAL,
+)
+from interview_analytics_agent.queue.redis import async_redis_client, redis_client
+
+log = get_project_logger()
+
+_INFLIGHT_PREFIX = "flow:inflight:"
+INFLIGHT_TTL_SEC = 3600
+_STT_STREAM = "q:stt"
+_STT_GROUP = "g:stt"
+# backlog q:stt читаем не чаще раза в _BACKLOG_CACHE_SEC на процесс
+_BACKLOG_CACHE_SEC = 0.5
+# задушенный клиент переспрашивает кредиты через retry_after_ms; встреча, не
+# спросившая дольше _THROTTLED_TTL_SEC, закончилась или отключилась
+_THROTTLED_TTL_SEC = 30.0
+
+_backlog_cache: dict[str, float] = {"ts": 0.0, "value": 0.0}
+# meeting_id -> monotonic-момент, после которого запись считается устаревшей
+_throttled: dict[str, float] = {}
+_throttled_lock = threading.Lock()
+
+
+@dataclass
+class IngestCredits:
+    credits: int
+    throttled: bool
+    queue_backlog: int
+    meeting_inflight: int
+    retry_after_ms: int = 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _inline_mode() -> bool:
+    return (get_settings().queue_mode or "").strip().lower() == "inline"
+
+
+def inflight_key(meeting_id: str) -> str:
+    return f"{_INFLIGHT_PREFIX}{meeting_id}"
+
+
+def compute_credits(*, queue_backlog: int, meeting_inflight: int) -> IngestCredits:
+    s = get_settings()
+    window = max(1, int(s.ingest_credit_window))
+    high_water = max(1, int(s.ingest_queue_high_water))
+    global_free = max(0.0, 1.0 - float(queue_backlog) / float(high_water))
+    meeting_free = max(0, int(s.ingest_meeting_max_inflight) - int(meeting_inflight))
+    credits = max(0, min(window, math.floor(window * global_free), meeting_free))
+    throttled = credits == 0
+    return IngestCredits(
+        credits=credits,
+        throttled=throttled,
+        queue_backlog=int(queue_backlog),
+        meeting_inflight=int(meeting_inflight),
+        retry_after_ms=int(s.ingest_throttle_retry_ms) if throttled else 0,
+    )
+
+
+def _backlog_from_groups(groups) -> int:
+    for group in groups or []:
+        if str(group.get("name")) != _STT_GROUP:
+            continue
+        # lag есть только в Redis >= 7; без него считаем по pending
+        return int(group.get("pending") or 0) + int(group.get("lag") or 0)
+    return 0
+
+
+def _cached_backlog() -> float | None:
+    if time.monotonic() - _backlog_cache["ts"] < _BACKLOG_CACHE_SEC:
+        return _backlog_cache["value"]
+    return None
+
+
+def _store_backlog(value: int) -> None:
+    _backlog_cache["ts"] = time.monotonic()
+    _backlog_cache["value"] = float(value)
+
+
+def _drop_expired_throttled(now: float) -> None:
+    for meeting_id in [m for m, deadline in _throttled.items() if deadline <= now]:
+        del _throttled[meeting_id]
+
+
+def _track_throttled(meeting_id: str, credits: IngestCredits, *, source: str) -> IngestCredits:
+    now = time.monotonic()
+    with _throttled_lock:
+        if credits.throttled:
+            _throttled[meeting_id] = now + _THROTTLED_TTL_SEC
+        else:
+            _throttled.pop(meeting_id, None)
+        _drop_expired_throttled(now)
+        INGEST_THROTTLED_MEETINGS.set(len(_throttled))
+    if credits.throttled:
+        INGEST_THROTTLED_TOTAL.labels(source=source).inc()
+    return credits
+
+
+def ingest_credits(meeting_id: str, *, source: str = "http") -> IngestCredits:
+    if _inline_mode():
+        return compute_credits(queue_backlog=0, meeting_inflight=0)
+    r = redis_client()
+    try:
+        backlog = _cached_backlog()
+        if backlog is None:
+            backlog = _backlog_from_groups(r.xinfo_groups(_STT_STREAM))
+            _store_backlog(int(backlog))
+        inflight = int(r.get(inflight_key(meeting_id)) or 0)
+    except Exception as e:
+        # без данных о нагрузке не душим клиента
+        log.warning("flow_control_unavailable", extra={"payload": {"err": str(e)[:200]}})
+        backlog, inflight = 0, 0
+    credits = compute_credits(queue_backlog=int(backlog), meeting_inflight=inflight)
+    return _track_throttled(meeting_id, credits, source=source)
+
+
+async def ingest_credits_async(meeting_id: str, *, source: str = "ws") -> IngestCredits:
+    if _inline_mode():
+        return compute_credits(queue_backlog=0, meeting_inflight=0)
+    r = async_redis_client()
+    try:
+        backlog = _cached_backlog()
+        if backlog is None:
+            backlog = _backlog_from_groups(await r.xinfo_groups(_STT_STREAM))
+            _store_backlog(int(backlog))
+        inflight = int(await r.get(inflight_key(meeting_id)) or 0)
+    except Exception as e:
+        log.warning("flow_control_unavailable", extra={"payload": {"err": str(e)[:200]}})
+        backlog, inflight = 0, 0
+    credits = compute_credits(queue_backlog=int(backlog), meeting_inflight=inflight)
+    return _track_throttled(meeting_id, credits, source=source)
+
+
+def forget_meeting(meeting_id: str) -> None:
+    """
+    Клиент встречи отключился: встреча больше не считается задушенной.
+    """
+    with _throttled_lock:
+        _throttled.pop(meeting_id, None)
+        _drop_expired_throttled(time.monotonic())
+        INGEST_THROTTLED_MEETINGS.set(len(_throttled))
+
+
+def note_chunk_done(meeting_id: str) -> None:
+    """
+    worker_stt: чанк распознан (или окончательно отброшен).
+    """
+    try:
+        r = redis_client()
+        if int(r.decr(inflight_key(meeting_id))) < 0:
+            r.set(inflight_key(meeting_id), 0, ex=INFLIGHT_TTL_SEC)
+    except Exception as e:
+        log.warning("flow_control_note_failed", extra={"payload": {"err": str(e)[:200]}})
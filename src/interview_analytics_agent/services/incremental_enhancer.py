@@ -0,0 +1,189 @@
+"""
+Инкрементальный enhancer.
+
+Назначение:
+- за один запуск обрабатывать только новые и изменённые сегменты встречи,
+  а не весь транскрипт
+- transcript.update публикуется только по реально изменённым сегментам
+
+Состояние по встрече (Redis):
+- enh:state:<meeting_id> (hash): hwm — максимальный обработанный seq,
+  h:<seq> — sha256 пары (raw_text, enhanced_text) после последней обработки
+- enh:dirty:<meeting_id> (set): каждый seq, записанный worker_stt (новый или
+  перезаписанный) — так изменения и поздние чанки ниже hwm (ретрай, чанки
+  пришли не по порядку) ловятся без полного скана встречи
+
+Если состояния нет (TTL истёк, Redis очищен) — первый запуск проходит встречу целиком.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.common.utils import sha256_hex
+from interview_analytics_agent.processing.enhancer import enhance_text
+from interview_analytics_agent.processing.quality import quality_score
+from interview_analytics_agent.queue.redis import redis_client
+from interview_analytics_agent.services.scorecard_state import mark_scorecard_dirty
+from interview_analytics_agent.storage.db import db_session
+from interview_analytics_agent.storage.models import TranscriptSegment
+from interview_analytics_agent.storage.repositories import TranscriptSegmentRepository
+
+_STATE_KEY_PREFIX = "enh:state:"
+_DIRTY_KEY_PREFIX = "enh:dirty:"
+_HWM_FIELD = "hwm"
+_STATE_TTL_SEC = 7 * 24 * 3600
+
+
+@dataclass
+class _EnhancerState:
+    hwm: int = -1
+    dirty: set[str] = field(default_factory=set)
+
+
+def _state_key(meeting_id: str) -> str:
+    return f"{_STATE_KEY_PREFIX}{meeting_id}"
+
+
+def _dirty_key(meeting_id: str) -> str:
+    return f"{_DIRTY_KEY_PREFIX}{meeting_id}"
+
+
+def _hash_field(seq: int) -> str:
+    return f"h:{seq}"
+
+
+def _segment_hash(seg: TranscriptSegment, enhanced_text: str | None = None) -> str:
+    # enhanced_text тоже входит в хэш: worker_stt при перезаписи сбрасывает его в raw_text
+    enhanced = seg.enhanced_text if enhanced_text is None else enhanced_text
+    data = f"{seg.raw_text or ''}\x00{enhanced or ''}"
+    return sha256_hex(data.encode("utf-8"))[:16]
+
+
+def mark_segment_dirty(*, meeting_id: str, seq: int) -> None:
+    """
+    Отметить, что сегмент записан или перезаписан (вызывает worker_stt на каждую запись).
+    """
+    pipe = redis_client().pipeline(transaction=False)
+    pipe.sadd(_dirty_key(meeting_id), str(int(seq)))
+    pipe.expire(_dirty_key(meeting_id), _STATE_TTL_SEC)
+    pipe.execute()
+
+
+def _load_state(meeting_id: str) -> _EnhancerState:
+    pipe = redis_client().pipeline(transaction=False)
+    pipe.hget(_state_key(meeting_id), _HWM_FIELD)
+    pipe.smembers(_dirty_key(meeting_id))
+    hwm_raw, dirty = pipe.execute()
+    try:
+        hwm = int(hwm_raw) if hwm_raw is not None else -1
+    except (TypeError, ValueError):
+        hwm = -1
+    return _EnhancerState(hwm=hwm, dirty={str(x) for x in (dirty or set())})
+
+
+def _load_hashes(meeting_id: str, seqs: list[int]) -> dict[int, str | None]:
+    if not seqs:
+        return {}
+    values = redis_client().hmget(_state_key(meeting_id), [_hash_field(s) for s in seqs])
+    return dict(zip(seqs, values, strict=False))
+
+
+def _save_state(
+    *, meeting_id: str, hwm: int, hashes: dict[int, str], consumed_dirty: set[str]
+) -> None:
+    pipe = redis_client().pipeline(transaction=False)
+    mapping: dict[str, Any] = {_hash_field(seq): h for seq, h in hashes.items()}
+    mapping[_HWM_FIELD] = str(hwm)
+    pipe.hset(_state_key(meeting_id), mapping=mapping)
+    pipe.expire(_state_key(meeting_id), _STATE_TTL_SEC)
+    if consumed_dirty:
+        # удаляем только то, что прочитали: seq, помеченные во время обработки, останутся
+        pipe.srem(_dirty_key(meeting_id), *sorted(consumed_dirty))
+    pipe.execute()
+
+
+def _update_event(
+    meeting_id: str, seg: TranscriptSegment, enhanced_text: str, meta: dict
+) -> dict[str, Any]:
+    return {
+        "schema_version": "v1",
+        "event_type": "transcript.update",
+        "meeting_id": meeting_id,
+        "seq": seg.seq,
+        "speaker": seg.speaker,
+        "raw_text": seg.raw_text or "",
+        "enhanced_text": enhanced_text,
+        "confidence": seg.confidence,
+        "quality": quality_score(seg.raw_text or "", enhanced_text),
+        "meta": meta,
+    }
+
+
+def _enhance_segments(
+    srepo: TranscriptSegmentRepository, meeting_id: str, segs: list[TranscriptSegment]
+) -> tuple[list[dict[str, Any]], dict[int, str]]:
+    """
+    Прогнать enhancer по сегментам; изменённые enhanced_text пишутся одним
+    пакетным upsert-ом. Возвращает (события, {seq: новый enhanced_text}).
+    """
+    events: list[dict[str, Any]] = []
+    changed: dict[int, str] = {}
+    for seg in segs:
+        enh, meta = enhance_text(seg.raw_text or "")
+        if enh != (seg.enhanced_text or ""):
+            changed[seg.seq] = enh
+            events.append(_update_event(meeting_id, seg, enh, meta))
+    if changed:
+        srepo.upsert_many(
+            [
+                {"meeting_id": meeting_id, "seq": seq, "enhanced_text": enh}
+                for seq, enh in changed.items()
+            ],
+            update_columns=("enhanced_text",),
+        )
+    return events, changed
+
+
+def enhance_meeting(meeting_id: str) -> list[dict[str, Any]]:
+    """
+    Прогнать enhancer по встрече и вернуть transcript.update события
+    по изменённым сегментам (публикует вызывающий). Обработанные seq
+    передаются scorecard (mark_scorecard_dirty).
+
+    ENHANCER_INCREMENTAL=false — старое поведение: вся встреча за каждый запуск.
+    """
+    if not get_settings().enhancer_incremental:
+        with db_session() as session:
+            srepo = TranscriptSegmentRepository(session)
+            segs = srepo.list_by_meeting(meeting_id)
+            events, _ = _enhance_segments(srepo, meeting_id, segs)
+        mark_scorecard_dirty(meeting_id, [seg.seq for seg in segs])
+        return events
+
+    state = _load_state(meeting_id)
+    # dirty seq > hwm и так попадут в выборку "после hwm"
+    below_hwm = sorted(int(s) for s in state.dirty if s.isdigit() and int(s) <= state.hwm)
+
+    with db_session() as session:
+        srepo = TranscriptSegmentRepository(session)
+        segs = srepo.list_by_meeting_after(meeting_id, after_seq=state.hwm)
+        if below_hwm:
+            segs = srepo.list_by_meeting_seqs(meeting_id, below_hwm) + segs
+
+        stored = _load_hashes(meeting_id, [seg.seq for seg in segs])
+        todo: list[TranscriptSegment] = []
+        for seg in segs:
+            if stored.get(seg.seq) != _segment_hash(seg):
+                todo.append(seg)
+
+        events, changed = _enhance_segments(srepo, meeting_id, todo)
+        hashes = {seg.seq: _segment_hash(seg, changed.get(seg.seq)) for seg in todo}
+        new_hwm = max([state.hwm, *(seg.seq for seg in segs)])
+
+    # состояние пишем только после commit сегментов
+    _save_state(meeting_id=meeting_id, hwm=new_hwm, hashes=hashes, consumed_dirty=state.dirty)
+    mark_scorecard_dirty(meeting_id, list(hashes))
+    return events
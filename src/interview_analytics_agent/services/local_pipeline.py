@@ -16,13 +16,15 @@ from interview_analytics_agent.processing.quality import quality_score
 from interview_analytics_agent.services.report_artifacts import write_report_artifacts
 from interview_analytics_agent.storage.blob import get_bytes
 from interview_analytics_agent.storage.db import db_session
-from interview_analytics_agent.storage.models import TranscriptSegment
 from interview_analytics_agent.storage.repositories import (
     MeetingRepository,
     TranscriptSegmentRepository,
 )
+from interview_analytics_agent.stt.audio import try_decode_audio
 from interview_analytics_agent.stt.diarization import resolve_speaker
 from interview_analytics_agent.stt.mock import MockSTTProvider
+from interview_analytics_agent.stt.result_cache import with_result_cache
+from interview_analytics_agent.stt.silence_gate import with_silence_gate
 
 log = get_project_logger()
 _stt_provider: Any | None = None
@@ -60,7 +62,8 @@ def _build_stt_provider():
 def _get_stt_provider():
     global _stt_provider
     if _stt_provider is None:
-        _stt_provider = _build_stt_provider()
+        s = get_settings()
+        _stt_provider = with_silence_gate(with_result_cache(_build_stt_provider(), s), s)
     return _stt_provider
 
 
@@ -94,13 +97,19 @@ def process_chunk_inline(
         audio_bytes = get_bytes(blob_key)
 
     stt = _get_stt_provider()
-    stt_result = stt.transcribe_chunk(audio=audio_bytes, sample_rate=16000)
-    speaker = resolve_speaker(
-        hint=stt_result.speaker,
-        raw_text=stt_result.text,
-        seq=chunk_seq,
-        meeting_id=meeting_id,
-        audio_bytes=audio_bytes,
+    decoded = try_decode_audio(audio_bytes)
+    stt_result = stt.transcribe_chunk(audio=audio_bytes, sample_rate=16000, decoded=decoded)
+    speaker = (
+        None
+        if stt_result.silent
+        else resolve_speaker(
+            hint=stt_result.speaker,
+            raw_text=stt_result.text,
+            seq=chunk_seq,
+            meeting_id=meeting_id,
+            audio_bytes=audio_bytes,
+            decoded=decoded,
+        )
     )
     raw_text = (stt_result.text or "").strip()
     enhanced_text, meta = enhance_text(raw_text)
@@ -112,17 +121,20 @@ def process_chunk_inline(
         meeting = mrepo.ensure(meeting_id=meeting_id, meeting_context={"source": "inline_pipeline"})
 
         if raw_text:
-            seg = TranscriptSegment(
-                meeting_id=meeting_id,
-                seq=chunk_seq,
-                speaker=speaker,
-                start_ms=None,
-                end_ms=None,
-                raw_text=raw_text,
-                enhanced_text=enhanced_text,
-                confidence=stt_result.confidence,
+            srepo.upsert_many(
+                [
+                    {
+                        "meeting_id": meeting_id,
+                        "seq": chunk_seq,
+                        "speaker": speaker,
+                        "start_ms": None,
+                        "end_ms": None,
+                        "raw_text": raw_text,
+                        "enhanced_text": enhanced_text,
+                        "confidence": stt_result.confidence,
+                    }
+                ]
             )
-            srepo.upsert_by_meeting_seq(seg)
 
         segs = srepo.list_by_meeting(meeting_id)
         raw = build_raw_transcript(segs)
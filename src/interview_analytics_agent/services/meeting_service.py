@@ -12,6 +12,7 @@ from __future__ import annotations
 from interview_analytics_agent.common.ids import new_meeting_id
 from interview_analytics_agent.domain.enums import ConsentStatus, PipelineStatus
 from interview_analytics_agent.storage.models import Meeting
+from interview_analytics_agent.storage.repositories import tenant_from_context
 
 
 def create_meeting(*, meeting_id: str | None, context: dict, consent: ConsentStatus) -> Meeting:
@@ -21,6 +22,7 @@ def create_meeting(*, meeting_id: str | None, context: dict, consent: ConsentSta
     mid = meeting_id or new_meeting_id()
     return Meeting(
         id=mid,
+        tenant_id=tenant_from_context(context),
         status=PipelineStatus.queued,
         consent=consent,
         context=context or {},
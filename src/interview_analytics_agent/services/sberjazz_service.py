@@ -25,7 +25,12 @@ from interview_analytics_agent.connectors.base import MeetingConnector
 from interview_analytics_agent.connectors.salutejazz.adapter import SaluteJazzConnector
 from interview_analytics_agent.connectors.salutejazz.mock import MockSaluteJazzConnector
 from interview_analytics_agent.queue.redis import redis_client
-from interview_analytics_agent.services.chunk_ingest_service import ingest_audio_chunk_b64
+from interview_analytics_agent.services.chunk_ingest_service import (
+    ChunkIngestItem,
+    decode_chunk_b64,
+    ingest_audio_chunks_bulk,
+)
+from interview_analytics_agent.services.flow_control import ingest_credits
 
 log = get_project_logger()
 
@@ -791,6 +796,15 @@ def _pull_live_for_meeting(meeting_id: str, *, batch_limit: int) -> tuple[int, i
         return 0, 0, 0
 
     with start_trace(meeting_id=meeting_id, source="connector.live_pull"):
+        # пачка не больше окна кредитов: при отставании STT чанки остаются у провайдера
+        credits = ingest_credits(meeting_id, source="connector")
+        if credits.throttled:
+            log.info(
+                "sberjazz_live_pull_throttled",
+                extra={"payload": {"meeting_id": meeting_id, **credits.to_dict()}},
+            )
+            return 0, 0, 0
+        batch_limit = min(max(1, int(batch_limit)), credits.credits)
         cursor = _load_live_cursor(meeting_id)
         attempts, backoff_sec = _live_pull_retry_config()
         payload: object | None = None
@@ -821,23 +835,37 @@ def _pull_live_for_meeting(meeting_id: str, *, batch_limit: int) -> tuple[int, i
             payload,
             fallback_prefix=fallback_prefix,
         )
-        if next_cursor:
-            _save_live_cursor(meeting_id, next_cursor)
 
-        pulled = 0
-        ingested = 0
+        # битый base64 отбрасывает только свой чанк, а не всю пачку
+        items: list[ChunkIngestItem] = []
         for chunk in chunks:
-            result = ingest_audio_chunk_b64(
-                meeting_id=meeting_id,
-                seq=chunk.seq,
-                content_b64=chunk.content_b64,
-                idempotency_key=chunk.chunk_id,
-                idempotency_scope="audio_chunk_connector_live",
-                idempotency_prefix="sj-live",
+            try:
+                audio_bytes = decode_chunk_b64(chunk.content_b64)
+            except ValueError:
+                invalid_chunks += 1
+                log.warning(
+                    "sberjazz_live_chunk_decode_failed",
+                    extra={"payload": {"meeting_id": meeting_id, "chunk_id": chunk.chunk_id}},
+                )
+                continue
+            items.append(
+                ChunkIngestItem(
+                    seq=chunk.seq, audio_bytes=audio_bytes, idempotency_key=chunk.chunk_id
+                )
             )
-            pulled += 1
-            if not result.is_duplicate:
-                ingested += 1
+
+        # вся пачка — одним вызовом постановки
+        results = ingest_audio_chunks_bulk(
+            meeting_id=meeting_id,
+            chunks=items,
+            idempotency_scope="audio_chunk_connector_live",
+            idempotency_prefix="sj-live",
+        )
+        # курсор — только после постановки: при ошибке пачка будет запрошена заново
+        if next_cursor:
+            _save_live_cursor(meeting_id, next_cursor)
+        pulled = len(results)
+        ingested = sum(1 for result in results if not result.is_duplicate)
 
         if pulled > 0:
             _touch_connected_state(meeting_id)
@@ -0,0 +1,116 @@
+"""
+Сохранённое состояние scorecard по встрече.
+
+worker_analytics на каждом запуске загружает ScorecardAccumulator встречи,
+досчитывает в него только изменённые сегменты и сохраняет обратно.
+
+Состояние по встрече (Redis):
+- scorecard:acc:<meeting_id> (JSON) — снапшот аккумулятора
+- scorecard:dirty:<meeting_id> (set) — seq, обработанные enhancer-ом после
+  последнего запуска (новые и перезаписанные); worker_analytics читает из БД
+  только их, без скана всей встречи
+
+Уже учтённый seq в dirty (перезапись) или потеря снапшота — аккумулятор
+сбрасывается и встреча пересчитывается целиком.
+"""
+
+from __future__ import annotations
+
+import json
+
+from interview_analytics_agent.common.logging import get_project_logger
+from interview_analytics_agent.processing.scorecard import ScorecardAccumulator
+from interview_analytics_agent.queue.redis import redis_client
+from interview_analytics_agent.storage.models import TranscriptSegment
+from interview_analytics_agent.storage.repositories import TranscriptSegmentRepository
+
+log = get_project_logger()
+
+_KEY_PREFIX = "scorecard:acc:"
+_DIRTY_KEY_PREFIX = "scorecard:dirty:"
+_STATE_TTL_SEC = 7 * 24 * 3600
+
+
+def _state_key(meeting_id: str) -> str:
+    return f"{_KEY_PREFIX}{meeting_id}"
+
+
+def _dirty_key(meeting_id: str) -> str:
+    return f"{_DIRTY_KEY_PREFIX}{meeting_id}"
+
+
+def mark_scorecard_dirty(meeting_id: str, seqs: list[int]) -> None:
+    """
+    Отметить сегменты, которые scorecard должен (пере)учесть (вызывает enhancer).
+    """
+    if not seqs:
+        return
+    pipe = redis_client().pipeline(transaction=False)
+    pipe.sadd(_dirty_key(meeting_id), *sorted({str(int(s)) for s in seqs}))
+    pipe.expire(_dirty_key(meeting_id), _STATE_TTL_SEC)
+    pipe.execute()
+
+
+def load_scorecard_dirty(meeting_id: str) -> set[str]:
+    return {str(x) for x in (redis_client().smembers(_dirty_key(meeting_id)) or set())}
+
+
+def clear_scorecard_dirty(meeting_id: str, consumed: set[str]) -> None:
+    # удаляем только прочитанное: seq, помеченные во время обработки, останутся
+    if consumed:
+        redis_client().srem(_dirty_key(meeting_id), *sorted(consumed))
+
+
+def changed_scorecard_segments(
+    srepo: TranscriptSegmentRepository,
+    meeting_id: str,
+    acc: ScorecardAccumulator,
+    dirty: set[str],
+    *,
+    all_segments: list[TranscriptSegment] | None = None,
+) -> list[TranscriptSegment]:
+    """
+    Сегменты, которые нужно досчитать в acc.
+
+    Обычно это только dirty seq; если среди них есть уже учтённый (перезапись)
+    или acc пуст (первый запуск, снапшот потерян) — acc сбрасывается
+    и возвращается вся встреча (all_segments, если уже прочитана).
+    """
+    seqs = sorted(int(s) for s in dirty if s.isdigit())
+    if acc.empty or acc.has_folded(seqs):
+        acc.reset()
+        if all_segments is not None:
+            return all_segments
+        return srepo.list_by_meeting(meeting_id)
+    if not seqs:
+        return []
+    return srepo.list_by_meeting_seqs(meeting_id, seqs)
+
+
+def load_scorecard_accumulator(meeting_id: str) -> ScorecardAccumulator:
+    try:
+        raw = redis_client().get(_state_key(meeting_id))
+        data = json.loads(raw) if raw else None
+    except Exception as e:
+        log.warning(
+            "scorecard_state_load_failed",
+            extra={"payload": {"meeting_id": meeting_id, "err": str(e)[:200]}},
+        )
+        data = None
+    return ScorecardAccumulator.from_dict(data)
+
+
+def save_scorecard_accumulator(meeting_id: str, acc: ScorecardAccumulator) -> bool:
+    try:
+        redis_client().set(
+            _state_key(meeting_id),
+            json.dumps(acc.to_dict(), ensure_ascii=False),
+            ex=_STATE_TTL_SEC,
+        )
+    except Exception as e:
+        log.warning(
+            "scorecard_state_save_failed",
+            extra={"payload": {"meeting_id": meeting_id, "err": str(e)[:200]}},
+        )
+        return False
+    return True
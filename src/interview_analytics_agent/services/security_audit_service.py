@@ -8,7 +8,8 @@ from dataclasses import dataclass
 
 from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.common.logging import get_project_logger
-from interview_analytics_agent.storage.db import db_session
+from interview_analytics_agent.storage.db import db_read_session, db_session
+from interview_analytics_agent.storage.pagination import KeysetPage, decode_cursor
 from interview_analytics_agent.storage.repositories import SecurityAuditRepository
 
 log = get_project_logger()
@@ -76,31 +77,46 @@ def write_security_audit_event(
         )
 
 
-def list_security_audit_events(
+def _view(e) -> SecurityAuditEventView:
+    return SecurityAuditEventView(
+        id=e.id,
+        created_at=e.created_at.isoformat(),
+        outcome=e.outcome,
+        endpoint=e.endpoint,
+        method=e.method,
+        subject=e.subject,
+        auth_type=e.auth_type,
+        reason=e.reason,
+        error_code=e.error_code,
+        status_code=e.status_code,
+        client_ip=e.client_ip,
+    )
+
+
+def list_security_audit_page(
     *,
     limit: int = 100,
     outcome: str | None = None,
     subject: str | None = None,
-) -> list[SecurityAuditEventView]:
+    cursor: str | None = None,
+) -> KeysetPage[SecurityAuditEventView]:
+    """
+    Страница аудита от новых к старым; cursor — next_cursor предыдущей страницы.
+    """
     normalized_outcome = _normalize_outcome(outcome)
+    after = decode_cursor(cursor, key_type=int) if cursor else None
     if not bool(getattr(get_settings(), "security_audit_db_enabled", True)):
-        return []
-    with db_session() as session:
+        return KeysetPage(items=[], next_cursor=None)
+    with db_read_session() as session:
         repo = SecurityAuditRepository(session)
-        events = repo.list_recent(limit=limit, outcome=normalized_outcome, subject=subject)
-    return [
-        SecurityAuditEventView(
-            id=e.id,
-            created_at=e.created_at.isoformat(),
-            outcome=e.outcome,
-            endpoint=e.endpoint,
-            method=e.method,
-            subject=e.subject,
-            auth_type=e.auth_type,
-            reason=e.reason,
-            error_code=e.error_code,
-            status_code=e.status_code,
-            client_ip=e.client_ip,
-        )
-        for e in events
-    ]
+        page = repo.list_page(limit=limit, after=after, outcome=normalized_outcome, subject=subject)
+        return KeysetPage(items=[_view(e) for e in page.items], next_cursor=page.next_cursor)
+
+
+def list_security_audit_events(
+    *,
+    limit: int = 100,
+    outcome: str | None = None,
+    subject: str | None = None,
+) -> list[SecurityAuditEventView]:
+    return list_security_audit_page(limit=limit, outcome=outcome, subject=subject).items
@@ -0,0 +1,167 @@
+"""
+Async-доступ к БД для API gateway.
+
+Назначение:
+- чтения gateway (встреча, список встреч, готовый отчёт) не занимают поток
+  из threadpool FastAPI: медленный запрос ждёт в event loop
+- драйвер: asyncpg (PostgreSQL), aiosqlite (SQLite в тестах/dev);
+  DSN — POSTGRES_ASYNC_DSN или POSTGRES_DSN с заменой драйвера
+- пул и statement_timeout — те же настройки, что у storage.db (DB_POOL_*,
+  DB_*STATEMENT_TIMEOUT_MS); метрики пула с label engine=async_primary|async_replica<N>
+
+Engine-ы создаются при первом обращении: воркерам async-драйвер не нужен.
+"""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+
+from interview_analytics_agent.common.config import get_settings
+
+from .db import _apply_statement_timeout, _read_dsns, engine_options, instrument_pool
+
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def async_dsn(dsn: str) -> str:
+    """
+    DSN с async-драйвером: postgresql+psycopg://... -> postgresql+asyncpg://...
+    """
+    url = make_url(dsn)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"no async driver for {url.get_backend_name()}")
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+def async_engine_options(dsn: str, *, statement_timeout_ms: int | None = None) -> dict[str, Any]:
+    options = engine_options(dsn, statement_timeout_ms=statement_timeout_ms)
+    connect_args = options.pop("connect_args", None)
+    if connect_args and make_url(dsn).get_driver_name() == "asyncpg":
+        # asyncpg не принимает libpq options: параметры сервера — через server_settings
+        timeout = connect_args["options"].rsplit("=", 1)[-1]
+        options["connect_args"] = {"server_settings": {"statement_timeout": timeout}}
+    elif connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def create_async_db_engine(
+    dsn: str, *, name: str = "async_primary", statement_timeout_ms: int | None = None
+) -> AsyncEngine:
+    engine = create_async_engine(
+        dsn, **async_engine_options(dsn, statement_timeout_ms=statement_timeout_ms)
+    )
+    instrument_pool(engine.sync_engine, name=name)
+    return engine
+
+
+class _AsyncBackedSession(Session):
+    """Sync-сторона AsyncSession: на неё вешается SET LOCAL statement_timeout."""
+
+
+event.listen(_AsyncBackedSession, "after_begin", _apply_statement_timeout)
+
+
+def _sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+        sync_session_class=_AsyncBackedSession,
+    )
+
+
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+_read_session_factories: list[async_sessionmaker[AsyncSession]] | None = None
+_read_rr = itertools.count()
+
+
+def _primary_factory() -> async_sessionmaker[AsyncSession]:
+    global _session_factory
+    if _session_factory is None:
+        s = get_settings()
+        _session_factory = _sessionmaker(
+            create_async_db_engine(s.postgres_async_dsn or async_dsn(s.postgres_dsn))
+        )
+    return _session_factory
+
+
+def _read_factories() -> list[async_sessionmaker[AsyncSession]]:
+    global _read_session_factories
+    if _read_session_factories is None:
+        s = get_settings()
+        _read_session_factories = [
+            _sessionmaker(
+                create_async_db_engine(
+                    async_dsn(dsn),
+                    name=f"async_replica{i}",
+                    statement_timeout_ms=s.db_read_statement_timeout_ms,
+                )
+            )
+            for i, dsn in enumerate(_read_dsns())
+        ]
+    return _read_session_factories
+
+
+@asynccontextmanager
+async def async_db_session(
+    *, statement_timeout_ms: int | None = None
+) -> AsyncIterator[AsyncSession]:
+    """
+    Async-аналог db_session(): primary, commit в конце.
+
+    Использование:
+        async with async_db_session() as session:
+            meeting = await AsyncMeetingRepository(session).get(meeting_id)
+    """
+    session = _primary_factory()(info={"statement_timeout_ms": statement_timeout_ms})
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+@asynccontextmanager
+async def async_db_read_session(
+    *, statement_timeout_ms: int | None = None
+) -> AsyncIterator[AsyncSession]:
+    """
+    Async-аналог db_read_session(): реплика (round-robin) или primary, без commit.
+    """
+    factories = _read_factories()
+    if factories:
+        factory = factories[next(_read_rr) % len(factories)]
+        timeout_ms = statement_timeout_ms
+    else:
+        factory = _primary_factory()
+        timeout_ms = (
+            get_settings().db_read_statement_timeout_ms
+            if statement_timeout_ms is None
+            else statement_timeout_ms
+        )
+    session = factory(info={"statement_timeout_ms": timeout_ms})
+    try:
+        yield session
+    finally:
+        await session.rollback()
+        await session.close()
@@ -1,6 +1,25 @@
+"""
+Blob storage (local_fs / shared_fs).
+
+STORAGE_DEDUP=true — content-addressed хранение:
+- байты лежат один раз в cas/<sha256[:2]>/<sha256>
+- логический ключ (meetings/<id>/chunks/<seq>.bin) — hard link на объект:
+  повтор/реплей чанка и общая запись у двух встреч не пишут байты заново
+- число ссылок на объект = st_nlink - 1; объект без ссылок удаляется
+  при delete / release_meeting_blobs, при перезаписи ключа другими байтами
+  (освобождается прежний объект) и в gc_blobs (вызывает ретеншн)
+- ключи встречи и их sha256 дописываются в meetings/<id>/manifest.jsonl;
+  перезапись ключа и delete переписывают manifest по одной строке на ключ.
+  Строка, потерянная при гонке записей, не течёт: gc_blobs подберёт объект
+- если ФС не умеет hard link-и (EXDEV/EPERM/...), ключ пишется обычной копией
+"""
+
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import shutil
 import time
 from contextlib import suppress
 from dataclasses import dataclass
@@ -9,9 +28,14 @@ from uuid import uuid4
 
 from interview_analytics_agent.common.config import get_settings
 from interview_analytics_agent.common.errors import ErrCode, ProviderError
+from interview_analytics_agent.common.metrics import BLOB_PUT_TOTAL
+from interview_analytics_agent.common.utils import sha256_hex
 
 _HEALTH_CACHE: dict[str, object] = {"ts": 0.0, "value": None}
 
+_CAS_DIR = "cas"
+_MANIFEST_NAME = "manifest.jsonl"
+
 
 @dataclass
 class StorageHealth:
@@ -66,16 +90,147 @@ def _key_to_path(key: str) -> Path:
     return _base_dir() / key
 
 
-def put_bytes(key: str, data: bytes) -> str:
-    """Сохранить bytes и вернуть ключ."""
-    p = _key_to_path(key)
+def _dedup_enabled() -> bool:
+    return bool(getattr(get_settings(), "storage_dedup", False))
+
+
+def _object_path(digest: str) -> Path:
+    return _base_dir() / _CAS_DIR / digest[:2] / digest
+
+
+def _write_atomic(p: Path, data: bytes) -> None:
     p.parent.mkdir(parents=True, exist_ok=True)
     tmp = p.parent / f".tmp-{p.name}-{uuid4().hex}"
     tmp.write_bytes(data)
     tmp.replace(p)
+
+
+def _link_atomic(src: Path, dst: Path) -> None:
+    tmp = dst.parent / f".tmp-{dst.name}-{uuid4().hex}"
+    os.link(src, tmp)
+    tmp.replace(dst)
+
+
+def _meeting_manifest(meeting_id: str) -> Path:
+    return _key_to_path(f"meetings/{meeting_id}/{_MANIFEST_NAME}")
+
+
+def _manifest_path(key: str) -> Path | None:
+    parts = key.lstrip("/").split("/")
+    if len(parts) < 3 or parts[0] != "meetings":
+        return None
+    return _meeting_manifest(parts[1])
+
+
+def _read_manifest(manifest: Path) -> dict[str, dict]:
+    # последняя запись ключа побеждает
+    entries: dict[str, dict] = {}
+    try:
+        lines = manifest.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return entries
+    for line in lines:
+        with suppress(ValueError, KeyError, TypeError):
+            entry = json.loads(line)
+            entries[str(entry["key"])] = entry
+    return entries
+
+
+def _rewrite_manifest(manifest: Path, entries: dict[str, dict]) -> None:
+    _write_atomic(manifest, "".join(json.dumps(e) + "\n" for e in entries.values()).encode())
+
+
+def _append_manifest(key: str, digest: str, size: int) -> None:
+    manifest = _manifest_path(key)
+    if manifest is None:
+        return
+    line = json.dumps({"key": key.lstrip("/"), "sha256": digest, "size": size})
+    with manifest.open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def _replace_manifest_entry(key: str, digest: str | None, size: int = 0) -> str | None:
+    """
+    Заменить (digest=None — убрать) запись ключа; вернуть прежний sha256.
+    """
+    manifest = _manifest_path(key)
+    if manifest is None:
+        return None
+    key = key.lstrip("/")
+    entries = _read_manifest(manifest)
+    prev = entries.pop(key, None)
+    if digest is not None:
+        entries[key] = {"key": key, "sha256": digest, "size": size}
+    if prev is not None or digest is not None:
+        _rewrite_manifest(manifest, entries)
+    return str(prev["sha256"]) if prev else None
+
+
+def _drop_if_unreferenced(digest: str) -> bool:
+    obj = _object_path(digest)
+    try:
+        if obj.stat().st_nlink > 1:
+            return False
+        obj.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _put_dedup(key: str, data: bytes) -> str:
+    p = _key_to_path(key)
+    digest = sha256_hex(data)
+    obj = _object_path(digest)
+    with suppress(FileNotFoundError):
+        if p.samefile(obj):
+            BLOB_PUT_TOTAL.labels(result="unchanged").inc()
+            return key
+
+    replacing = p.exists()
+    p.parent.mkdir(parents=True, exist_ok=True)
+    for _ in range(3):
+        result = "deduplicated"
+        if not obj.exists():
+            _write_atomic(obj, data)
+            result = "written"
+        try:
+            _link_atomic(obj, p)
+        except FileNotFoundError:
+            # объект удалён как несвязанный между проверкой и link — пишем заново
+            continue
+        except OSError:
+            # ФС без hard link-ов (или другой mount): обычная копия
+            _write_atomic(p, data)
+            BLOB_PUT_TOTAL.labels(result="copied").inc()
+            return key
+        BLOB_PUT_TOTAL.labels(result=result).inc()
+        if not replacing:
+            _append_manifest(key, digest, len(data))
+            return key
+        # ключ перезаписан другими байтами: прежний объект мог остаться без ссылок
+        prev = _replace_manifest_entry(key, digest, len(data))
+        if prev and prev != digest:
+            _drop_if_unreferenced(prev)
+        return key
+    _write_atomic(p, data)
+    BLOB_PUT_TOTAL.labels(result="copied").inc()
     return key
 
 
+def put_bytes(key: str, data: bytes) -> str:
+    """Сохранить bytes и вернуть ключ."""
+    if _dedup_enabled():
+        return _put_dedup(key, data)
+    _write_atomic(_key_to_path(key), data)
+    BLOB_PUT_TOTAL.labels(result="written").inc()
+    return key
+
+
+async def put_bytes_async(key: str, data: bytes) -> str:
+    """put_bytes в пуле потоков: медленный диск не блокирует event loop."""
+    return await asyncio.to_thread(put_bytes, key, data)
+
+
 def get_bytes(key: str) -> bytes:
     return _key_to_path(key).read_bytes()
 
@@ -86,8 +241,64 @@ def exists(key: str) -> bool:
 
 def delete(key: str) -> None:
     p = _key_to_path(key)
+    try:
+        linked = _dedup_enabled() and p.stat().st_nlink > 1
+    except FileNotFoundError:
+        return
+    digest = None
+    if linked:
+        digest = _replace_manifest_entry(key, None)
+        if digest is None and _manifest_path(key) is None:
+            # ключ вне meetings/ (health probe) — manifest нет, хэшируем сам файл
+            digest = sha256_hex(p.read_bytes())
     with suppress(FileNotFoundError):
         p.unlink()
+    if digest:
+        _drop_if_unreferenced(digest)
+
+
+def meeting_blob_refs(meeting_id: str) -> dict[str, str]:
+    """
+    {ключ: sha256} по manifest встречи (последняя запись ключа побеждает).
+    """
+    return {
+        key: str(entry["sha256"])
+        for key, entry in _read_manifest(_meeting_manifest(meeting_id)).items()
+    }
+
+
+def release_meeting_blobs(meeting_id: str) -> int:
+    """
+    Удалить blob-ы встречи и освободить объекты cas/, на которые больше никто не ссылается.
+
+    Возвращает количество удалённых объектов cas/.
+    """
+    digests = set(meeting_blob_refs(meeting_id).values())
+    meeting_dir = _key_to_path(f"meetings/{meeting_id}")
+    shutil.rmtree(meeting_dir, ignore_errors=True)
+    return sum(1 for digest in digests if _drop_if_unreferenced(digest))
+
+
+def gc_blobs(*, min_age_sec: int = 3600) -> int:
+    """
+    Удалить объекты cas/ без ссылок (st_nlink == 1) старше min_age_sec.
+
+    Возраст защищает объект, записанный, но ещё не связанный с ключом.
+    Вызывается из apply_retention после политик.
+    """
+    root = _base_dir() / _CAS_DIR
+    cutoff = time.time() - max(0, int(min_age_sec))
+    removed = 0
+    for obj in root.glob("*/*"):
+        try:
+            st = obj.stat()
+            if st.st_nlink > 1 or st.st_mtime > cutoff or obj.name.startswith(".tmp-"):
+                continue
+            obj.unlink()
+            removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
 
 
 def check_storage_health() -> StorageHealth:
@@ -2,29 +2,126 @@
 Инициализация базы данных и сессий SQLAlchemy.
 
 Назначение:
-- Создание engine
+- Создание engine (пул и таймауты из настроек: DB_POOL_*, DB_*STATEMENT_TIMEOUT_MS)
 - Контекстный менеджер для сессий
 - Единая точка доступа к БД для всех сервисов
+
+Сессии:
+- db_session()      — primary, commit в конце (записи и чтение-после-записи)
+- db_read_session() — read-реплика (POSTGRES_READ_DSNS, round-robin), без commit;
+                      без реплик — primary. Реплика может отставать: если записи
+                      ещё нет, вызывающий перечитывает из primary.
+
+Метрики пула: agent_db_pool_checkout_wait_seconds, agent_db_pool_in_use,
+agent_db_pool_saturation (label engine=primary|replica<N>).
 """
 
 from __future__ import annotations
 
+import itertools
+import time
 from contextlib import contextmanager
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
 
 from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.common.metrics import (
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    DB_POOL_IN_USE,
+    DB_POOL_SATURATION,
+)
 
 # =============================================================================
-# ENGINE / SESSION FACTORY
+# ENGINE FACTORY
 # =============================================================================
 _settings = get_settings()
 
-engine = create_engine(
-    _settings.postgres_dsn,
-    pool_pre_ping=True,
-)
+
+def _is_postgres(dsn: str) -> bool:
+    return make_url(dsn).get_backend_name() == "postgresql"
+
+
+def engine_options(dsn: str, *, statement_timeout_ms: int | None = None) -> dict[str, Any]:
+    """
+    Аргументы create_engine из настроек. Для SQLite (тесты, dev) — пул по умолчанию.
+    """
+    s = get_settings()
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    if not _is_postgres(dsn):
+        return options
+    options.update(
+        pool_size=max(1, int(s.db_pool_size)),
+        max_overflow=max(0, int(s.db_max_overflow)),
+        pool_timeout=max(1, int(s.db_pool_timeout_sec)),
+        pool_recycle=int(s.db_pool_recycle_sec),
+    )
+    timeout_ms = s.db_statement_timeout_ms if statement_timeout_ms is None else statement_timeout_ms
+    if int(timeout_ms or 0) > 0:
+        # psycopg / psycopg2: параметры сервера при установке соединения
+        options["connect_args"] = {"options": f"-c statement_timeout={int(timeout_ms)}"}
+    return options
+
+
+def instrument_pool(engine: Engine, *, name: str) -> None:
+    """
+    Ожидание соединения из пула (histogram) и gauge выданных соединений /
+    заполненности пула по событиям checkout/checkin.
+
+    Всё вешается на engine, а не на engine.pool: dispose() заменяет пул
+    (pool.recreate()), и инструментирование должно это переживать.
+    """
+    raw_connection = engine.raw_connection
+
+    def _timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            DB_POOL_CHECKOUT_WAIT_SECONDS.labels(engine=name).observe(time.perf_counter() - started)
+
+    # Connection берёт соединение через engine.raw_connection() -> текущий engine.pool.connect():
+    # время включает ожидание pool_timeout
+    engine.raw_connection = _timed_raw_connection
+
+    def _update(delta: int) -> None:
+        pool = engine.pool
+        checked_out = getattr(pool, "checkedout", None)
+        if checked_out is None:
+            return
+        in_use = max(0, int(checked_out()) + delta)
+        DB_POOL_IN_USE.labels(engine=name).set(in_use)
+        capacity = (getattr(pool, "size", lambda: 0)() or 0) + max(
+            0, int(getattr(pool, "_max_overflow", 0) or 0)
+        )
+        if capacity > 0:
+            DB_POOL_SATURATION.labels(engine=name).set(in_use / capacity)
+
+    # события пула, заданные на engine, переносятся в пул после recreate();
+    # checkin приходит до возврата соединения в пул — оно ещё считается выданным
+    event.listen(engine, "checkout", lambda *_args: _update(0))
+    event.listen(engine, "checkin", lambda *_args: _update(-1))
+
+
+def create_db_engine(
+    dsn: str, *, name: str = "primary", statement_timeout_ms: int | None = None
+) -> Engine:
+    engine = create_engine(dsn, **engine_options(dsn, statement_timeout_ms=statement_timeout_ms))
+    instrument_pool(engine, name=name)
+    return engine
+
+
+def _read_dsns() -> list[str]:
+    raw = _settings.postgres_read_dsns or ""
+    return [dsn.strip() for dsn in raw.split(",") if dsn.strip()]
+
+
+# =============================================================================
+# ENGINE / SESSION FACTORY
+# =============================================================================
+engine = create_db_engine(_settings.postgres_dsn)
 
 SessionLocal = sessionmaker(
     bind=engine,
@@ -33,19 +130,57 @@ SessionLocal = sessionmaker(
 )
 
 
+def _apply_statement_timeout(session: Session, _transaction, connection) -> None:
+    timeout_ms = session.info.get("statement_timeout_ms")
+    if timeout_ms is None or connection.dialect.name != "postgresql":
+        return
+    # SET LOCAL живёт до конца транзакции сессии
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {max(0, int(timeout_ms))}")
+
+
+event.listen(SessionLocal, "after_begin", _apply_statement_timeout)
+
+_read_session_factories: list[tuple[str, sessionmaker]] | None = None
+_read_rr = itertools.count()
+
+
+def _read_factories() -> list[tuple[str, sessionmaker]]:
+    # engine-ы реплик создаются при первом чтении: воркерам они не нужны
+    global _read_session_factories
+    if _read_session_factories is None:
+        factories = []
+        for i, dsn in enumerate(_read_dsns()):
+            replica = create_db_engine(
+                dsn,
+                name=f"replica{i}",
+                statement_timeout_ms=_settings.db_read_statement_timeout_ms,
+            )
+            factory = sessionmaker(bind=replica, autocommit=False, autoflush=False)
+            event.listen(factory, "after_begin", _apply_statement_timeout)
+            factories.append((f"replica{i}", factory))
+        _read_session_factories = factories
+    return _read_session_factories
+
+
+def read_replicas_enabled() -> bool:
+    return bool(_read_dsns())
+
+
 # =============================================================================
 # CONTEXT MANAGER
 # =============================================================================
 @contextmanager
-def db_session() -> Session:
+def db_session(*, statement_timeout_ms: int | None = None) -> Session:
     """
     Контекстный менеджер для работы с БД.
 
     Использование:
         with db_session() as session:
             session.add(...)
+
+    statement_timeout_ms — лимит на запросы этой сессии (PostgreSQL, SET LOCAL).
     """
-    session: Session = SessionLocal()
+    session: Session = SessionLocal(info={"statement_timeout_ms": statement_timeout_ms})
     try:
         yield session
         session.commit()
@@ -54,3 +189,27 @@ def db_session() -> Session:
         raise
     finally:
         session.close()
+
+
+@contextmanager
+def db_read_session(*, statement_timeout_ms: int | None = None) -> Session:
+    """
+    Сессия только для чтения: read-реплика, если настроена, иначе primary.
+    Ничего не коммитит — изменения объектов в ней теряются.
+    """
+    factories = _read_factories()
+    if factories:
+        _, factory = factories[next(_read_rr) % len(factories)]
+    else:
+        factory = SessionLocal
+    timeout_ms = (
+        _settings.db_read_statement_timeout_ms
+        if statement_timeout_ms is None and not factories
+        else statement_timeout_ms
+    )
+    session: Session = factory(info={"statement_timeout_ms": timeout_ms})
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
@@ -0,0 +1,53 @@
+"""
+Кэш встреч, уже подготовленных к приёму сегментов (на процесс).
+
+Назначение:
+- worker_stt не трогает строку meetings на каждом чанке: встреча создаётся
+  и переводится в processing один раз, дальше — только запись сегментов
+- запись живёт ttl_sec: после истечения статус снова проверяется
+  (например, если встречу успели закрыть, а чанки всё ещё идут)
+- при ошибке записи встреча забывается (встречу могли удалить — FK упадёт)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class KnownMeetingsCache:
+    def __init__(self, *, ttl_sec: float, max_size: int = 10_000) -> None:
+        self.ttl_sec = max(0.0, float(ttl_sec))
+        self.max_size = max(1, int(max_size))
+        self._expires: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def known(self, meeting_id: str) -> bool:
+        if self.ttl_sec <= 0:
+            return False
+        with self._lock:
+            expires = self._expires.get(meeting_id)
+            if expires is None:
+                return False
+            if expires <= time.monotonic():
+                del self._expires[meeting_id]
+                return False
+            return True
+
+    def remember(self, meeting_id: str) -> None:
+        if self.ttl_sec <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if len(self._expires) >= self.max_size and meeting_id not in self._expires:
+                for key, expires in list(self._expires.items()):
+                    if expires <= now:
+                        del self._expires[key]
+                if len(self._expires) >= self.max_size:
+                    # dict хранит порядок вставки: выбрасываем самую старую запись
+                    del self._expires[next(iter(self._expires))]
+            self._expires[meeting_id] = now + self.ttl_sec
+
+    def forget(self, meeting_id: str) -> None:
+        with self._lock:
+            self._expires.pop(meeting_id, None)
@@ -17,6 +17,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -43,8 +44,16 @@ class Meeting(Base):
     """
 
     __tablename__ = "meetings"
+    # keyset-листинг: ORDER BY created_at DESC, id DESC (+ фильтр по статусу / тенанту)
+    __table_args__ = (
+        Index("ix_meetings_created_at_id", "created_at", "id"),
+        Index("ix_meetings_status_created_at_id", "status", "created_at", "id"),
+        Index("ix_meetings_tenant_created_at_id", "tenant_id", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # копия context[TENANT_CONTEXT_KEY] для фильтра по индексу
+    tenant_id: Mapped[str | None] = mapped_column(String(128), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
     finished_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -100,6 +109,11 @@ class SecurityAuditEvent(Base):
     """
 
     __tablename__ = "security_audit_events"
+    __table_args__ = (
+        Index("ix_security_audit_events_created_at_id", "created_at", "id"),
+        Index("ix_security_audit_events_outcome_created_at_id", "outcome", "created_at", "id"),
+        Index("ix_security_audit_events_subject_created_at_id", "subject", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -112,3 +126,18 @@ class SecurityAuditEvent(Base):
     error_code: Mapped[str | None] = mapped_column(String(64), nullable=True)
     status_code: Mapped[int] = mapped_column(Integer, nullable=False)
     client_ip: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+
+class RetentionCheckpoint(Base):
+    """
+    Прогресс ретеншна по политике: ключ (created_at, id) последней обработанной встречи.
+    """
+
+    __tablename__ = "retention_checkpoints"
+
+    policy: Mapped[str] = mapped_column(String(32), primary_key=True)  # text|audio
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    meeting_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
@@ -0,0 +1,65 @@
+"""
+Keyset-пагинация по (created_at, id) — для растущих таблиц (встречи, аудит).
+
+Назначение:
+- страница = WHERE (created_at, id) < курсор ORDER BY created_at DESC, id DESC
+  LIMIT n + 1: стоимость не растёт с номером страницы (в отличие от OFFSET),
+  запрос идёт по индексу (…, created_at, id)
+- курсор — непрозрачная base64-строка с ключом последней строки страницы
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Select, tuple_
+
+T = TypeVar("T")
+
+CursorKey = tuple[datetime, Any]
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(created_at: datetime, key: Any) -> str:
+    raw = json.dumps([created_at.isoformat(), key], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *, key_type: type = str) -> CursorKey:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_raw, key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        created_at = datetime.fromisoformat(created_raw)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError("invalid cursor") from e
+    if not isinstance(key, key_type) or isinstance(key, bool):
+        raise ValueError("invalid cursor")
+    return created_at, key
+
+
+def keyset_stmt(
+    stmt: Select, *, created_col, id_col, after: CursorKey | None, limit: int
+) -> Select:
+    """
+    Страница после курсора after; выбирается limit + 1 строка (есть ли следующая).
+    """
+    if after is not None:
+        stmt = stmt.where(tuple_(created_col, id_col) < tuple_(*after))
+    return stmt.order_by(created_col.desc(), id_col.desc()).limit(limit + 1)
+
+
+def keyset_page(rows: Sequence[T], *, limit: int, key: Callable[[T], CursorKey]) -> KeysetPage[T]:
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(*key(items[-1])) if len(rows) > limit and items else None
+    return KeysetPage(items=items, next_cursor=next_cursor)
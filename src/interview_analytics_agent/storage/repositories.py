@@ -8,10 +8,89 @@
 
 from __future__ import annotations
 
-from sqlalchemy import desc
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import desc, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .models import Meeting, SecurityAuditEvent, TranscriptSegment
+from interview_analytics_agent.common.config import get_settings
+
+from .models import Meeting, RetentionCheckpoint, SecurityAuditEvent, TranscriptSegment
+from .pagination import CursorKey, KeysetPage, keyset_page, keyset_stmt
+
+# Поля сегмента, которые перезаписывает повторная запись того же (meeting_id, seq)
+SEGMENT_UPSERT_COLUMNS = (
+    "speaker",
+    "start_ms",
+    "end_ms",
+    "raw_text",
+    "enhanced_text",
+    "confidence",
+)
+# Строк в одном INSERT: держимся ниже лимита bind-параметров SQLite (32766)
+_UPSERT_BATCH = 500
+
+
+def _dialect_insert(session: Session):
+    name = session.get_bind().dialect.name
+    if name == "postgresql":
+        return pg_insert
+    if name == "sqlite":
+        return sqlite_insert
+    return None
+
+
+def tenant_from_context(context: dict | None) -> str | None:
+    """Тенант встречи из context (TENANT_CONTEXT_KEY) — для колонки meetings.tenant_id."""
+    key = (get_settings().tenant_context_key or "").strip() or "tenant_id"
+    value = (context or {}).get(key)
+    if value is None:
+        return None
+    return str(value).strip()[:128] or None
+
+
+def _page_limit(limit: int) -> int:
+    return max(1, min(limit, 500))
+
+
+# Запросы чтения общие для sync- и async-репозиториев
+def _active_meetings_stmt():
+    return select(Meeting).where(Meeting.finished_at.is_(None))
+
+
+def _recent_meetings_stmt(limit: int):
+    return select(Meeting).order_by(desc(Meeting.created_at)).limit(max(1, min(limit, 500)))
+
+
+def _meetings_page_stmt(
+    *, limit: int, after: CursorKey | None, status: str | None, tenant_id: str | None
+):
+    stmt = select(Meeting)
+    if status is not None:
+        stmt = stmt.where(Meeting.status == status)
+    if tenant_id is not None:
+        stmt = stmt.where(Meeting.tenant_id == tenant_id)
+    return keyset_stmt(
+        stmt, created_col=Meeting.created_at, id_col=Meeting.id, after=after, limit=limit
+    )
+
+
+def _meeting_key(m: Meeting) -> CursorKey:
+    return m.created_at, m.id
+
+
+def _segments_stmt(meeting_id: str, *, after_seq: int | None = None, seqs: list[int] | None = None):
+    stmt = select(TranscriptSegment).where(TranscriptSegment.meeting_id == meeting_id)
+    if after_seq is not None:
+        stmt = stmt.where(TranscriptSegment.seq > after_seq)
+    if seqs is not None:
+        stmt = stmt.where(TranscriptSegment.seq.in_(seqs))
+    return stmt.order_by(TranscriptSegment.seq)
 
 
 # =============================================================================
@@ -62,6 +141,7 @@ class MeetingRepository:
 
         m = Meeting(
             id=meeting_id,
+            tenant_id=tenant_from_context(meeting_context),
             status=self._default_status(),
             consent=self._default_consent(),
             context=meeting_context or {},
@@ -69,19 +149,122 @@ class MeetingRepository:
         self.save(m)
         return m
 
+    def ensure_exists(
+        self, *, meeting_id: str, meeting_context: dict | None = None, status: str | None = None
+    ) -> None:
+        """
+        ensure без SELECT: INSERT ... ON CONFLICT (id) DO NOTHING; если строка
+        уже была и передан status — UPDATE ... WHERE id = ... AND status <> новый.
+
+        Не ON CONFLICT DO UPDATE ... WHERE: на PostgreSQL он блокирует
+        конфликтующую строку и при невыполненном WHERE. Отдельный UPDATE
+        блокирует строку, только если статус действительно меняется.
+        """
+        insert = _dialect_insert(self.session)
+        if insert is None:
+            m = self.ensure(meeting_id=meeting_id, meeting_context=meeting_context)
+            if status is not None and m.status != status:
+                m.status = status
+            return
+        stmt = insert(Meeting).values(
+            id=meeting_id,
+            tenant_id=tenant_from_context(meeting_context),
+            status=status or self._default_status(),
+            consent=self._default_consent(),
+            context=meeting_context or {},
+        )
+        inserted = self.session.execute(
+            stmt.on_conflict_do_nothing(index_elements=[Meeting.id])
+        ).rowcount
+        if status is None or inserted:
+            return
+        self.session.execute(
+            update(Meeting)
+            .where(Meeting.id == meeting_id, Meeting.status != status)
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+
     def save(self, meeting: Meeting) -> None:
         self.session.add(meeting)
 
     def list_active(self) -> list[Meeting]:
-        return self.session.query(Meeting).filter(Meeting.finished_at.is_(None)).all()
+        return list(self.session.scalars(_active_meetings_stmt()))
 
     def list_recent(self, *, limit: int = 50) -> list[Meeting]:
-        return (
-            self.session.query(Meeting)
-            .order_by(desc(Meeting.created_at))
-            .limit(max(1, min(limit, 500)))
-            .all()
-        )
+        return list(self.session.scalars(_recent_meetings_stmt(limit)))
+
+    def list_page(
+        self,
+        *,
+        limit: int = 50,
+        after: CursorKey | None = None,
+        status: str | None = None,
+        tenant_id: str | None = None,
+    ) -> KeysetPage[Meeting]:
+        """
+        Страница встреч от новых к старым; after — ключ из decode_cursor(next_cursor).
+        """
+        limit = _page_limit(limit)
+        stmt = _meetings_page_stmt(limit=limit, after=after, status=status, tenant_id=tenant_id)
+        return keyset_page(list(self.session.scalars(stmt)), limit=limit, key=_meeting_key)
+
+    def list_keys_before(
+        self, *, before: datetime, after: CursorKey | None, limit: int
+    ) -> list[CursorKey]:
+        """
+        Ключи (created_at, id) встреч старше before по возрастанию, начиная после after.
+        Только ключи — без транскриптов и отчётов.
+        """
+        stmt = select(Meeting.created_at, Meeting.id).where(Meeting.created_at < before)
+        if after is not None:
+            stmt = stmt.where(tuple_(Meeting.created_at, Meeting.id) > tuple_(*after))
+        stmt = stmt.order_by(Meeting.created_at, Meeting.id).limit(max(1, limit))
+        return [tuple(row) for row in self.session.execute(stmt)]
+
+    def clear_raw_transcripts(self, *, after: CursorKey | None, upto: CursorKey) -> int:
+        """
+        UPDATE по диапазону ключей (after, upto]: raw_transcript = '' там, где он ещё не пуст.
+        """
+        key = tuple_(Meeting.created_at, Meeting.id)
+        stmt = update(Meeting).where(key <= tuple_(*upto), Meeting.raw_transcript != "")
+        if after is not None:
+            stmt = stmt.where(key > tuple_(*after))
+        stmt = stmt.values(raw_transcript="").execution_options(synchronize_session=False)
+        return int(self.session.execute(stmt).rowcount or 0)
+
+
+class AsyncMeetingRepository:
+    """
+    Чтения MeetingRepository для AsyncSession (storage.async_db).
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get(self, meeting_id: str) -> Meeting | None:
+        return await self.session.get(Meeting, meeting_id)
+
+    def save(self, meeting: Meeting) -> None:
+        self.session.add(meeting)
+
+    async def list_active(self) -> list[Meeting]:
+        return list(await self.session.scalars(_active_meetings_stmt()))
+
+    async def list_recent(self, *, limit: int = 50) -> list[Meeting]:
+        return list(await self.session.scalars(_recent_meetings_stmt(limit)))
+
+    async def list_page(
+        self,
+        *,
+        limit: int = 50,
+        after: CursorKey | None = None,
+        status: str | None = None,
+        tenant_id: str | None = None,
+    ) -> KeysetPage[Meeting]:
+        limit = _page_limit(limit)
+        stmt = _meetings_page_stmt(limit=limit, after=after, status=status, tenant_id=tenant_id)
+        return keyset_page(list(await self.session.scalars(stmt)), limit=limit, key=_meeting_key)
 
 
 # =============================================================================
@@ -118,13 +301,107 @@ class TranscriptSegmentRepository:
         existing.confidence = segment.confidence
         return existing
 
+    def upsert_many(
+        self,
+        rows: Sequence[dict[str, Any]],
+        *,
+        update_columns: Sequence[str] = SEGMENT_UPSERT_COLUMNS,
+    ) -> None:
+        """
+        Пакетная идемпотентная запись сегментов:
+        INSERT ... ON CONFLICT (meeting_id, seq) DO UPDATE одним запросом на пачку
+        (до _UPSERT_BATCH строк), без предварительного SELECT и RETURNING.
+
+        rows — словари с meeting_id, seq и колонками сегмента (набор ключей
+        одинаковый во всех строках, update_columns — среди них).
+        Повтор (meeting_id, seq) в rows — побеждает последний.
+        """
+        unique = list({(r["meeting_id"], int(r["seq"])): r for r in rows}.values())
+        if not unique:
+            return
+        insert = _dialect_insert(self.session)
+        if insert is None:
+            self._upsert_many_orm(unique, update_columns)
+            return
+
+        for start in range(0, len(unique), _UPSERT_BATCH):
+            stmt = insert(TranscriptSegment).values(unique[start : start + _UPSERT_BATCH])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TranscriptSegment.meeting_id, TranscriptSegment.seq],
+                set_={col: stmt.excluded[col] for col in update_columns},
+            )
+            self.session.execute(stmt)
+
+    def _upsert_many_orm(
+        self, rows: Sequence[dict[str, Any]], update_columns: Sequence[str]
+    ) -> None:
+        for row in rows:
+            existing = (
+                self.session.query(TranscriptSegment)
+                .filter(
+                    TranscriptSegment.meeting_id == row["meeting_id"],
+                    TranscriptSegment.seq == int(row["seq"]),
+                )
+                .one_or_none()
+            )
+            if existing is None:
+                self.session.add(TranscriptSegment(**row))
+                continue
+            for col in update_columns:
+                setattr(existing, col, row[col])
+
     def list_by_meeting(self, meeting_id: str) -> list[TranscriptSegment]:
-        return (
-            self.session.query(TranscriptSegment)
-            .filter(TranscriptSegment.meeting_id == meeting_id)
-            .order_by(TranscriptSegment.seq)
-            .all()
-        )
+        return list(self.session.scalars(_segments_stmt(meeting_id)))
+
+    def list_by_meeting_after(self, meeting_id: str, *, after_seq: int) -> list[TranscriptSegment]:
+        return list(self.session.scalars(_segments_stmt(meeting_id, after_seq=after_seq)))
+
+    def list_by_meeting_seqs(self, meeting_id: str, seqs: list[int]) -> list[TranscriptSegment]:
+        if not seqs:
+            return []
+        return list(self.session.scalars(_segments_stmt(meeting_id, seqs=seqs)))
+
+
+class AsyncTranscriptSegmentRepository:
+    """
+    Чтения TranscriptSegmentRepository для AsyncSession (storage.async_db).
+    Запись сегментов остаётся за воркерами (sync upsert_many).
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def list_by_meeting(self, meeting_id: str) -> list[TranscriptSegment]:
+        return list(await self.session.scalars(_segments_stmt(meeting_id)))
+
+    async def list_by_meeting_after(
+        self, meeting_id: str, *, after_seq: int
+    ) -> list[TranscriptSegment]:
+        return list(await self.session.scalars(_segments_stmt(meeting_id, after_seq=after_seq)))
+
+    async def list_by_meeting_seqs(
+        self, meeting_id: str, seqs: list[int]
+    ) -> list[TranscriptSegment]:
+        if not seqs:
+            return []
+        return list(await self.session.scalars(_segments_stmt(meeting_id, seqs=seqs)))
+
+
+class RetentionCheckpointRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def get(self, policy: str, *, for_update: bool = False) -> CursorKey | None:
+        row = self.session.get(RetentionCheckpoint, policy, with_for_update=for_update or None)
+        return (row.created_at, row.meeting_id) if row else None
+
+    def save(self, policy: str, key: CursorKey) -> None:
+        row = self.session.get(RetentionCheckpoint, policy)
+        if row is None:
+            row = RetentionCheckpoint(policy=policy, created_at=key[0], meeting_id=key[1])
+            self.session.add(row)
+        else:
+            row.created_at, row.meeting_id = key
 
 
 class SecurityAuditRepository:
@@ -178,3 +455,31 @@ class SecurityAuditRepository:
             .limit(max(1, min(limit, 500)))
             .all()
         )
+
+    def list_page(
+        self,
+        *,
+        limit: int = 100,
+        after: CursorKey | None = None,
+        outcome: str | None = None,
+        subject: str | None = None,
+    ) -> KeysetPage[SecurityAuditEvent]:
+        """
+        Страница событий от новых к старым (индексы (outcome|subject, created_at, id)).
+        """
+        limit = _page_limit(limit)
+        stmt = select(SecurityAuditEvent)
+        if outcome:
+            stmt = stmt.where(SecurityAuditEvent.outcome == outcome)
+        if subject:
+            stmt = stmt.where(SecurityAuditEvent.subject == subject)
+        stmt = keyset_stmt(
+            stmt,
+            created_col=SecurityAuditEvent.created_at,
+            id_col=SecurityAuditEvent.id,
+            after=after,
+            limit=limit,
+        )
+        return keyset_page(
+            list(self.session.scalars(stmt)), limit=limit, key=lambda e: (e.created_at, e.id)
+        )
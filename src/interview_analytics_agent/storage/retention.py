@@ -2,31 +2,168 @@
 Логика ретеншна данных.
 
 Назначение:
-- Очистка устаревших аудио
-- Очистка сырых транскриптов
+- Очистка устаревших аудио (chunk blob-ы встречи, RETENTION_DAYS_AUDIO)
+- Очистка сырых транскриптов и артефактов records (RETENTION_DAYS_TEXT)
 - Соблюдение политик хранения
+
+Батчи вместо полного прохода по таблице:
+- встречи старше cutoff перебираются по ключу (created_at, id) батчами
+  RETENTION_BATCH_SIZE; читаются только ключи (индекс ix_meetings_created_at_id)
+- сначала файлы батча удаляются параллельно (RETENTION_PURGE_CONCURRENCY потоков),
+  затем одна короткая транзакция: UPDATE по диапазону ключей батча + checkpoint
+- checkpoint политики (retention_checkpoints) — ключ последней обработанной
+  встречи: следующий запуск продолжает с него, а не с начала таблицы
+- память и время блокировок ограничены размером батча; все шаги идемпотентны:
+  сбой между удалением файлов и commit-ом повторит тот же батч
+- после политик (STORAGE_DEDUP) — blob.gc_blobs: объекты cas/, оставшиеся
+  без ссылок мимо delete/release (прерванная запись, потерянная строка manifest)
 """
 
 from __future__ import annotations
 
+import shutil
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, suppress
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
 from sqlalchemy.orm import Session
 
 from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.common.logging import get_project_logger
+from interview_analytics_agent.common.metrics import RETENTION_MEETINGS_TOTAL
+
+from . import blob, records
+from .db import db_session
+from .pagination import CursorKey
+from .repositories import MeetingRepository, RetentionCheckpointRepository
+
+log = get_project_logger()
+
+POLICY_TEXT = "text"
+POLICY_AUDIO = "audio"
+
+SessionScope = Callable[[], AbstractContextManager[Session]]
+
+
+@dataclass
+class RetentionResult:
+    text_meetings: int = 0
+    text_cleared: int = 0
+    audio_meetings: int = 0
+    batches: int = 0
+    cas_objects_removed: int = 0
+
+
+# ValueError — id, недопустимый как путь (защита от traversal): файлов у такой встречи нет
+def _purge_audio(meeting_id: str) -> None:
+    with suppress(ValueError):
+        blob.release_meeting_blobs(meeting_id)
+
 
-from .models import Meeting
+def _purge_records(meeting_id: str) -> None:
+    with suppress(ValueError):
+        shutil.rmtree(records.meeting_dir(meeting_id), ignore_errors=True)
 
 
-def apply_retention(session: Session) -> None:
+def _purge_parallel(
+    pool: ThreadPoolExecutor, purge: Callable[[str], None], meeting_ids: Iterable[str]
+) -> None:
+    # list(...) — дождаться всех и пробросить первую ошибку
+    list(pool.map(purge, meeting_ids))
+
+
+def _run_policy(
+    policy: str,
+    *,
+    cutoff: datetime,
+    session_scope: SessionScope,
+    pool: ThreadPoolExecutor,
+    purge: Callable[[str], None],
+    batch_size: int,
+    result: RetentionResult,
+) -> None:
+    with session_scope() as session:
+        after = RetentionCheckpointRepository(session).get(policy)
+
+    while True:
+        with session_scope() as session:
+            keys = MeetingRepository(session).list_keys_before(
+                before=cutoff, after=after, limit=batch_size
+            )
+        if not keys:
+            return
+
+        _purge_parallel(pool, purge, [meeting_id for _, meeting_id in keys])
+
+        upto: CursorKey = keys[-1]
+        with session_scope() as session:
+            if policy == POLICY_TEXT:
+                result.text_cleared += MeetingRepository(session).clear_raw_transcripts(
+                    after=after, upto=upto
+                )
+            checkpoints = RetentionCheckpointRepository(session)
+            # параллельный запуск мог уйти дальше — checkpoint назад не двигаем
+            current = checkpoints.get(policy, for_update=True)
+            if current is None or current < upto:
+                checkpoints.save(policy, upto)
+
+        if policy == POLICY_TEXT:
+            result.text_meetings += len(keys)
+        else:
+            result.audio_meetings += len(keys)
+        result.batches += 1
+        RETENTION_MEETINGS_TOTAL.labels(policy=policy).inc(len(keys))
+        log.info(
+            "retention_batch_done",
+            extra={
+                "payload": {
+                    "policy": policy,
+                    "meetings": len(keys),
+                    "checkpoint": {"created_at": upto[0].isoformat(), "meeting_id": upto[1]},
+                }
+            },
+        )
+        if len(keys) < batch_size:
+            return
+        after = upto
+
+
+def apply_retention(*, session_scope: SessionScope = db_session) -> RetentionResult:
     """
     Применение политик ретеншна к данным.
+
+    session_scope — фабрика транзакций (по умолчанию db_session): каждый батч
+    коммитится отдельно.
     """
     settings = get_settings()
-    cutoff_text = datetime.utcnow() - timedelta(days=settings.retention_days_text)
-
-    meetings = session.query(Meeting).all()
+    now = datetime.utcnow()
+    batch_size = max(1, int(settings.retention_batch_size))
+    result = RetentionResult()
 
-    for meeting in meetings:
-        if meeting.created_at < cutoff_text:
-            meeting.raw_transcript = ""
+    with ThreadPoolExecutor(
+        max_workers=max(1, int(settings.retention_purge_concurrency)),
+        thread_name_prefix="retention-purge",
+    ) as pool:
+        _run_policy(
+            POLICY_AUDIO,
+            cutoff=now - timedelta(days=settings.retention_days_audio),
+            session_scope=session_scope,
+            pool=pool,
+            purge=_purge_audio,
+            batch_size=batch_size,
+            result=result,
+        )
+        _run_policy(
+            POLICY_TEXT,
+            cutoff=now - timedelta(days=settings.retention_days_text),
+            session_scope=session_scope,
+            pool=pool,
+            purge=_purge_records,
+            batch_size=batch_size,
+            result=result,
+        )
+    if settings.storage_dedup:
+        result.cas_objects_removed = blob.gc_blobs()
+    return result
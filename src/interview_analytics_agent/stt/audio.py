@@ -0,0 +1,80 @@
+"""
+Декодированный аудио-чанк.
+
+Назначение:
+- декодировать чанк (контейнер/кодек -> PCM float32 mono 16 kHz) один раз
+- отдавать один и тот же буфер STT-провайдеру и диаризации,
+  без повторного demux/decode/resample в горячем пути
+
+PyAV импортируется лениво: без него decode_audio бросает ошибку,
+а try_decode_audio возвращает None.
+"""
+
+from __future__ import annotations
+
+import io
+from dataclasses import dataclass
+
+import numpy as np
+
+TARGET_SAMPLE_RATE = 16000
+
+
+@dataclass(frozen=True)
+class DecodedAudio:
+    samples: np.ndarray  # float32, mono
+    sample_rate: int = TARGET_SAMPLE_RATE
+    source_sample_rate: int | None = None
+    source_channels: int | None = None
+
+    @property
+    def duration_sec(self) -> float:
+        return float(self.samples.shape[0]) / float(self.sample_rate or 1)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.samples.shape[0] == 0
+
+
+def decode_audio(audio_bytes: bytes, *, target_sr: int = TARGET_SAMPLE_RATE) -> DecodedAudio:
+    """
+    Декодирует произвольный аудио-контейнер/кодек в моно float32 target_sr.
+
+    Требование:
+    - ffmpeg/libav должен быть доступен (через PyAV)
+    """
+    import av  # PyAV (ffmpeg bindings)
+
+    container = av.open(io.BytesIO(audio_bytes))
+    stream = next(s for s in container.streams if s.type == "audio")
+    resampler = av.audio.resampler.AudioResampler(format="fltp", layout="mono", rate=target_sr)
+
+    samples: list[np.ndarray] = []
+    frames = [*container.decode(stream), None]  # None — дочитать хвост ресемплера
+    for frame in frames:
+        for out in resampler.resample(frame):
+            # to_ndarray() -> shape (channels, samples) в float
+            arr = out.to_ndarray()
+            samples.append(np.asarray(arr[0] if arr.ndim == 2 else arr, dtype=np.float32))
+
+    codec_ctx = stream.codec_context
+    return DecodedAudio(
+        samples=np.concatenate(samples) if samples else np.zeros((0,), dtype=np.float32),
+        sample_rate=target_sr,
+        source_sample_rate=getattr(codec_ctx, "sample_rate", None) or None,
+        source_channels=getattr(codec_ctx, "channels", None) or None,
+    )
+
+
+def try_decode_audio(
+    audio_bytes: bytes | None, *, target_sr: int = TARGET_SAMPLE_RATE
+) -> DecodedAudio | None:
+    """
+    Как decode_audio, но None, если байтов нет, PyAV недоступен или чанк не декодируется.
+    """
+    if not audio_bytes:
+        return None
+    try:
+        return decode_audio(audio_bytes, target_sr=target_sr)
+    except Exception:
+        return None
@@ -4,12 +4,17 @@
 Назначение:
 - единый контракт для всех провайдеров
 - потоковая и пакетная обработка
+- decoded: уже декодированный чанк (stt.audio.DecodedAudio), если вызывающий
+  декодировал его сам — провайдер не должен декодировать байты повторно
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from .audio import DecodedAudio
 
 
 @dataclass
@@ -17,7 +22,10 @@ class STTResult:
     text: str
     confidence: float | None = None
     speaker: str | None = None
+    silent: bool = False  # чанк отсечён гейтом тишины, модель не вызывалась
 
 
 class STTProvider(Protocol):
-    def transcribe_chunk(self, *, audio: bytes, sample_rate: int) -> STTResult: ...
+    def transcribe_chunk(
+        self, *, audio: bytes, sample_rate: int, decoded: DecodedAudio | None = None
+    ) -> STTResult: ...
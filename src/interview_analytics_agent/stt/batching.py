@@ -0,0 +1,101 @@
+"""
+Микро-батчинг STT.
+
+Назначение:
+- потоки воркера (WorkerRuntime, concurrency > 1) вызывают transcribe_chunk как обычно
+- вызов ставится в общий буфер; фоновый поток собирает до max_batch чанков,
+  ожидая не дольше max_wait_ms после первого, и отдаёт их провайдеру одним
+  transcribe_batch
+- результаты раздаются обратно вызывающим потокам
+
+Если провайдер не умеет transcribe_batch или чанк не декодирован,
+вызов идёт напрямую в transcribe_chunk.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+from interview_analytics_agent.common.logging import get_project_logger
+from interview_analytics_agent.common.metrics import STT_BATCH_SIZE
+
+from .audio import DecodedAudio
+from .base import STTProvider, STTResult
+
+log = get_project_logger()
+
+
+@dataclass
+class _Pending:
+    decoded: DecodedAudio
+    future: Future = field(default_factory=Future)
+
+
+class BatchingSTTProvider(STTProvider):
+    def __init__(self, provider, *, max_batch: int = 4, max_wait_ms: int = 50) -> None:
+        self.provider = provider
+        self.max_batch = max(1, int(max_batch))
+        self.max_wait_sec = max(0, int(max_wait_ms)) / 1000.0
+        self._queue: list[_Pending] = []
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def batching_supported(self) -> bool:
+        return callable(getattr(self.provider, "transcribe_batch", None))
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="stt-batcher", daemon=True)
+            self._thread.start()
+
+    def transcribe_chunk(
+        self, *, audio: bytes, sample_rate: int, decoded: DecodedAudio | None = None
+    ) -> STTResult:
+        if decoded is None or decoded.is_empty or not self.batching_supported:
+            return self.provider.transcribe_chunk(
+                audio=audio, sample_rate=sample_rate, decoded=decoded
+            )
+        item = _Pending(decoded=decoded)
+        with self._cond:
+            self._ensure_thread()
+            self._queue.append(item)
+            self._cond.notify_all()
+        return item.future.result()
+
+    def _take_batch(self) -> list[_Pending]:
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+            deadline = time.monotonic() + self.max_wait_sec
+            while len(self._queue) < self.max_batch:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                self._cond.wait(left)
+            batch = self._queue[: self.max_batch]
+            del self._queue[: self.max_batch]
+            return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._take_batch()
+            STT_BATCH_SIZE.observe(len(batch))
+            try:
+                results = self.provider.transcribe_batch(
+                    [p.decoded for p in batch], batch_size=self.max_batch
+                )
+                for pending, result in zip(batch, results, strict=True):
+                    pending.future.set_result(result)
+            except Exception as e:
+                log.warning(
+                    "stt_batch_failed",
+                    extra={"payload": {"batch": len(batch), "err": str(e)[:200]}},
+                )
+                # ошибка батча -> ошибка каждого вызова: задачи уйдут в штатный retry
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
@@ -1,21 +1,42 @@
 """
 Lightweight diarization (speaker assignment) with graceful degradation.
+
+Embeddings are computed with numpy on a float32 mono signal:
+- spectrum (default): rfft magnitudes of the first low-frequency bins
+- logmel / mfcc (DIARIZATION_FEATURES): per-frame log-mel / MFCC,
+  summarized as mean + std over frames
 """
 
 from __future__ import annotations
 
-import io
-import math
 import threading
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from interview_analytics_agent.common.config import get_settings
+
+from .audio import DecodedAudio, try_decode_audio
 
 _STATE_LOCK = threading.Lock()
 
+_SAMPLE_RATE = 16000
+_SPECTRUM_BINS = 24
+_MIN_SAMPLES = 256
+_FRAME_LEN = 400  # 25 ms @ 16 kHz
+_FRAME_HOP = 160  # 10 ms
+_N_FFT = 512
+_N_MELS = 40
+_N_MFCC = 13
+_SIMILARITY_THRESHOLD = 0.86
+_MAX_SPEAKERS = 4
+
 
 @dataclass
 class _SpeakerProto:
     label: str
-    centroid: list[float]
+    centroid: np.ndarray
     count: int
 
 
@@ -26,81 +47,100 @@ def _norm(label: str) -> str:
     return (label or "").strip().lower()
 
 
-def _dot(a: list[float], b: list[float]) -> float:
-    return float(sum(x * y for x, y in zip(a, b, strict=False)))
-
-
-def _norm_l2(v: list[float]) -> float:
-    return math.sqrt(float(sum(x * x for x in v)))
-
-
-def _cosine(a: list[float], b: list[float]) -> float:
-    denom = _norm_l2(a) * _norm_l2(b)
+def _cosine(a: np.ndarray, b: np.ndarray) -> float:
+    n = min(a.shape[0], b.shape[0])
+    a, b = a[:n], b[:n]
+    denom = float(np.linalg.norm(a) * np.linalg.norm(b))
     if denom <= 1e-9:
         return 0.0
-    return _dot(a, b) / denom
+    return float(np.dot(a, b)) / denom
 
 
-def _normalize(v: list[float]) -> list[float] | None:
-    norm = _norm_l2(v)
-    if norm <= 1e-9:
+def _normalize(v: np.ndarray) -> np.ndarray | None:
+    norm = float(np.linalg.norm(v))
+    if not np.isfinite(norm) or norm <= 1e-9:
         return None
-    return [x / norm for x in v]
-
-
-def _decode_audio_embedding(audio_bytes: bytes | None) -> list[float] | None:
-    if not audio_bytes:
-        return None
-    try:
-        import av
-    except Exception:
-        return None
-
-    try:
-        container = av.open(io.BytesIO(audio_bytes))
-        stream = next(s for s in container.streams if s.type == "audio")
-    except Exception:
+    return (v / norm).astype(np.float32)
+
+
+def _spectrum_embedding(signal: np.ndarray) -> np.ndarray:
+    sample = signal[:_SAMPLE_RATE].astype(np.float64)
+    spectrum = np.abs(np.fft.rfft(sample)) / sample.shape[0]
+    return spectrum[1 : _SPECTRUM_BINS + 1]
+
+
+@lru_cache(maxsize=4)
+def _mel_filterbank(sample_rate: int, n_fft: int, n_mels: int) -> np.ndarray:
+    def hz_to_mel(hz):
+        return 2595.0 * np.log10(1.0 + np.asarray(hz) / 700.0)
+
+    def mel_to_hz(mel):
+        return 700.0 * (10.0 ** (np.asarray(mel) / 2595.0) - 1.0)
+
+    mel_points = np.linspace(hz_to_mel(0.0), hz_to_mel(sample_rate / 2.0), n_mels + 2)
+    bins = np.floor((n_fft + 1) * mel_to_hz(mel_points) / sample_rate).astype(int)
+    fb = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float32)
+    for m in range(1, n_mels + 1):
+        left, center, right = bins[m - 1], bins[m], bins[m + 1]
+        if center > left:
+            fb[m - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+        if right > center:
+            fb[m - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+    return fb
+
+
+@lru_cache(maxsize=4)
+def _dct_matrix(n_mfcc: int, n_mels: int) -> np.ndarray:
+    k = np.arange(n_mfcc)[:, None]
+    n = np.arange(n_mels)[None, :]
+    return (np.cos(np.pi * k * (2 * n + 1) / (2 * n_mels)) * np.sqrt(2.0 / n_mels)).astype(
+        np.float32
+    )
+
+
+def _log_mel_frames(signal: np.ndarray) -> np.ndarray:
+    if signal.shape[0] < _FRAME_LEN:
+        signal = np.pad(signal, (0, _FRAME_LEN - signal.shape[0]))
+    n_frames = 1 + (signal.shape[0] - _FRAME_LEN) // _FRAME_HOP
+    idx = np.arange(_FRAME_LEN)[None, :] + _FRAME_HOP * np.arange(n_frames)[:, None]
+    frames = signal[idx] * np.hamming(_FRAME_LEN).astype(np.float32)
+    power = np.abs(np.fft.rfft(frames, n=_N_FFT, axis=1)) ** 2 / _N_FFT
+    mel = power @ _mel_filterbank(_SAMPLE_RATE, _N_FFT, _N_MELS).T
+    return np.log(mel + 1e-10)
+
+
+def _frames_embedding(feats: np.ndarray) -> np.ndarray:
+    # per-utterance mean normalization, so cosine compares shape rather than loudness
+    centered = feats - feats.mean(axis=1, keepdims=True)
+    return np.concatenate([centered.mean(axis=0), feats.std(axis=0)])
+
+
+def _embedding_from_pcm(
+    signal: np.ndarray | None, features: str | None = None
+) -> np.ndarray | None:
+    """
+    Speaker embedding from a float32 mono 16 kHz signal.
+    """
+    if signal is None or signal.shape[0] < _MIN_SAMPLES:
         return None
+    mode = _norm(features or get_settings().diarization_features)
+    if mode == "logmel":
+        emb = _frames_embedding(_log_mel_frames(signal))
+    elif mode == "mfcc":
+        mfcc = _log_mel_frames(signal) @ _dct_matrix(_N_MFCC, _N_MELS).T
+        emb = _frames_embedding(mfcc[:, 1:])  # c0 = loudness
+    else:
+        emb = _spectrum_embedding(signal)
+    return _normalize(emb)
 
-    signal: list[float] = []
-    try:
-        for frame in container.decode(stream):
-            arr = frame.to_ndarray()
-            data = arr.tolist() if hasattr(arr, "tolist") else []
-            if not data:
-                continue
-            if isinstance(data[0], list):
-                channels = [list(map(float, ch)) for ch in data if isinstance(ch, list)]
-                if not channels:
-                    continue
-                min_len = min(len(ch) for ch in channels)
-                for idx in range(min_len):
-                    signal.append(sum(ch[idx] for ch in channels) / len(channels))
-            else:
-                signal.extend(float(x) for x in data)
-    except Exception:
-        return None
 
-    if len(signal) < 256:
-        return None
-    sample = signal[: min(len(signal), 16000)]
-
-    # lightweight frequency embedding via DFT over low-frequency bins
-    bins = 24
-    emb: list[float] = []
-    n = len(sample)
-    for k in range(1, bins + 1):
-        real = 0.0
-        imag = 0.0
-        for t, x in enumerate(sample):
-            angle = 2.0 * math.pi * k * t / n
-            real += x * math.cos(angle)
-            imag -= x * math.sin(angle)
-        emb.append(math.sqrt(real * real + imag * imag) / n)
-    return _normalize(emb)
+def _decode_audio_embedding(audio_bytes: bytes | None) -> np.ndarray | None:
+    decoded = try_decode_audio(audio_bytes, target_sr=_SAMPLE_RATE)
+    return _embedding_from_pcm(decoded.samples if decoded is not None else None)
 
 
-def _assign_by_embedding(meeting_id: str, embedding: list[float]) -> str:
+def _assign_by_embedding(meeting_id: str, embedding) -> str:
+    embedding = np.asarray(embedding, dtype=np.float32)
     with _STATE_LOCK:
         protos = _STATE.setdefault(meeting_id, [])
         if not protos:
@@ -108,30 +148,23 @@ def _assign_by_embedding(meeting_id: str, embedding: list[float]) -> str:
             protos.append(proto)
             return proto.label
 
-        best_idx = -1
-        best_sim = -1.0
-        for idx, proto in enumerate(protos):
-            sim = _cosine(embedding, proto.centroid)
-            if sim > best_sim:
-                best_idx = idx
-                best_sim = sim
+        sims = [_cosine(embedding, proto.centroid) for proto in protos]
+        best_idx = int(np.argmax(sims))
+        best_sim = sims[best_idx]
 
-        if best_idx >= 0 and best_sim >= 0.86:
+        if best_sim >= _SIMILARITY_THRESHOLD:
             proto = protos[best_idx]
-            n = proto.count + 1
-            proto.centroid = [
-                (proto.centroid[i] * proto.count + embedding[i]) / n
-                for i in range(min(len(proto.centroid), len(embedding)))
-            ]
-            proto.count = n
+            n = min(proto.centroid.shape[0], embedding.shape[0])
+            proto.centroid = (proto.centroid[:n] * proto.count + embedding[:n]) / (proto.count + 1)
+            proto.count += 1
             return proto.label
 
-        if len(protos) < 4:
+        if len(protos) < _MAX_SPEAKERS:
             label = f"Speaker-{chr(ord('A') + len(protos))}"
             protos.append(_SpeakerProto(label=label, centroid=embedding, count=1))
             return label
 
-        return protos[best_idx].label if best_idx >= 0 else "Speaker-A"
+        return protos[best_idx].label
 
 
 def resolve_speaker(
@@ -141,13 +174,20 @@ def resolve_speaker(
     seq: int | None = None,
     meeting_id: str | None = None,
     audio_bytes: bytes | None = None,
+    decoded: DecodedAudio | None = None,
 ) -> str | None:
+    """
+    Pass `decoded` (the same buffer given to STT) to skip decoding audio_bytes again.
+    """
     normalized = _norm(hint or "")
     if normalized:
         return str(hint).strip()
 
     if meeting_id:
-        embedding = _decode_audio_embedding(audio_bytes)
+        if decoded is not None and decoded.sample_rate == _SAMPLE_RATE:
+            embedding = _embedding_from_pcm(decoded.samples)
+        else:
+            embedding = _decode_audio_embedding(audio_bytes)
         if embedding is not None:
             return _assign_by_embedding(str(meeting_id), embedding)
 
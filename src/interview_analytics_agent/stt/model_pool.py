@@ -0,0 +1,114 @@
+"""
+Пул прогретых Whisper-моделей на процесс.
+
+Назначение:
+- каждая пара (model_size, device, compute_type) загружается один раз на процесс;
+  worker_stt, local_pipeline и quick_record получают одну и ту же модель
+- веса общие для всех потоков процесса: WhisperModel создаётся с
+  num_workers = WHISPER_INFERENCE_SLOTS, поэтому параллельные transcribe
+  из разных потоков действительно идут параллельно (CTranslate2)
+- число одновременных инференсов ограничено слотами (semaphore)
+
+Почему не fork-after-load: пулы потоков CTranslate2 не переживают fork,
+поэтому несколько процессов с общей моделью не делаем — вместо этого
+масштабируемся потоками внутри одного процесса (WORKER_CONCURRENCY).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from interview_analytics_agent.common.logging import get_project_logger
+from interview_analytics_agent.common.metrics import STT_INFERENCE_SLOTS_BUSY
+
+log = get_project_logger()
+
+
+@dataclass(frozen=True)
+class ModelKey:
+    model_size: str
+    device: str
+    compute_type: str
+
+
+class PooledWhisperModel:
+    def __init__(self, *, key: ModelKey, model, slots: int) -> None:
+        self.key = key
+        self.model = model
+        self.slots = max(1, int(slots))
+        self._sem = threading.BoundedSemaphore(self.slots)
+        self._busy = 0
+        self._busy_lock = threading.Lock()
+
+    def _set_busy(self, delta: int) -> None:
+        with self._busy_lock:
+            self._busy += delta
+            STT_INFERENCE_SLOTS_BUSY.labels(model=self.key.model_size).set(self._busy)
+
+    @contextmanager
+    def inference_slot(self) -> Iterator[None]:
+        """
+        Занять слот инференса на время вызова модели (включая чтение генератора сегментов).
+        """
+        with self._sem:
+            self._set_busy(+1)
+            try:
+                yield
+            finally:
+                self._set_busy(-1)
+
+
+_MODELS: dict[ModelKey, PooledWhisperModel] = {}
+_LOCK = threading.Lock()
+
+
+def get_whisper_model(
+    *, model_size: str, device: str, compute_type: str, slots: int = 1
+) -> PooledWhisperModel:
+    """
+    Вернуть модель из пула процесса, загрузив её при первом обращении.
+
+    slots учитывается только при первой загрузке пары.
+    """
+    key = ModelKey(model_size=model_size, device=device, compute_type=compute_type)
+    pooled = _MODELS.get(key)
+    if pooled is not None:
+        return pooled
+
+    with _LOCK:
+        pooled = _MODELS.get(key)
+        if pooled is not None:
+            return pooled
+
+        from faster_whisper import WhisperModel
+
+        started = time.perf_counter()
+        model = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            num_workers=max(1, int(slots)),
+        )
+        pooled = PooledWhisperModel(key=key, model=model, slots=slots)
+        _MODELS[key] = pooled
+        log.info(
+            "whisper_model_loaded",
+            extra={
+                "payload": {
+                    "model_size": model_size,
+                    "device": device,
+                    "compute_type": compute_type,
+                    "slots": pooled.slots,
+                    "load_ms": int((time.perf_counter() - started) * 1000),
+                }
+            },
+        )
+        return pooled
+
+
+def loaded_models() -> list[ModelKey]:
+    return list(_MODELS)
@@ -0,0 +1,223 @@
+"""
+Кэш результатов STT по содержимому аудио.
+
+Назначение:
+- ретраи (requeue_with_backoff), повторный ingest того же чанка под новым
+  idempotency key и переобработка загрузок не гоняют модель на тех же байтах
+- ключ: sha256(аудио) + отпечаток параметров распознавания
+  (провайдер, модель, compute_type, язык, beam, VAD)
+
+Бэкенды (STT_CACHE_BACKEND):
+- off   — кэш выключен
+- redis — stt:cache:<key> (JSON, TTL) + индекс stt:cache:lru (ZSET по времени
+          последнего обращения); сверх STT_CACHE_MAX_ENTRIES вытесняются самые старые
+- disk  — файлы <STT_CACHE_DIR>/<key[:2]>/<key>.json, mtime = последнее обращение;
+          вытеснение LRU по mtime раз в _DISK_EVICT_EVERY записей
+          (в QUEUE_MODE=inline используется вместо redis)
+
+Ошибки кэша не ломают распознавание: считаются промахом.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from interview_analytics_agent.common.logging import get_project_logger
+from interview_analytics_agent.common.metrics import STT_CACHE_TOTAL
+from interview_analytics_agent.common.utils import sha256_hex
+
+from .audio import DecodedAudio
+from .base import STTProvider, STTResult
+
+log = get_project_logger()
+
+CACHE_BACKENDS = ("off", "redis", "disk")
+
+_REDIS_PREFIX = "stt:cache:"
+_REDIS_LRU_KEY = "stt:cache:lru"
+_DISK_EVICT_EVERY = 64
+
+
+def params_fingerprint(settings) -> str:
+    """
+    Параметры, от которых зависит текст распознавания.
+    """
+    provider = (settings.stt_provider or "").strip().lower()
+    if provider in {"mock", "google", "salutespeech"}:
+        return provider
+    return "|".join(
+        [
+            "whisper_local",
+            str(settings.whisper_model_size),
+            str(settings.whisper_compute_type),
+            str(settings.whisper_language),
+            f"beam={int(settings.whisper_beam_size)}",
+            f"vad={int(bool(settings.whisper_vad_filter))}",
+        ]
+    )
+
+
+def cache_key(audio: bytes, fingerprint: str) -> str:
+    return sha256_hex(sha256_hex(audio).encode("ascii") + b"\0" + fingerprint.encode("utf-8"))
+
+
+def _dump(result: STTResult) -> str:
+    return json.dumps(
+        {"text": result.text, "confidence": result.confidence, "speaker": result.speaker},
+        ensure_ascii=False,
+    )
+
+
+def _load(raw: str | bytes) -> STTResult:
+    data = json.loads(raw)
+    return STTResult(
+        text=str(data.get("text") or ""),
+        confidence=data.get("confidence"),
+        speaker=data.get("speaker"),
+    )
+
+
+class RedisSTTCache:
+    backend = "redis"
+
+    def __init__(self, client, *, max_entries: int, ttl_sec: int) -> None:
+        self.client = client
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_sec = max(1, int(ttl_sec))
+
+    def get(self, key: str) -> STTResult | None:
+        raw = self.client.get(_REDIS_PREFIX + key)
+        if raw is None:
+            self.client.zrem(_REDIS_LRU_KEY, key)
+            return None
+        self.client.zadd(_REDIS_LRU_KEY, {key: time.time()})
+        return _load(raw)
+
+    def set(self, key: str, result: STTResult) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.set(_REDIS_PREFIX + key, _dump(result), ex=self.ttl_sec)
+        pipe.zadd(_REDIS_LRU_KEY, {key: time.time()})
+        pipe.zcard(_REDIS_LRU_KEY)
+        size = int(pipe.execute()[-1] or 0)
+        if size > self.max_entries:
+            evicted = [k for k, _ in self.client.zpopmin(_REDIS_LRU_KEY, size - self.max_entries)]
+            if evicted:
+                self.client.delete(*[_REDIS_PREFIX + k for k in evicted])
+
+
+class DiskSTTCache:
+    backend = "disk"
+
+    def __init__(self, base_dir: str | Path, *, max_entries: int) -> None:
+        self.base_dir = Path(base_dir).resolve()
+        self.max_entries = max(1, int(max_entries))
+        self._writes = 0
+
+    def _path(self, key: str) -> Path:
+        return self.base_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> STTResult | None:
+        path = self._path(key)
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        os.utime(path)  # LRU: отметка последнего обращения
+        return _load(raw)
+
+    def set(self, key: str, result: STTResult) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        tmp.write_text(_dump(result), encoding="utf-8")
+        os.replace(tmp, path)
+        self._writes += 1
+        if self._writes % _DISK_EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        entries = []
+        for path in self.base_dir.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return 0
+        entries.sort()
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+        return excess
+
+
+class CachedSTTProvider(STTProvider):
+    """
+    Обёртка над провайдером: сначала кэш по содержимому, потом модель.
+    """
+
+    def __init__(self, provider, cache, *, fingerprint: str) -> None:
+        self.provider = provider
+        self.cache = cache
+        self.fingerprint = fingerprint
+
+    def _get(self, key: str) -> STTResult | None:
+        try:
+            return self.cache.get(key)
+        except Exception as e:
+            log.warning("stt_cache_get_failed", extra={"payload": {"err": str(e)[:200]}})
+            return None
+
+    def _set(self, key: str, result: STTResult) -> None:
+        try:
+            self.cache.set(key, result)
+        except Exception as e:
+            log.warning("stt_cache_set_failed", extra={"payload": {"err": str(e)[:200]}})
+
+    def transcribe_chunk(
+        self, *, audio: bytes, sample_rate: int, decoded: DecodedAudio | None = None
+    ) -> STTResult:
+        if not audio:
+            return self.provider.transcribe_chunk(
+                audio=audio, sample_rate=sample_rate, decoded=decoded
+            )
+        key = cache_key(audio, self.fingerprint)
+        cached = self._get(key)
+        if cached is not None:
+            STT_CACHE_TOTAL.labels(backend=self.cache.backend, result="hit").inc()
+            return cached
+        STT_CACHE_TOTAL.labels(backend=self.cache.backend, result="miss").inc()
+        result = self.provider.transcribe_chunk(
+            audio=audio, sample_rate=sample_rate, decoded=decoded
+        )
+        self._set(key, result)
+        return result
+
+
+def with_result_cache(provider, settings):
+    """
+    Обернуть провайдер кэшем результатов, если он включён в настройках.
+    """
+    backend = (settings.stt_cache_backend or "off").strip().lower()
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f"unknown STT cache backend: {backend}")
+    if backend == "off":
+        return provider
+    if backend == "redis" and (settings.queue_mode or "").strip().lower() == "inline":
+        # inline-режим живёт без Redis
+        backend = "disk"
+    if backend == "redis":
+        from interview_analytics_agent.queue.redis import redis_client
+
+        cache = RedisSTTCache(
+            redis_client(),
+            max_entries=settings.stt_cache_max_entries,
+            ttl_sec=settings.stt_cache_ttl_sec,
+        )
+    else:
+        cache = DiskSTTCache(settings.stt_cache_dir, max_entries=settings.stt_cache_max_entries)
+    return CachedSTTProvider(provider, cache, fingerprint=params_fingerprint(settings))
@@ -8,9 +8,12 @@ SaluteSpeech STT (заглушка).
 
 from __future__ import annotations
 
+from .audio import DecodedAudio
 from .base import STTProvider, STTResult
 
 
 class SaluteSpeechProvider(STTProvider):
-    def transcribe_chunk(self, *, audio: bytes, sample_rate: int) -> STTResult:
+    def transcribe_chunk(
+        self, *, audio: bytes, sample_rate: int, decoded: DecodedAudio | None = None
+    ) -> STTResult:
         return STTResult(text="", confidence=None)
@@ -0,0 +1,163 @@
+"""
+Гейт тишины перед STT.
+
+Назначение:
+- по уже декодированному PCM (stt.audio.DecodedAudio) дёшево понять, что в чанке
+  нет речи (тишина, фоновый шум линии), и не вызывать модель
+- такой чанк становится пустым сегментом (STTResult.silent=True)
+
+Режимы (STT_SILENCE_GATE):
+- off     — гейт выключен
+- energy  — только общий RMS чанка (dBFS) ниже порога
+- frames  — плюс покадровый VAD на numpy (30 мс): кадр считается речевым,
+            если он громче порога и его zero-crossing rate не как у
+            широкополосного шума; чанк тихий, если речевых кадров меньше порога
+- webrtc  — как frames, но решение по кадрам принимает webrtcvad
+            (если пакет не установлен — откат на frames)
+
+Чанки, которые не удалось декодировать (decoded=None), гейт пропускает в STT как есть.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from interview_analytics_agent.common.metrics import STT_SILENCE_GATE_TOTAL
+
+from .audio import DecodedAudio
+from .base import STTProvider, STTResult
+
+try:  # optional dependency
+    import webrtcvad
+except ImportError:  # pragma: no cover - depends on environment
+    webrtcvad = None
+
+GATE_MODES = ("off", "energy", "frames", "webrtc")
+
+_FRAME_MS = 30
+_EPS = 1e-10
+# у речи ZCR заметно ниже, чем у широкополосного шума
+_MAX_SPEECH_ZCR = 0.35
+
+
+def rms_dbfs(samples: np.ndarray) -> float:
+    if samples.shape[0] == 0:
+        return float("-inf")
+    rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+    return 20.0 * float(np.log10(rms + _EPS))
+
+
+def _frames(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    size = max(1, sample_rate * _FRAME_MS // 1000)
+    count = samples.shape[0] // size
+    return samples[: count * size].reshape(count, size)
+
+
+def _numpy_speech_frames(frames: np.ndarray, *, rms_threshold_db: float) -> np.ndarray:
+    energy_db = 10.0 * np.log10(np.mean(np.square(frames, dtype=np.float64), axis=1) + _EPS)
+    loud = energy_db > rms_threshold_db
+    signs = np.signbit(frames)
+    zcr = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+    return loud & (zcr < _MAX_SPEECH_ZCR)
+
+
+def _webrtc_speech_frames(frames: np.ndarray, *, sample_rate: int, aggressiveness: int):
+    vad = webrtcvad.Vad(int(aggressiveness))
+    pcm16 = (np.clip(frames, -1.0, 1.0) * 32767.0).astype("<i2")
+    return np.array([vad.is_speech(row.tobytes(), sample_rate) for row in pcm16], dtype=bool)
+
+
+def speech_ratio(
+    decoded: DecodedAudio,
+    *,
+    rms_threshold_db: float,
+    use_webrtc: bool = False,
+    aggressiveness: int = 2,
+) -> float:
+    """
+    Доля речевых кадров по 30 мс.
+    """
+    frames = _frames(decoded.samples, decoded.sample_rate)
+    if frames.shape[0] == 0:
+        return 0.0
+    if use_webrtc and webrtcvad is not None:
+        voiced = _webrtc_speech_frames(
+            frames, sample_rate=decoded.sample_rate, aggressiveness=aggressiveness
+        )
+    else:
+        voiced = _numpy_speech_frames(frames, rms_threshold_db=rms_threshold_db)
+    return float(np.mean(voiced))
+
+
+class SilenceGate:
+    def __init__(
+        self,
+        *,
+        mode: str = "energy",
+        rms_threshold_db: float = -50.0,
+        min_speech_ratio: float = 0.05,
+        webrtc_aggressiveness: int = 2,
+    ) -> None:
+        mode = (mode or "off").strip().lower()
+        if mode not in GATE_MODES:
+            raise ValueError(f"unknown silence gate mode: {mode}")
+        self.mode = mode
+        self.rms_threshold_db = float(rms_threshold_db)
+        self.min_speech_ratio = float(min_speech_ratio)
+        self.webrtc_aggressiveness = int(webrtc_aggressiveness)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def is_silent(self, decoded: DecodedAudio) -> bool:
+        if decoded.is_empty:
+            return True
+        if rms_dbfs(decoded.samples) < self.rms_threshold_db:
+            return True
+        if self.mode == "energy":
+            return False
+        ratio = speech_ratio(
+            decoded,
+            rms_threshold_db=self.rms_threshold_db,
+            use_webrtc=self.mode == "webrtc",
+            aggressiveness=self.webrtc_aggressiveness,
+        )
+        return ratio < self.min_speech_ratio
+
+
+class SilenceGatedSTTProvider(STTProvider):
+    """
+    Обёртка над провайдером: тихие чанки не доходят до модели.
+    """
+
+    def __init__(self, provider, gate: SilenceGate) -> None:
+        self.provider = provider
+        self.gate = gate
+
+    def transcribe_chunk(
+        self, *, audio: bytes, sample_rate: int, decoded: DecodedAudio | None = None
+    ) -> STTResult:
+        if decoded is not None and self.gate.is_silent(decoded):
+            STT_SILENCE_GATE_TOTAL.labels(result="skipped").inc()
+            return STTResult(text="", silent=True)
+        STT_SILENCE_GATE_TOTAL.labels(result="passed").inc()
+        return self.provider.transcribe_chunk(audio=audio, sample_rate=sample_rate, decoded=decoded)
+
+
+def gate_from_settings(settings) -> SilenceGate:
+    return SilenceGate(
+        mode=settings.stt_silence_gate,
+        rms_threshold_db=settings.stt_silence_rms_db,
+        min_speech_ratio=settings.stt_silence_min_speech_ratio,
+    )
+
+
+def with_silence_gate(provider, settings):
+    """
+    Обернуть провайдер гейтом, если он включён в настройках.
+    """
+    gate = gate_from_settings(settings)
+    if not gate.enabled:
+        return provider
+    return SilenceGatedSTTProvider(provider, gate)
@@ -2,10 +2,13 @@
 Локальный STT на базе faster-whisper.
 
 Что делает:
-- принимает bytes аудио чанка
-- декодирует через ffmpeg (нужен пакет ffmpeg в образе)
-- запускает Whisper модель локально
+- принимает bytes аудио чанка или уже декодированный DecodedAudio
+- декодирует через ffmpeg (нужен пакет ffmpeg в образе), если decoded не передан
+- запускает Whisper модель локально (модель берётся из пула процесса, stt.model_pool)
 - возвращает текст + (примерную) уверенность
+- transcribe_batch: несколько чанков одним батчем через BatchedInferencePipeline
+  (чанки склеиваются в один буфер, каждый чанк/речевой фрагмент — отдельный
+  clip, сегменты раскладываются обратно по чанкам по времени начала)
 
 Примечание:
 - для реально качественного realtime лучше подавать PCM16/mono/16k,
@@ -14,41 +17,25 @@
 
 from __future__ import annotations
 
-import io
+from bisect import bisect_right
 
-import av  # PyAV (ffmpeg bindings)
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline
+from faster_whisper.vad import VadOptions, get_speech_timestamps
 
 from interview_analytics_agent.common.config import get_settings
 
+from .audio import DecodedAudio, decode_audio
 from .base import STTProvider, STTResult
+from .model_pool import get_whisper_model
 
+_SR = 16000
+_MAX_CLIP_SAMPLES = 30 * _SR  # окно Whisper
+_ALIGN_SAMPLES = _SR // 1000  # чанки в склейке начинаются на целой миллисекунде
 
-def _decode_audio_to_float32(audio_bytes: bytes, target_sr: int = 16000) -> np.ndarray:
-    """
-    Декодирует произвольный аудио-контейнер/кодек в моно float32 16kHz.
 
-    Требование:
-    - ffmpeg/libav должен быть доступен (через PyAV)
-    """
-    container = av.open(io.BytesIO(audio_bytes))
-    stream = next(s for s in container.streams if s.type == "audio")
-    resampler = av.audio.resampler.AudioResampler(format="fltp", layout="mono", rate=target_sr)
-
-    samples: list[np.ndarray] = []
-    for frame in container.decode(stream):
-        frame = resampler.resample(frame)
-        # frame.to_ndarray() -> shape (channels, samples) в float
-        arr = frame.to_ndarray()
-        if arr.ndim == 2:
-            arr = arr[0]
-        samples.append(arr.astype(np.float32))
-
-    if not samples:
-        return np.zeros((0,), dtype=np.float32)
-
-    return np.concatenate(samples)
+def _join_text(segments) -> str:
+    return " ".join(t for t in (seg.text.strip() for seg in segments if seg.text) if t).strip()
 
 
 class WhisperLocalProvider(STTProvider):
@@ -69,35 +56,91 @@ class WhisperLocalProvider(STTProvider):
         device = device or s.whisper_device
         compute_type = compute_type or s.whisper_compute_type
 
-        self.model = WhisperModel(
-            model_size,
+        # модель общая для всех провайдеров процесса с теми же параметрами
+        self.pooled = get_whisper_model(
+            model_size=model_size,
             device=device,
             compute_type=compute_type,
+            slots=s.whisper_inference_slots,
         )
+        self.model = self.pooled.model
 
         self.language = language or s.whisper_language
         self.vad_filter = s.whisper_vad_filter if vad_filter is None else vad_filter
         self.beam_size = beam_size or s.whisper_beam_size
-
-    def transcribe_chunk(self, *, audio: bytes, sample_rate: int) -> STTResult:
-        wav = _decode_audio_to_float32(audio, target_sr=16000)
+        self._batched: BatchedInferencePipeline | None = None
+
+    def transcribe_chunk(
+        self, *, audio: bytes, sample_rate: int, decoded: DecodedAudio | None = None
+    ) -> STTResult:
+        if decoded is None:
+            decoded = decode_audio(audio, target_sr=16000)
+        wav = decoded.samples
         if wav.size == 0:
             return STTResult(text="", confidence=None)
 
-        segments, info = self.model.transcribe(
-            wav,
-            language=self.language,
-            vad_filter=self.vad_filter,
-            beam_size=self.beam_size,
-        )
-
-        text_parts: list[str] = []
-        for seg in segments:
-            if seg.text:
-                text_parts.append(seg.text.strip())
-
-        text = " ".join([t for t in text_parts if t]).strip()
+        # сегменты — ленивый генератор: читаем его, не отпуская слот
+        with self.pooled.inference_slot():
+            segments, info = self.model.transcribe(
+                wav,
+                language=self.language,
+                vad_filter=self.vad_filter,
+                beam_size=self.beam_size,
+            )
+            text = _join_text(segments)
 
         # faster-whisper не даёт "confidence" как одно число стабильно,
         # оставим None, позже можно считать среднюю logprob.
         return STTResult(text=text, confidence=None, speaker=None)
+
+    def _speech_clips(self, wav: np.ndarray) -> list[tuple[int, int]]:
+        """
+        Речевые фрагменты чанка (в сэмплах), каждый не длиннее окна Whisper.
+        """
+        if self.vad_filter:
+            ts = get_speech_timestamps(wav, VadOptions(max_speech_duration_s=30))
+            return [(int(t["start"]), int(t["end"])) for t in ts if t["end"] > t["start"]]
+        return [
+            (start, min(start + _MAX_CLIP_SAMPLES, wav.shape[0]))
+            for start in range(0, wav.shape[0], _MAX_CLIP_SAMPLES)
+        ]
+
+    def transcribe_batch(
+        self, items: list[DecodedAudio], *, batch_size: int | None = None
+    ) -> list[STTResult]:
+        """
+        Распознать несколько декодированных чанков одним батчем.
+
+        Результаты возвращаются в порядке items.
+        """
+        parts: list[np.ndarray] = []
+        starts: list[float] = []
+        clips: list[dict[str, float]] = []
+        offset = 0
+        for item in items:
+            wav = item.samples
+            starts.append(offset / _SR)
+            for start, end in self._speech_clips(wav):
+                clips.append({"start": (offset + start) / _SR, "end": (offset + end) / _SR})
+            pad = (-wav.shape[0]) % _ALIGN_SAMPLES
+            parts.append(wav)
+            if pad:
+                parts.append(np.zeros((pad,), dtype=np.float32))
+            offset += wav.shape[0] + pad
+
+        texts: list[list] = [[] for _ in items]
+        if clips:
+            if self._batched is None:
+                self._batched = BatchedInferencePipeline(model=self.model)
+            with self.pooled.inference_slot():
+                segments, _info = self._batched.transcribe(
+                    np.concatenate(parts),
+                    language=self.language,
+                    beam_size=self.beam_size,
+                    clip_timestamps=clips,
+                    batch_size=max(1, batch_size or len(items)),
+                )
+                for seg in segments:
+                    texts[max(0, bisect_right(starts, float(seg.start)) - 1)].append(seg)
+
+        return [STTResult(text=_join_text(segs), confidence=None, speaker=None) for segs in texts]
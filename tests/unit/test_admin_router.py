@@ -21,6 +21,9 @@ class _FakeRedis:
         _ = stream, group
         return {"pending": 1}
 
+    def zcard(self, key: str) -> int:
+        return 2 if key == "q:stt:retry" else 0
+
 
 class _FakeRedisWrongType:
     def xlen(self, stream: str) -> int:
@@ -34,6 +37,10 @@ class _FakeRedisWrongType:
             raise RuntimeError("WRONGTYPE Operation against a key holding the wrong kind of value")
         return {"pending": 1}
 
+    def zcard(self, key: str) -> int:
+        _ = key
+        return 0
+
 
 @pytest.fixture()
 def auth_settings():
@@ -92,6 +99,7 @@ def test_admin_queue_health_requires_service_key(monkeypatch, auth_settings) ->
     auth_settings.service_api_keys = "svc-1"
 
     monkeypatch.setattr("apps.api_gateway.routers.admin.redis_client", lambda: _FakeRedis())
+    monkeypatch.setattr("interview_analytics_agent.queue.retry.redis_client", lambda: _FakeRedis())
 
     client = TestClient(app)
 
@@ -102,6 +110,8 @@ def test_admin_queue_health_requires_service_key(monkeypatch, auth_settings) ->
     assert ok.status_code == 200
     data = ok.json()
     assert len(data["queues"]) == 5
+    stt = next(item for item in data["queues"] if item["queue"] == "q:stt")
+    assert stt["retry_backlog"] == 2
 
 
 def test_admin_queue_health_tolerates_wrongtype(monkeypatch, auth_settings) -> None:
@@ -111,6 +121,9 @@ def test_admin_queue_health_tolerates_wrongtype(monkeypatch, auth_settings) -> N
     monkeypatch.setattr(
         "apps.api_gateway.routers.admin.redis_client", lambda: _FakeRedisWrongType()
     )
+    monkeypatch.setattr(
+        "interview_analytics_agent.queue.retry.redis_client", lambda: _FakeRedisWrongType()
+    )
     client = TestClient(app)
     resp = client.get("/v1/admin/queues/health", headers={"X-API-Key": "svc-1"})
     assert resp.status_code == 200
@@ -135,6 +148,7 @@ def test_admin_queue_health_allows_service_jwt(monkeypatch, auth_settings) -> No
     auth_settings.jwt_service_required_scopes_admin_read = "agent.admin.read,agent.admin"
 
     monkeypatch.setattr("apps.api_gateway.routers.admin.redis_client", lambda: _FakeRedis())
+    monkeypatch.setattr("interview_analytics_agent.queue.retry.redis_client", lambda: _FakeRedis())
     client = TestClient(app)
     token = _build_hs256_token(
         secret="test-secret",
@@ -158,6 +172,7 @@ def test_admin_queue_health_denies_service_jwt_without_scope(monkeypatch, auth_s
     auth_settings.jwt_service_required_scopes_admin_read = "agent.admin.read,agent.admin"
 
     monkeypatch.setattr("apps.api_gateway.routers.admin.redis_client", lambda: _FakeRedis())
+    monkeypatch.setattr("interview_analytics_agent.queue.retry.redis_client", lambda: _FakeRedis())
     client = TestClient(app)
     token = _build_hs256_token(
         secret="test-secret",
@@ -411,22 +426,25 @@ def test_admin_security_audit_list(monkeypatch, auth_settings) -> None:
     auth_settings.service_api_keys = "svc-1"
 
     monkeypatch.setattr(
-        "apps.api_gateway.routers.admin.list_security_audit_events",
-        lambda limit, outcome, subject: [
-            SimpleNamespace(
-                id=1,
-                created_at="2026-02-04T18:20:00+00:00",
-                outcome="allow",
-                endpoint="/v1/admin/queues/health",
-                method="GET",
-                subject="service",
-                auth_type="service_api_key",
-                reason="service_api_key",
-                error_code=None,
-                status_code=200,
-                client_ip="127.0.0.1",
-            )
-        ],
+        "apps.api_gateway.routers.admin.list_security_audit_page",
+        lambda limit, outcome, subject, cursor: SimpleNamespace(
+            items=[
+                SimpleNamespace(
+                    id=1,
+                    created_at="2026-02-04T18:20:00+00:00",
+                    outcome="allow",
+                    endpoint="/v1/admin/queues/health",
+                    method="GET",
+                    subject="service",
+                    auth_type="service_api_key",
+                    reason="service_api_key",
+                    error_code=None,
+                    status_code=200,
+                    client_ip="127.0.0.1",
+                )
+            ],
+            next_cursor="next-1",
+        ),
     )
 
     client = TestClient(app)
@@ -436,6 +454,7 @@ def test_admin_security_audit_list(monkeypatch, auth_settings) -> None:
     data = resp.json()
     assert len(data["events"]) == 1
     assert data["events"][0]["outcome"] == "allow"
+    assert data["next_cursor"] == "next-1"
 
 
 def test_admin_security_audit_rejects_bad_outcome(auth_settings) -> None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
+from datetime import datetime
 from types import SimpleNamespace
 
 from fastapi import FastAPI
@@ -9,6 +10,14 @@ from fastapi.testclient import TestClient
 from apps.api_gateway.routers.artifacts import router as artifacts_router
 from apps.api_gateway.routers.reports import router as reports_router
 from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.storage.pagination import encode_cursor
+
+
+def _async_return(value):
+    async def _fn(*_args, **_kwargs):
+        return value
+
+    return _fn
 
 
 def _client() -> TestClient:
@@ -19,27 +28,36 @@ def _client() -> TestClient:
 
 
 def test_list_meetings(monkeypatch) -> None:
-    @contextmanager
-    def _fake_db_session():
+    calls: list[dict] = []
+
+    @asynccontextmanager
+    async def _fake_db_session():
         yield object()
 
     class _FakeMeetingRepo:
         def __init__(self, _session):
             pass
 
-        def list_recent(self, *, limit: int = 50):
-            _ = limit
-            return [
-                SimpleNamespace(
-                    id="m-1",
-                    status="done",
-                    created_at=None,
-                    finished_at=None,
-                )
-            ]
-
-    monkeypatch.setattr("apps.api_gateway.routers.artifacts.db_session", _fake_db_session)
-    monkeypatch.setattr("apps.api_gateway.routers.artifacts.MeetingRepository", _FakeMeetingRepo)
+        async def list_page(self, *, limit: int = 50, after=None, status=None, tenant_id=None):
+            calls.append({"limit": limit, "after": after, "status": status, "tenant": tenant_id})
+            return SimpleNamespace(
+                items=[
+                    SimpleNamespace(
+                        id="m-1",
+                        status="done",
+                        created_at=None,
+                        finished_at=None,
+                    )
+                ],
+                next_cursor="c-2",
+            )
+
+    monkeypatch.setattr(
+        "apps.api_gateway.routers.artifacts.async_db_read_session", _fake_db_session
+    )
+    monkeypatch.setattr(
+        "apps.api_gateway.routers.artifacts.AsyncMeetingRepository", _FakeMeetingRepo
+    )
     monkeypatch.setattr(
         "apps.api_gateway.routers.artifacts.records.list_artifacts",
         lambda meeting_id: {"raw": meeting_id == "m-1"},
@@ -58,6 +76,18 @@ def test_list_meetings(monkeypatch) -> None:
         assert len(body["items"]) == 1
         assert body["items"][0]["meeting_id"] == "m-1"
         assert body["items"][0]["artifacts"]["raw"] is True
+        assert body["next_cursor"] == "c-2"
+
+        cursor = encode_cursor(datetime(2026, 10, 1, 12, 0), "m-9")
+        resp = client.get(f"/v1/meetings?cursor={cursor}&status=done&tenant_id=t-1&limit=10")
+        assert resp.status_code == 200
+        assert calls[-1] == {
+            "limit": 10,
+            "after": (datetime(2026, 10, 1, 12, 0), "m-9"),
+            "status": "done",
+            "tenant": "t-1",
+        }
+        assert client.get("/v1/meetings?cursor=garbage").status_code == 400
     finally:
         s.auth_mode = snapshot_auth
         s.security_audit_db_enabled = snapshot_audit
@@ -70,6 +100,9 @@ def test_get_report_and_report_text(monkeypatch) -> None:
         "risk_flags": [],
         "recommendation": "none",
     }
+    monkeypatch.setattr(
+        "apps.api_gateway.routers.reports._stored_report_async", _async_return(None)
+    )
     monkeypatch.setattr("apps.api_gateway.routers.reports._ensure_report", lambda _m: report)
     monkeypatch.setattr("apps.api_gateway.routers.reports.records.write_text", lambda *_a, **_k: None)
 
@@ -90,3 +123,27 @@ def test_get_report_and_report_text(monkeypatch) -> None:
     finally:
         s.auth_mode = snapshot_auth
         s.security_audit_db_enabled = snapshot_audit
+
+
+def test_get_report_prefers_stored_report(monkeypatch) -> None:
+    monkeypatch.setattr(
+        "apps.api_gateway.routers.reports._stored_report_async",
+        _async_return({"summary": "stored"}),
+    )
+    monkeypatch.setattr(
+        "apps.api_gateway.routers.reports._ensure_report",
+        lambda _m: (_ for _ in ()).throw(RuntimeError("must not rebuild")),
+    )
+
+    s = get_settings()
+    snapshot_auth = s.auth_mode
+    snapshot_audit = s.security_audit_db_enabled
+    try:
+        s.auth_mode = "none"
+        s.security_audit_db_enabled = False
+        resp = _client().get("/v1/meetings/m-1/report")
+        assert resp.status_code == 200
+        assert resp.json()["report"] == {"summary": "stored"}
+    finally:
+        s.auth_mode = snapshot_auth
+        s.security_audit_db_enabled = snapshot_audit
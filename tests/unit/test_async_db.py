@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from interview_analytics_agent.storage.async_db import async_dsn, async_engine_options
+
+
+def test_async_dsn_swaps_driver() -> None:
+    assert async_dsn("postgresql+psycopg://u:p@h:5432/db") == "postgresql+asyncpg://u:p@h:5432/db"
+    assert async_dsn("sqlite:///data/app.db") == "sqlite+aiosqlite:///data/app.db"
+    with pytest.raises(ValueError):
+        async_dsn("mysql://u:p@h/db")
+
+
+def test_asyncpg_statement_timeout_via_server_settings() -> None:
+    opts = async_engine_options("postgresql+asyncpg://u:p@h/db", statement_timeout_ms=1500)
+    assert opts["connect_args"] == {"server_settings": {"statement_timeout": "1500"}}
+    assert opts["pool_size"] >= 1
+
+
+def test_async_repositories_read(tmp_path) -> None:
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from interview_analytics_agent.storage.models import Base, Meeting, TranscriptSegment
+    from interview_analytics_agent.storage.repositories import (
+        AsyncMeetingRepository,
+        AsyncTranscriptSegmentRepository,
+    )
+
+    async def _scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        now = datetime.now(UTC)
+        async with factory() as s:
+            for i, mid in enumerate(("m-old", "m-new")):
+                s.add(
+                    Meeting(
+                        id=mid,
+                        status="queued",
+                        consent="unknown",
+                        context={},
+                        created_at=now + timedelta(minutes=i),
+                    )
+                )
+            await s.flush()
+            for seq in (2, 1, 3):
+                s.add(TranscriptSegment(meeting_id="m-new", seq=seq, raw_text=f"t{seq}"))
+            await s.commit()
+
+        async with factory() as s:
+            meetings = AsyncMeetingRepository(s)
+            segments = AsyncTranscriptSegmentRepository(s)
+            result = (
+                (await meetings.get("m-new")).id,
+                [m.id for m in await meetings.list_recent(limit=10)],
+                [seg.seq for seg in await segments.list_by_meeting("m-new")],
+                [seg.seq for seg in await segments.list_by_meeting_after("m-new", after_seq=1)],
+                [seg.seq for seg in await segments.list_by_meeting_seqs("m-new", [3, 1])],
+            )
+        await engine.dispose()
+        return result
+
+    assert asyncio.run(_scenario()) == ("m-new", ["m-new", "m-old"], [1, 2, 3], [2, 3], [1, 3])
@@ -98,3 +98,86 @@ def test_prod_rejects_local_fs_when_required(tmp_path) -> None:
             s.storage_shared_fs_dir,
             s.storage_require_shared_in_prod,
         ) = prev
+
+
+@pytest.fixture
+def dedup_store(tmp_path, monkeypatch):
+    s = get_settings()
+    monkeypatch.setattr(s, "app_env", "dev")
+    monkeypatch.setattr(s, "storage_mode", "local_fs")
+    monkeypatch.setattr(s, "chunks_dir", str(tmp_path / "chunks"))
+    monkeypatch.setattr(s, "storage_dedup", True)
+    return tmp_path / "chunks"
+
+
+def test_dedup_stores_same_bytes_once(dedup_store) -> None:
+    blob.put_bytes("meetings/m-1/chunks/1.bin", b"same-audio")
+    blob.put_bytes("meetings/m-1/chunks/7.bin", b"same-audio")
+    blob.put_bytes("meetings/m-2/chunks/1.bin", b"same-audio")
+
+    objects = list((dedup_store / "cas").glob("*/*"))
+    assert len(objects) == 1
+    assert objects[0].stat().st_nlink == 4  # объект + три ключа
+    assert (dedup_store / "meetings/m-2/chunks/1.bin").samefile(objects[0])
+    assert blob.get_bytes("meetings/m-1/chunks/7.bin") == b"same-audio"
+    assert blob.meeting_blob_refs("m-1") == {
+        "meetings/m-1/chunks/1.bin": objects[0].name,
+        "meetings/m-1/chunks/7.bin": objects[0].name,
+    }
+
+
+def test_dedup_replay_of_same_key_does_not_write(dedup_store, monkeypatch) -> None:
+    blob.put_bytes("meetings/m-1/chunks/1.bin", b"abc")
+    monkeypatch.setattr(
+        blob, "_write_atomic", lambda *a: pytest.fail("replay must not write bytes")
+    )
+    monkeypatch.setattr(blob, "_link_atomic", lambda *a: pytest.fail("replay must not relink"))
+    blob.put_bytes("meetings/m-1/chunks/1.bin", b"abc")
+
+
+def test_dedup_release_frees_only_unreferenced_objects(dedup_store) -> None:
+    blob.put_bytes("meetings/m-1/chunks/1.bin", b"shared")
+    blob.put_bytes("meetings/m-1/chunks/2.bin", b"only-m1")
+    blob.put_bytes("meetings/m-2/chunks/1.bin", b"shared")
+
+    assert blob.release_meeting_blobs("m-1") == 1
+    assert not (dedup_store / "meetings/m-1").exists()
+    assert blob.get_bytes("meetings/m-2/chunks/1.bin") == b"shared"
+
+    blob.delete("meetings/m-2/chunks/1.bin")
+    assert list((dedup_store / "cas").glob("*/*")) == []
+
+
+def test_dedup_falls_back_to_copy_without_hard_links(dedup_store, monkeypatch) -> None:
+    def _no_links(src, dst):
+        raise PermissionError("hard links are not supported")
+
+    monkeypatch.setattr(blob.os, "link", _no_links)
+    blob.put_bytes("meetings/m-1/chunks/1.bin", b"abc")
+    assert blob.get_bytes("meetings/m-1/chunks/1.bin") == b"abc"
+    assert blob.gc_blobs(min_age_sec=0) == 1
+
+
+def test_dedup_rewrite_with_other_bytes_releases_previous_object(dedup_store) -> None:
+    key = "meetings/m-1/chunks/1.bin"
+    blob.put_bytes(key, b"first")
+    blob.put_bytes(key, b"second")
+    blob.put_bytes(key, b"third")
+
+    objects = list((dedup_store / "cas").glob("*/*"))
+    assert len(objects) == 1
+    assert blob.get_bytes(key) == b"third"
+    # manifest — одна строка на ключ, а не на каждую запись
+    manifest = dedup_store / "meetings/m-1/manifest.jsonl"
+    assert len(manifest.read_text().splitlines()) == 1
+    assert blob.meeting_blob_refs("m-1") == {key: objects[0].name}
+
+
+def test_dedup_delete_uses_manifest_digest(dedup_store, monkeypatch) -> None:
+    blob.put_bytes("meetings/m-1/chunks/1.bin", b"abc")
+    monkeypatch.setattr(blob, "sha256_hex", lambda data: pytest.fail("delete must not hash"))
+
+    blob.delete("meetings/m-1/chunks/1.bin")
+
+    assert list((dedup_store / "cas").glob("*/*")) == []
+    assert blob.meeting_blob_refs("m-1") == {}
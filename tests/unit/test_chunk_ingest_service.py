@@ -1,27 +1,89 @@
 from __future__ import annotations
 
+import asyncio
+import json
+
+import pytest
+
+from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.queue import idempotency
+from interview_analytics_agent.services import chunk_ingest_service as svc
 from interview_analytics_agent.services.chunk_ingest_service import (
+    ChunkIngestItem,
     ingest_audio_chunk_b64,
     ingest_audio_chunk_bytes,
+    ingest_audio_chunks_bulk,
 )
 
 
-def test_ingest_audio_chunk_bytes_enqueues(monkeypatch) -> None:
-    calls: dict[str, object] = {}
+class _FakeRedis:
+    """Исполняет скрипты reserve_once/commit_once и считает обращения (round-trip-ы)."""
 
-    monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.check_and_set",
-        lambda *args, **kwargs: True,
-    )
-    monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.put_bytes",
-        lambda key, data: calls.update({"blob_key": key, "audio": data}),
-    )
-    monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.enqueue_stt",
-        lambda **kwargs: calls.update({"task": kwargs}),
-    )
+    def __init__(self) -> None:
+        self.calls = 0
+        self.keys: dict[str, str] = {}
+        self.counters: dict[str, int] = {}
+        self.streams: dict[str, list[dict]] = {}
+
+    def register_script(self, script: str):
+        return self._commit_once if "XADD" in script else self._reserve_once
+
+    def _reserve_once(self, *, keys, args, client=None):
+        _ = args, client
+        self.calls += 1
+        out = []
+        for key in keys:
+            out.append(0 if key in self.keys else 1)
+            self.keys.setdefault(key, "pending")
+        return out
+
+    def _commit_once(self, *, keys, args, client=None):
+        _ = client
+        self.calls += 1
+        n = int(args[0])
+        stream, idem_keys, counter_keys = keys[0], keys[1 : n + 1], keys[n + 1 :]
+        for i in range(n):
+            self.keys[idem_keys[i]] = "1"
+            self.streams.setdefault(stream, []).append(json.loads(args[4 + i]))
+            if counter_keys:
+                self.counters[counter_keys[i]] = self.counters.get(counter_keys[i], 0) + 1
+        return n
+
+    def delete(self, *keys: str) -> int:
+        self.calls += 1
+        return sum(self.keys.pop(k, None) is not None for k in keys)
+
+
+class _FakeAsyncRedis(_FakeRedis):
+    def register_script(self, script: str):
+        sync = super().register_script(script)
 
+        async def _call(*, keys, args, client=None):
+            return sync(keys=keys, args=args, client=client)
+
+        return _call
+
+    async def delete(self, *keys: str) -> int:
+        return super().delete(*keys)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> _FakeRedis:
+    r = _FakeRedis()
+    monkeypatch.setattr(idempotency, "redis_client", lambda: r)
+    monkeypatch.setattr(idempotency, "_scripts", {})
+    monkeypatch.setattr(get_settings(), "queue_mode", "redis")
+    return r
+
+
+@pytest.fixture
+def blobs(monkeypatch) -> dict[str, bytes]:
+    written: dict[str, bytes] = {}
+    monkeypatch.setattr(svc, "put_bytes", lambda key, data: written.update({key: data}))
+    return written
+
+
+def test_ingest_audio_chunk_bytes_enqueues(fake_redis: _FakeRedis, blobs) -> None:
     result = ingest_audio_chunk_bytes(
         meeting_id="m-1",
         seq=3,
@@ -32,27 +94,47 @@ def test_ingest_audio_chunk_bytes_enqueues(monkeypatch) -> None:
     assert result.accepted is True
     assert result.is_duplicate is False
     assert result.blob_key == "meetings/m-1/chunks/3.bin"
-    assert calls["blob_key"] == "meetings/m-1/chunks/3.bin"
-    assert calls["audio"] == b"abc"
-    assert calls["task"] == {
-        "meeting_id": "m-1",
-        "chunk_seq": 3,
-        "blob_key": "meetings/m-1/chunks/3.bin",
+    assert blobs == {"meetings/m-1/chunks/3.bin": b"abc"}
+    [task] = fake_redis.streams["q:stt"]
+    assert (task["meeting_id"], task["chunk_seq"], task["blob_key"]) == (
+        "m-1",
+        3,
+        "meetings/m-1/chunks/3.bin",
+    )
+    assert fake_redis.keys == {"idem:audio_chunk_test:m-1:idem-1": "1"}
+    assert fake_redis.counters == {"flow:inflight:m-1": 1}
+    assert fake_redis.calls == 2
+
+
+def test_ingest_audio_chunk_bytes_duplicate(fake_redis: _FakeRedis, blobs) -> None:
+    kwargs = {
+        "meeting_id": "m-2",
+        "seq": 5,
+        "audio_bytes": b"dup",
+        "idempotency_key": "idem-dup",
+        "idempotency_scope": "audio_chunk_test",
     }
+    first = ingest_audio_chunk_bytes(**kwargs)
+    second = ingest_audio_chunk_bytes(**kwargs)
+    assert first.is_duplicate is False
+    assert second.accepted is True
+    assert second.is_duplicate is True
+    assert len(fake_redis.streams["q:stt"]) == 1
+    assert fake_redis.counters == {"flow:inflight:m-2": 1}
 
 
-def test_ingest_audio_chunk_bytes_duplicate(monkeypatch) -> None:
-    monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.check_and_set",
-        lambda *args, **kwargs: False,
-    )
+def test_ingest_audio_chunk_bytes_duplicate_inline(monkeypatch) -> None:
+    monkeypatch.setattr(get_settings(), "queue_mode", "inline")
+    monkeypatch.setattr(svc, "check_and_set", lambda *args, **kwargs: False)
     monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.put_bytes",
+        svc,
+        "put_bytes",
         lambda key, data: (_ for _ in ()).throw(RuntimeError("must not write")),
     )
     monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.enqueue_stt",
-        lambda **kwargs: (_ for _ in ()).throw(RuntimeError("must not enqueue")),
+        svc,
+        "process_chunk_inline",
+        lambda **kwargs: (_ for _ in ()).throw(RuntimeError("must not process")),
     )
 
     result = ingest_audio_chunk_bytes(
@@ -66,21 +148,7 @@ def test_ingest_audio_chunk_bytes_duplicate(monkeypatch) -> None:
     assert result.is_duplicate is True
 
 
-def test_ingest_audio_chunk_b64_decodes_and_calls_bytes(monkeypatch) -> None:
-    monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.check_and_set",
-        lambda *args, **kwargs: True,
-    )
-    captured: dict[str, object] = {}
-    monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.put_bytes",
-        lambda key, data: captured.update({"blob_key": key, "audio": data}),
-    )
-    monkeypatch.setattr(
-        "interview_analytics_agent.services.chunk_ingest_service.enqueue_stt",
-        lambda **kwargs: None,
-    )
-
+def test_ingest_audio_chunk_b64_decodes_and_calls_bytes(fake_redis: _FakeRedis, blobs) -> None:
     result = ingest_audio_chunk_b64(
         meeting_id="m-3",
         seq=1,
@@ -89,4 +157,87 @@ def test_ingest_audio_chunk_b64_decodes_and_calls_bytes(monkeypatch) -> None:
         idempotency_scope="audio_chunk_test",
     )
     assert result.is_duplicate is False
-    assert captured["audio"] == b"aaa"
+    assert blobs["meetings/m-3/chunks/1.bin"] == b"aaa"
+
+
+def test_bulk_ingest_is_two_round_trips(fake_redis: _FakeRedis, blobs) -> None:
+    chunks = [
+        ChunkIngestItem(seq=1, audio_bytes=b"a", idempotency_key="k-1"),
+        ChunkIngestItem(seq=2, audio_bytes=b"b", idempotency_key="k-2"),
+        ChunkIngestItem(seq=2, audio_bytes=b"b2", idempotency_key="k-2"),
+        ChunkIngestItem(seq=3, audio_bytes=b"c", idempotency_key="k-3"),
+    ]
+    results = ingest_audio_chunks_bulk(meeting_id="m-4", chunks=chunks)
+
+    assert fake_redis.calls == 2
+    assert [r.is_duplicate for r in results] == [False, False, True, False]
+    assert [t["chunk_seq"] for t in fake_redis.streams["q:stt"]] == [1, 2, 3]
+    assert fake_redis.counters == {"flow:inflight:m-4": 3}
+    # дубликат не переписал blob принятого чанка
+    assert blobs["meetings/m-4/chunks/2.bin"] == b"b"
+    assert ingest_audio_chunks_bulk(meeting_id="m-4", chunks=[]) == []
+    assert fake_redis.calls == 2
+
+
+def test_duplicate_does_not_write_blob(fake_redis: _FakeRedis, monkeypatch) -> None:
+    writes: list[str] = []
+    monkeypatch.setattr(svc, "put_bytes", lambda key, data: writes.append(key))
+    chunk = ChunkIngestItem(seq=1, audio_bytes=b"a", idempotency_key="k-1")
+
+    ingest_audio_chunks_bulk(meeting_id="m-5", chunks=[chunk])
+    [dup] = ingest_audio_chunks_bulk(meeting_id="m-5", chunks=[chunk])
+
+    assert dup.is_duplicate is True
+    assert writes == ["meetings/m-5/chunks/1.bin"]
+    # повтор из одних дубликатов: только резерв, без commit
+    assert fake_redis.calls == 3
+
+
+def test_failed_blob_write_releases_reservation(fake_redis: _FakeRedis, monkeypatch) -> None:
+    chunk = ChunkIngestItem(seq=1, audio_bytes=b"a", idempotency_key="k-1")
+    monkeypatch.setattr(
+        svc, "put_bytes", lambda key, data: (_ for _ in ()).throw(OSError("disk full"))
+    )
+    with pytest.raises(OSError):
+        ingest_audio_chunks_bulk(meeting_id="m-6", chunks=[chunk])
+    assert fake_redis.keys == {}
+    assert "q:stt" not in fake_redis.streams
+
+    monkeypatch.setattr(svc, "put_bytes", lambda key, data: None)
+    [retry] = ingest_audio_chunks_bulk(meeting_id="m-6", chunks=[chunk])
+    assert retry.is_duplicate is False
+    assert len(fake_redis.streams["q:stt"]) == 1
+
+
+def test_async_ingest_writes_blob_and_enqueues_once(monkeypatch) -> None:
+    r = _FakeAsyncRedis()
+    writes: list[tuple[str, bytes]] = []
+
+    async def _put(key: str, data: bytes) -> str:
+        writes.append((key, data))
+        return key
+
+    monkeypatch.setattr(idempotency, "async_redis_client", lambda: r)
+    monkeypatch.setattr(idempotency, "_scripts", {})
+    monkeypatch.setattr(svc, "put_bytes_async", _put)
+    monkeypatch.setattr(get_settings(), "queue_mode", "redis")
+
+    async def _scenario():
+        first = await svc.ingest_audio_chunk_bytes_async(
+            meeting_id="m-1", seq=3, audio_bytes=b"abc", idempotency_key="k"
+        )
+        second = await svc.ingest_audio_chunk_bytes_async(
+            meeting_id="m-1", seq=3, audio_bytes=b"abc", idempotency_key="k"
+        )
+        return first, second
+
+    first, second = asyncio.run(_scenario())
+
+    assert not first.is_duplicate and second.is_duplicate
+    # blob пишется после дедупа и до постановки; повтор его не трогает
+    assert writes == [("meetings/m-1/chunks/3.bin", b"abc")]
+    [task] = r.streams["q:stt"]
+    assert task["blob_key"] == "meetings/m-1/chunks/3.bin"
+    # первый: резерв + постановка, повтор: только резерв
+    assert r.calls == 3
+    assert r.counters == {"flow:inflight:m-1": 1}
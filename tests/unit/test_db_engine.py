@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.storage import db
+
+
+def test_engine_options_for_postgres(monkeypatch) -> None:
+    s = get_settings()
+    monkeypatch.setattr(s, "db_pool_size", 7)
+    monkeypatch.setattr(s, "db_max_overflow", 3)
+    monkeypatch.setattr(s, "db_pool_recycle_sec", 600)
+    monkeypatch.setattr(s, "db_statement_timeout_ms", 15000)
+
+    opts = db.engine_options("postgresql+psycopg://u:p@h/db")
+    assert (opts["pool_size"], opts["max_overflow"], opts["pool_recycle"]) == (7, 3, 600)
+    assert opts["connect_args"] == {"options": "-c statement_timeout=15000"}
+
+    replica = db.engine_options("postgresql+psycopg://u:p@replica/db", statement_timeout_ms=0)
+    assert "connect_args" not in replica
+    assert db.engine_options("sqlite:///x.db") == {"pool_pre_ping": True}
+
+
+def test_pool_gauges_track_checkouts(tmp_path) -> None:
+    engine = db.create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", name="test")
+    labels = {"engine": "test"}
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+            assert REGISTRY.get_sample_value("agent_db_pool_in_use", labels) == 1
+            assert REGISTRY.get_sample_value("agent_db_pool_saturation", labels) > 0
+        assert REGISTRY.get_sample_value("agent_db_pool_in_use", labels) == 0
+    finally:
+        engine.dispose()
+
+
+def test_pool_metrics_survive_dispose(tmp_path) -> None:
+    engine = db.create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", name="recreated")
+    labels = {"engine": "recreated"}
+    metric = "agent_db_pool_checkout_wait_seconds_count"
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+        before = REGISTRY.get_sample_value(metric, labels)
+
+        # dispose() подменяет пул через pool.recreate()
+        engine.dispose()
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+            assert REGISTRY.get_sample_value("agent_db_pool_in_use", labels) == 1
+        assert REGISTRY.get_sample_value(metric, labels) == before + 1
+    finally:
+        engine.dispose()
+
+
+def test_read_session_uses_replica_round_robin(tmp_path, monkeypatch) -> None:
+    replicas = []
+    for i in range(2):
+        engine = db.create_db_engine(f"sqlite:///{tmp_path / f'r{i}.db'}", name=f"replica{i}")
+        replicas.append((f"replica{i}", sessionmaker(bind=engine)))
+    monkeypatch.setattr(db, "_read_session_factories", replicas)
+
+    used = []
+    for _ in range(3):
+        with db.db_read_session() as session:
+            session.execute(text("select 1"))
+            used.append(str(session.get_bind().url))
+    assert used[0] != used[1] and used[0] == used[2]
+    assert all("/r0.db" in u or "/r1.db" in u for u in used)
+    assert REGISTRY.get_sample_value(
+        "agent_db_pool_checkout_wait_seconds_count", {"engine": "replica0"}
+    )
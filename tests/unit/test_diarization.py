@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import io
+import wave
+
+import numpy as np
+
 import interview_analytics_agent.stt.diarization as diarization
+from interview_analytics_agent.stt.audio import decode_audio
 from interview_analytics_agent.stt.diarization import resolve_speaker
 
 
@@ -31,3 +37,62 @@ def test_resolve_speaker_by_embedding(monkeypatch) -> None:
     assert s1 == "Speaker-A"
     assert s2 == "Speaker-A"
     assert s3 == "Speaker-B"
+
+
+def _tone_wav(freq: float, *, sample_rate: int = 48000, channels: int = 2) -> bytes:
+    t = np.arange(sample_rate) / sample_rate
+    pcm = (np.sin(2 * np.pi * freq * t) * 8000).astype(np.int16)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(np.repeat(pcm[:, None], channels, axis=1).tobytes())
+    return buf.getvalue()
+
+
+def test_spectrum_embedding_matches_reference_dft() -> None:
+    rnd = np.random.default_rng(0)
+    signal = rnd.standard_normal(2000).astype(np.float32)
+    n = signal.shape[0]
+    t = np.arange(n)
+    ref = np.array(
+        [np.abs(np.sum(signal * np.exp(-2j * np.pi * k * t / n))) / n for k in range(1, 25)]
+    )
+    emb = diarization._embedding_from_pcm(signal, "spectrum")
+    np.testing.assert_allclose(emb, ref / np.linalg.norm(ref), atol=1e-5)
+
+
+def test_decode_stereo_48k_to_mono_16k_embedding() -> None:
+    decoded = decode_audio(_tone_wav(300.0))
+    assert decoded.samples.dtype == np.float32
+    assert decoded.samples.shape[0] == 16000
+    assert (decoded.source_sample_rate, decoded.source_channels) == (48000, 2)
+    assert diarization._decode_audio_embedding(_tone_wav(300.0)) is not None
+
+
+def test_resolve_speaker_reuses_decoded_audio(monkeypatch) -> None:
+    diarization._STATE.clear()
+    decoded = decode_audio(_tone_wav(300.0))
+    monkeypatch.setattr(
+        diarization,
+        "_decode_audio_embedding",
+        lambda _audio: (_ for _ in ()).throw(AssertionError("decoded twice")),
+    )
+
+    speaker = resolve_speaker(
+        hint=None, raw_text=None, seq=1, meeting_id="m-dec", audio_bytes=b"x", decoded=decoded
+    )
+    assert speaker == "Speaker-A"
+
+
+def test_mfcc_embedding_separates_different_signals() -> None:
+    t = np.arange(16000) / 16000
+    low = np.sin(2 * np.pi * 150 * t).astype(np.float32)
+    high = np.sin(2 * np.pi * 2500 * t).astype(np.float32)
+    for mode in ("logmel", "mfcc"):
+        a = diarization._embedding_from_pcm(low, mode)
+        b = diarization._embedding_from_pcm(low * 0.5, mode)
+        c = diarization._embedding_from_pcm(high, mode)
+        assert diarization._cosine(a, b) > 0.99
+        assert diarization._cosine(a, c) < diarization._cosine(a, b)
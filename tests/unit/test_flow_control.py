@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.services import flow_control as fc
+
+
+@pytest.fixture()
+def flow_settings(monkeypatch):
+    s = get_settings()
+    monkeypatch.setattr(s, "queue_mode", "redis")
+    monkeypatch.setattr(s, "ingest_credit_window", 8)
+    monkeypatch.setattr(s, "ingest_queue_high_water", 100)
+    monkeypatch.setattr(s, "ingest_meeting_max_inflight", 10)
+    monkeypatch.setattr(s, "ingest_throttle_retry_ms", 500)
+    monkeypatch.setattr(fc, "_backlog_cache", {"ts": 0.0, "value": 0.0})
+    monkeypatch.setattr(fc, "_throttled", {})
+    return s
+
+
+@pytest.mark.parametrize(
+    ("backlog", "inflight", "credits"),
+    [(0, 0, 8), (50, 0, 4), (100, 0, 0), (500, 0, 0), (0, 7, 3), (0, 12, 0)],
+)
+def test_credit_window_shrinks_with_backlog_and_meeting_lag(
+    flow_settings, backlog: int, inflight: int, credits: int
+) -> None:
+    result = fc.compute_credits(queue_backlog=backlog, meeting_inflight=inflight)
+
+    assert result.credits == credits
+    assert result.throttled is (credits == 0)
+    assert result.retry_after_ms == (500 if credits == 0 else 0)
+
+
+class _FakeRedis:
+    def __init__(self, *, pending: int, lag: int | None, inflight: int) -> None:
+        self.groups = [{"name": "g:stt", "pending": pending, "lag": lag}]
+        self.inflight = inflight
+
+    def xinfo_groups(self, stream: str) -> list[dict]:
+        assert stream == "q:stt"
+        return self.groups
+
+    def get(self, key: str):
+        return str(self.inflight) if key == "flow:inflight:m-1" else None
+
+
+def test_ingest_credits_reads_stt_backlog_and_tracks_throttled_meetings(
+    flow_settings, monkeypatch
+) -> None:
+    monkeypatch.setattr(fc, "redis_client", lambda: _FakeRedis(pending=60, lag=40, inflight=0))
+
+    throttled = fc.ingest_credits("m-1", source="connector")
+
+    assert (throttled.queue_backlog, throttled.credits) == (100, 0)
+    assert set(fc._throttled) == {"m-1"}
+
+    monkeypatch.setattr(fc, "_backlog_cache", {"ts": 0.0, "value": 0.0})
+    monkeypatch.setattr(fc, "redis_client", lambda: _FakeRedis(pending=10, lag=None, inflight=2))
+
+    relaxed = fc.ingest_credits("m-1", source="connector")
+
+    assert (relaxed.queue_backlog, relaxed.meeting_inflight, relaxed.credits) == (10, 2, 7)
+    assert fc._throttled == {}
+
+
+def test_throttled_meeting_expires_or_is_forgotten(flow_settings, monkeypatch) -> None:
+    monkeypatch.setattr(fc, "redis_client", lambda: _FakeRedis(pending=100, lag=0, inflight=0))
+    now = [1000.0]
+    monkeypatch.setattr(fc.time, "monotonic", lambda: now[0])
+
+    fc.ingest_credits("m-1", source="connector")
+    fc.ingest_credits("m-2", source="connector")
+    assert set(fc._throttled) == {"m-1", "m-2"}
+
+    # m-2 отключился
+    fc.forget_meeting("m-2")
+    assert set(fc._throttled) == {"m-1"}
+
+    # m-1 перестал спрашивать кредиты: запись истекает при следующем учёте
+    now[0] += fc._THROTTLED_TTL_SEC + 1
+    fc.forget_meeting("m-3")
+    assert fc._throttled == {}
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import pytest
+
+from interview_analytics_agent.services import incremental_enhancer as inc
+from interview_analytics_agent.services import scorecard_state
+from interview_analytics_agent.storage.models import TranscriptSegment
+
+
+class _FakePipeline:
+    def __init__(self, r: _FakeRedis) -> None:
+        self.r = r
+        self.ops: list = []
+
+    def __getattr__(self, name: str):
+        def _op(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+
+        return _op
+
+    def execute(self) -> list:
+        return [getattr(self.r, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.sets: dict[str, set[str]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        _ = transaction
+        return _FakePipeline(self)
+
+    def hget(self, key: str, field: str):
+        return self.hashes.get(key, {}).get(field)
+
+    def hmget(self, key: str, fields: list[str]) -> list:
+        h = self.hashes.get(key, {})
+        return [h.get(f) for f in fields]
+
+    def hset(self, key: str, mapping: dict) -> int:
+        self.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+        return len(mapping)
+
+    def smembers(self, key: str) -> set[str]:
+        return set(self.sets.get(key, set()))
+
+    def sadd(self, key: str, *members: str) -> int:
+        self.sets.setdefault(key, set()).update(members)
+        return len(members)
+
+    def srem(self, key: str, *members: str) -> int:
+        self.sets.get(key, set()).difference_update(members)
+        return len(members)
+
+    def expire(self, key: str, ttl: int) -> bool:
+        _ = key, ttl
+        return True
+
+
+class _FakeSegmentRepo:
+    rows: list[TranscriptSegment] = []
+    queried: list[int] = []
+
+    def __init__(self, session) -> None:
+        _ = session
+
+    def _track(self, segs: list[TranscriptSegment]) -> list[TranscriptSegment]:
+        type(self).queried.extend(s.seq for s in segs)
+        return segs
+
+    def list_by_meeting(self, meeting_id: str) -> list[TranscriptSegment]:
+        return self._track([s for s in self.rows if s.meeting_id == meeting_id])
+
+    def list_by_meeting_after(self, meeting_id: str, *, after_seq: int):
+        return self._track(
+            [s for s in self.rows if s.meeting_id == meeting_id and s.seq > after_seq]
+        )
+
+    def list_by_meeting_seqs(self, meeting_id: str, seqs: list[int]):
+        return self._track([s for s in self.rows if s.meeting_id == meeting_id and s.seq in seqs])
+
+    def upsert_many(self, rows: list[dict], *, update_columns) -> None:
+        by_key = {(s.meeting_id, s.seq): s for s in self.rows}
+        for row in rows:
+            seg = by_key[(row["meeting_id"], row["seq"])]
+            for col in update_columns:
+                setattr(seg, col, row[col])
+
+
+@contextmanager
+def _fake_session():
+    yield None
+
+
+def _seg(seq: int, text: str) -> TranscriptSegment:
+    return TranscriptSegment(
+        meeting_id="m-1", seq=seq, speaker="spk", raw_text=text, enhanced_text=text
+    )
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> _FakeRedis:
+    r = _FakeRedis()
+    monkeypatch.setattr(inc, "redis_client", lambda: r)
+    monkeypatch.setattr(scorecard_state, "redis_client", lambda: r)
+    monkeypatch.setattr(inc, "db_session", _fake_session)
+    monkeypatch.setattr(inc, "TranscriptSegmentRepository", _FakeSegmentRepo)
+    monkeypatch.setattr(inc, "enhance_text", lambda raw: (raw.upper(), {"fake": True}))
+    monkeypatch.setattr(inc.get_settings(), "enhancer_incremental", True)
+    _FakeSegmentRepo.rows = []
+    _FakeSegmentRepo.queried = []
+    return r
+
+
+def test_second_run_processes_only_new_segments(fake_redis: _FakeRedis) -> None:
+    _FakeSegmentRepo.rows = [_seg(0, "a"), _seg(1, "b")]
+    events = inc.enhance_meeting("m-1")
+    assert [e["seq"] for e in events] == [0, 1]
+    assert events[0]["enhanced_text"] == "A"
+    assert events[0]["event_type"] == "transcript.update"
+
+    _FakeSegmentRepo.rows.append(_seg(2, "c"))
+    _FakeSegmentRepo.queried = []
+    events = inc.enhance_meeting("m-1")
+
+    assert [e["seq"] for e in events] == [2]
+    assert _FakeSegmentRepo.queried == [2]
+    assert fake_redis.hashes["enh:state:m-1"]["hwm"] == "2"
+    # обработанные seq уходят scorecard-у
+    assert fake_redis.sets["scorecard:dirty:m-1"] == {"0", "1", "2"}
+
+
+def test_rewritten_segment_below_hwm_is_reprocessed(fake_redis: _FakeRedis) -> None:
+    _FakeSegmentRepo.rows = [_seg(0, "a"), _seg(1, "b")]
+    inc.enhance_meeting("m-1")
+
+    # worker_stt перезаписал seq=0 (повторный чанк)
+    _FakeSegmentRepo.rows[0] = _seg(0, "a2")
+    inc.mark_segment_dirty(meeting_id="m-1", seq=0)
+    events = inc.enhance_meeting("m-1")
+
+    assert [(e["seq"], e["enhanced_text"]) for e in events] == [(0, "A2")]
+    assert fake_redis.sets["enh:dirty:m-1"] == set()
+
+
+def test_dirty_segment_with_unchanged_state_is_skipped(fake_redis: _FakeRedis) -> None:
+    _FakeSegmentRepo.rows = [_seg(0, "a")]
+    inc.enhance_meeting("m-1")
+
+    inc.mark_segment_dirty(meeting_id="m-1", seq=0)
+    assert inc.enhance_meeting("m-1") == []
+
+
+def test_full_pass_when_incremental_disabled(fake_redis: _FakeRedis, monkeypatch) -> None:
+    monkeypatch.setattr(inc.get_settings(), "enhancer_incremental", False)
+    _FakeSegmentRepo.rows = [_seg(0, "a"), _seg(1, "b")]
+    inc.enhance_meeting("m-1")
+    _FakeSegmentRepo.queried = []
+    inc.enhance_meeting("m-1")
+
+    assert _FakeSegmentRepo.queried == [0, 1]
+    assert fake_redis.hashes == {}
+
+
+def test_late_segment_below_hwm_is_processed(fake_redis: _FakeRedis) -> None:
+    _FakeSegmentRepo.rows = [_seg(0, "a"), _seg(2, "c"), _seg(3, "d")]
+    inc.enhance_meeting("m-1")
+    assert fake_redis.hashes["enh:state:m-1"]["hwm"] == "3"
+
+    # чанк seq=1 пришёл после того, как hwm ушёл на 3: новая запись, не перезапись
+    _FakeSegmentRepo.rows.insert(1, _seg(1, "late"))
+    inc.mark_segment_dirty(meeting_id="m-1", seq=1)
+    events = inc.enhance_meeting("m-1")
+
+    assert [(e["seq"], e["enhanced_text"]) for e in events] == [(1, "LATE")]
+    assert inc.enhance_meeting("m-1") == []
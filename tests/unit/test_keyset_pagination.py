@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from interview_analytics_agent.storage.models import Base, Meeting, SecurityAuditEvent
+from interview_analytics_agent.storage.pagination import decode_cursor, encode_cursor
+from interview_analytics_agent.storage.repositories import (
+    MeetingRepository,
+    SecurityAuditRepository,
+)
+
+_T0 = datetime(2026, 10, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    s = sessionmaker(bind=engine)()
+    # 12 встреч: по две на одну секунду (тай-брейк по id), два тенанта, два статуса
+    for i in range(12):
+        s.add(
+            Meeting(
+                id=f"m-{i:02d}",
+                tenant_id="t-a" if i % 3 else "t-b",
+                created_at=_T0 + timedelta(seconds=i // 2),
+                status="done" if i % 2 else "queued",
+                consent="unknown",
+                context={},
+            )
+        )
+    for i in range(6):
+        s.add(
+            SecurityAuditEvent(
+                created_at=_T0,
+                outcome="deny" if i % 2 else "allow",
+                endpoint="/v1/meetings",
+                method="GET",
+                subject="user-1",
+                auth_type="api_key",
+                reason="ok",
+                status_code=200,
+            )
+        )
+    s.commit()
+    try:
+        yield s
+    finally:
+        s.close()
+        engine.dispose()
+
+
+def _walk(fetch) -> list[list]:
+    pages, after = [], None
+    while True:
+        page = fetch(after)
+        pages.append(page.items)
+        if page.next_cursor is None:
+            return pages
+        after = decode_cursor(page.next_cursor, key_type=type(page.items[-1].id))
+
+
+def test_cursor_roundtrip_and_rejects_garbage() -> None:
+    cursor = encode_cursor(_T0, "m-01")
+    assert decode_cursor(cursor) == (_T0, "m-01")
+    for bad in ("not-a-cursor", encode_cursor(_T0, 7), encode_cursor(_T0, "x")[:-3]):
+        with pytest.raises(ValueError):
+            decode_cursor(bad)
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(_T0, "x"), key_type=int)
+
+
+def test_meetings_keyset_walks_all_rows_in_order(session) -> None:
+    repo = MeetingRepository(session)
+    pages = _walk(lambda after: repo.list_page(limit=5, after=after))
+    assert [len(p) for p in pages] == [5, 5, 2]
+    ids = [m.id for p in pages for m in p]
+    assert ids == [f"m-{i:02d}" for i in reversed(range(12))]
+
+    tenant_b = _walk(lambda after: repo.list_page(limit=2, after=after, tenant_id="t-b"))
+    assert [m.id for p in tenant_b for m in p] == ["m-09", "m-06", "m-03", "m-00"]
+    done = _walk(lambda after: repo.list_page(limit=4, after=after, status="done"))
+    assert [m.id for p in done for m in p] == ["m-11", "m-09", "m-07", "m-05", "m-03", "m-01"]
+
+
+def test_audit_keyset_walks_ties_by_id(session) -> None:
+    repo = SecurityAuditRepository(session)
+    pages = _walk(lambda after: repo.list_page(limit=2, after=after, outcome="deny"))
+    assert [e.id for p in pages for e in p] == [6, 4, 2]
+
+
+def _query_plan(session, run) -> str:
+    captured = []
+    engine = session.get_bind()
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    statement, parameters = captured[-1]
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return " | ".join(str(r[-1]) for r in rows)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "index"),
+    [
+        ({}, "ix_meetings_created_at_id"),
+        ({"status": "done"}, "ix_meetings_status_created_at_id"),
+        ({"tenant_id": "t-a"}, "ix_meetings_tenant_created_at_id"),
+    ],
+)
+def test_meetings_page_uses_index(session, kwargs, index) -> None:
+    repo = MeetingRepository(session)
+    plan = _query_plan(session, lambda: repo.list_page(limit=5, after=(_T0, "m-05"), **kwargs))
+    assert index in plan
+    assert "TEMP B-TREE" not in plan  # ORDER BY отдаёт индекс, без сортировки
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "index"),
+    [
+        ({}, "ix_security_audit_events_created_at_id"),
+        ({"outcome": "deny"}, "ix_security_audit_events_outcome_created_at_id"),
+        ({"subject": "user-1"}, "ix_security_audit_events_subject_created_at_id"),
+    ],
+)
+def test_audit_page_uses_index(session, kwargs, index) -> None:
+    repo = SecurityAuditRepository(session)
+    plan = _query_plan(session, lambda: repo.list_page(limit=5, after=(_T0, 4), **kwargs))
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from interview_analytics_agent.processing import keyword_matcher, scorecard
+from interview_analytics_agent.processing.keyword_matcher import KeywordMatcher
+from interview_analytics_agent.processing.scorecard import _rubric_keywords, rubric_matcher
+
+# пересекающиеся и вложенные ключевые слова
+_GROUPS = {
+    "a": ("why", "yes", "es", "сложност"),
+    "b": ("sla", "slack", "yes", "ложн"),
+    "c": ("python",),
+}
+
+
+def _naive(groups: dict[str, tuple[str, ...]], text: str) -> dict[str, list[str]]:
+    out = {gid: [kw for kw in kws if kw in text] for gid, kws in groups.items()}
+    return {gid: kws for gid, kws in out.items() if kws}
+
+
+@pytest.fixture(params=["aho-corasick", "regex-trie"])
+def backend(request, monkeypatch) -> str:
+    if request.param == "regex-trie":
+        monkeypatch.setattr(keyword_matcher, "ahocorasick", None)
+    elif keyword_matcher.ahocorasick is None:
+        pytest.skip("pyahocorasick is not installed")
+    return request.param
+
+
+def test_matches_like_substring_scan(backend: str) -> None:
+    _ = backend
+    matcher = KeywordMatcher(_GROUPS)
+    texts = ["whyes", "slackyes", "", "сложность python", "nothing here", "sla\x00why"]
+    assert matcher.match_many(texts) == [_naive(_GROUPS, t) for t in texts]
+
+
+def test_rubric_matcher_agrees_with_naive_scan_on_random_text(backend: str) -> None:
+    _ = backend
+    groups = _rubric_keywords()
+    matcher = KeywordMatcher(groups)
+    vocab = sorted({k for kws in groups.values() for k in kws}) + ["и", "the", "x", " "]
+    rnd = random.Random(3)
+    texts = ["".join(rnd.choice(vocab) for _ in range(rnd.randint(0, 30))) for _ in range(300)]
+
+    assert matcher.match_many(texts) == [_naive(groups, t) for t in texts]
+
+
+def test_rubric_matcher_is_shared_across_overrides_versions(monkeypatch) -> None:
+    matcher = rubric_matcher()
+    for version in ("v1", "v2"):
+        monkeypatch.setattr(
+            scorecard,
+            "load_weight_overrides",
+            lambda v=version: {"version": v, "global": {"communication": 0.5}},
+        )
+        scorecard.build_interview_scorecard(
+            enhanced_transcript="why python", meeting_context={}, report=None
+        )
+
+    # overrides меняют только веса: автомат один на процесс
+    assert rubric_matcher() is matcher
+    assert rubric_matcher.cache_info().currsize == 1
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from interview_analytics_agent.queue import coalesce, dispatcher, streams
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.store: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.streams: dict[str, list[dict[str, str]]] = {}
+
+    def delete(self, key: str) -> int:
+        return 1 if self.store.pop(key, None) is not None else 0
+
+    def register_script(self, script: str):
+        if "SET" in script:
+            return self._schedule
+        return self._promote
+
+    def _schedule(self, *, keys, args, client=None):
+        _ = client
+        marker, zkey = keys
+        if marker in self.store:
+            return 0
+        self.store[marker] = "1"
+        self.zsets.setdefault(zkey, {})[args[0]] = float(args[1])
+        return 1
+
+    def _promote(self, *, keys, args, client=None):
+        _ = client
+        zkey, stream = keys
+        zset = self.zsets.get(zkey, {})
+        due = [raw for raw, score in zset.items() if score <= int(args[0])]
+        for raw in due:
+            self.streams.setdefault(stream, []).append({args[2]: raw})
+            zset.pop(raw)
+        return len(due)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> _FakeRedis:
+    r = _FakeRedis()
+    monkeypatch.setattr(coalesce, "redis_client", lambda: r)
+    monkeypatch.setattr(streams, "redis_client", lambda: r)
+    monkeypatch.setattr(coalesce, "_schedule_script", None)
+    monkeypatch.setattr(streams, "_promote_script", None)
+    monkeypatch.setattr(coalesce, "now_ms", lambda: 1_000)
+    monkeypatch.setattr(streams, "now_ms", lambda: 1_000)
+    monkeypatch.setattr(dispatcher.get_settings(), "pipeline_coalesce_quiet_sec", 5.0)
+    monkeypatch.setattr(
+        dispatcher, "enqueue", lambda *a, **k: pytest.fail("must go through coalescing")
+    )
+    return r
+
+
+def test_burst_of_enqueues_collapses_into_one_job(fake_redis: _FakeRedis, monkeypatch) -> None:
+    for _ in range(10):
+        dispatcher.enqueue_enhancer(meeting_id="m-1")
+    dispatcher.enqueue_enhancer(meeting_id="m-2")
+
+    delayed = fake_redis.zsets["q:enhancer:delayed"]
+    assert len(delayed) == 2
+    assert sorted(json.loads(raw)["meeting_id"] for raw in delayed) == ["m-1", "m-2"]
+    assert set(delayed.values()) == {6_000.0}
+
+    # до конца quiet-периода в stream ничего не попадает
+    assert coalesce.promote_due_coalesced("q:enhancer") == 0
+    monkeypatch.setattr(streams, "now_ms", lambda: 6_000)
+    assert coalesce.promote_due_coalesced("q:enhancer") == 2
+    assert len(fake_redis.streams["q:enhancer"]) == 2
+
+
+def test_clear_marker_allows_next_run(fake_redis: _FakeRedis) -> None:
+    dispatcher.enqueue_analytics(meeting_id="m-1")
+    coalesce.clear_coalesced(queue="q:analytics", meeting_id="m-1")
+    dispatcher.enqueue_analytics(meeting_id="m-1")
+
+    assert len(fake_redis.zsets["q:analytics:delayed"]) == 2
+
+
+def test_coalesce_disabled_enqueues_directly(fake_redis: _FakeRedis, monkeypatch) -> None:
+    captured: list[str] = []
+    monkeypatch.setattr(dispatcher, "enqueue", lambda queue, payload: captured.append(queue))
+
+    dispatcher.enqueue_enhancer(meeting_id="m-1", coalesce=False)
+    monkeypatch.setattr(dispatcher.get_settings(), "pipeline_coalesce_quiet_sec", 0.0)
+    dispatcher.enqueue_analytics(meeting_id="m-1")
+
+    assert captured == ["q:enhancer", "q:analytics"]
+    assert fake_redis.zsets == {}
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from interview_analytics_agent.queue import retry, streams
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.streams: dict[str, list[dict[str, str]]] = {}
+
+    def zadd(self, key: str, mapping: dict[str, float]) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+    def register_script(self, script: str):
+        _ = script
+
+        def _promote(*, keys, args, client=None):
+            _ = client
+            zkey, stream = keys
+            now_ms, limit, field = int(args[0]), int(args[1]), args[2]
+            zset = self.zsets.get(zkey, {})
+            due = sorted((score, raw) for raw, score in zset.items() if score <= now_ms)[:limit]
+            for _, raw in due:
+                self.streams.setdefault(stream, []).append({field: raw})
+                zset.pop(raw)
+            return len(due)
+
+        return _promote
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> _FakeRedis:
+    r = _FakeRedis()
+    monkeypatch.setattr(retry, "redis_client", lambda: r)
+    monkeypatch.setattr(streams, "redis_client", lambda: r)
+    monkeypatch.setattr(streams, "_promote_script", None)
+    monkeypatch.setattr(
+        "time.sleep", lambda sec: (_ for _ in ()).throw(AssertionError("must not sleep"))
+    )
+    return r
+
+
+def test_backoff_delay_is_exponential_with_jitter_and_capped() -> None:
+    for attempts, full in ((1, 2.0), (2, 4.0), (3, 8.0)):
+        for _ in range(20):
+            delay = retry.backoff_delay_sec(attempts=attempts, base_sec=2, max_sec=60)
+            assert full / 2 <= delay <= full
+    assert retry.backoff_delay_sec(attempts=10, base_sec=2, max_sec=5) <= 5
+    assert retry.backoff_delay_sec(attempts=1, base_sec=0) == 0.0
+
+
+def test_requeue_schedules_into_retry_set_without_sleep(
+    fake_redis: _FakeRedis, monkeypatch
+) -> None:
+    monkeypatch.setattr(retry, "now_ms", lambda: 1_000_000)
+    monkeypatch.setattr(retry, "enqueue", lambda *a, **k: pytest.fail("must not enqueue now"))
+
+    assert (
+        retry.requeue_with_backoff(queue_name="q:stt", task_payload={"meeting_id": "m-1"}) is True
+    )
+
+    ((raw, due_ms),) = fake_redis.zsets["q:stt:retry"].items()
+    assert json.loads(raw) == {"meeting_id": "m-1", "attempts": 1}
+    assert 1_000_500 <= due_ms <= 1_001_000
+    assert retry.retry_backlog("q:stt") == 1
+
+
+def test_promote_moves_only_due_tasks(fake_redis: _FakeRedis, monkeypatch) -> None:
+    fake_redis.zadd("q:stt:retry", {'{"n": 1}': 100, '{"n": 2}': 200, '{"n": 3}': 900})
+    monkeypatch.setattr(streams, "now_ms", lambda: 500)
+
+    assert retry.promote_due_retries("q:stt") == 2
+    assert fake_redis.streams["q:stt"] == [{"payload": '{"n": 1}'}, {"payload": '{"n": 2}'}]
+    assert retry.retry_backlog("q:stt") == 1
+
+
+def test_requeue_moves_to_dlq_after_max_attempts(fake_redis: _FakeRedis, monkeypatch) -> None:
+    captured: list[tuple[str, dict]] = []
+    monkeypatch.setattr(
+        retry, "enqueue", lambda stream, payload: captured.append((stream, payload))
+    )
+
+    ok = retry.requeue_with_backoff(
+        queue_name="q:stt", task_payload={"meeting_id": "m-1", "attempts": 3}, max_attempts=3
+    )
+
+    assert ok is False
+    assert captured == [("q:stt:dlq", {"meeting_id": "m-1", "attempts": 4})]
+    assert fake_redis.zcard("q:stt:retry") == 0
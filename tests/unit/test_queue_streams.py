@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import redis
+
+from interview_analytics_agent.queue import streams
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.round_trips = 0
+        self.group_creates = 0
+        self.new: list[tuple[str, dict]] = []
+        self.stale: list[tuple[str, dict | None]] = []
+        self.acked: list[tuple[str, ...]] = []
+        self.blocking_reads: list[int] = []
+
+        self.touched: list[tuple[str, ...]] = []
+
+    def register_script(self, script: str):
+        _ = script
+
+        def _read_batch(*, keys, args, client=None):
+            _ = keys, client
+            self.round_trips += 1
+            count = int(args[3])
+            claimed, self.stale = self.stale[:count], self.stale[count:]
+            fresh, self.new = self.new[: count - len(claimed)], self.new[count - len(claimed) :]
+            # как в Lua-ответе: поля записи — плоский список
+            return [[[i, _flat(f)] for i, f in claimed], [[i, _flat(f)] for i, f in fresh]]
+
+        return _read_batch
+
+    def xgroup_create(self, **kwargs) -> bool:
+        _ = kwargs
+        self.round_trips += 1
+        self.group_creates += 1
+        if self.group_creates > 1:
+            raise redis.ResponseError("BUSYGROUP Consumer Group name already exists")
+        return True
+
+    def xreadgroup(self, *, streams: dict, count: int, block: int | None = None, **kwargs):
+        _ = kwargs
+        self.round_trips += 1
+        self.blocking_reads.append(int(block or 0))
+        entries, self.new = self.new[:count], self.new[count:]
+        if not entries:
+            return []
+        return [[next(iter(streams)), entries]]
+
+    def xclaim(self, stream, group, consumer, *, min_idle_time, message_ids, justid):
+        _ = stream, group, consumer
+        assert min_idle_time == 0 and justid is True
+        self.round_trips += 1
+        self.touched.append(tuple(message_ids))
+        return list(message_ids)
+
+    def xack(self, stream: str, group: str, *ids: str) -> int:
+        _ = stream, group
+        self.round_trips += 1
+        self.acked.append(ids)
+        return len(ids)
+
+
+def _flat(fields: dict | None) -> list | None:
+    return None if fields is None else [x for kv in fields.items() for x in kv]
+
+
+def _entry(entry_id: str, payload: dict) -> tuple[str, dict]:
+    return entry_id, {"payload": json.dumps(payload)}
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> _FakeRedis:
+    r = _FakeRedis()
+    monkeypatch.setattr(streams, "redis_client", lambda: r)
+    monkeypatch.setattr(streams, "_READY_GROUPS", set())
+    monkeypatch.setattr(streams, "_read_batch_script", None)
+    return r
+
+
+def test_read_tasks_claims_and_reads_in_one_round_trip(fake_redis: _FakeRedis) -> None:
+    fake_redis.stale = [_entry("1-0", {"meeting_id": "m-stale"})]
+    fake_redis.new = [_entry(f"{i}-1", {"meeting_id": f"m-{i}"}) for i in range(2, 6)]
+
+    tasks = streams.read_tasks(stream="q:test", group="g:test", consumer="c-1", count=4)
+
+    # зависшие + новые вместе не больше count: "5-1" остаётся в stream
+    assert [t.entry_id for t in tasks] == ["1-0", "2-1", "3-1", "4-1"]
+    assert tasks[0].payload == {"meeting_id": "m-stale"}
+    assert [e[0] for e in fake_redis.new] == ["5-1"]
+    # XGROUP CREATE + один скрипт
+    assert fake_redis.round_trips == 2
+    assert fake_redis.blocking_reads == []
+
+
+def test_read_tasks_caches_group_creation(fake_redis: _FakeRedis) -> None:
+    fake_redis.new = [_entry(f"{i}-0", {"n": i}) for i in range(3)]
+
+    for _ in range(3):
+        streams.read_tasks(stream="q:test", group="g:test", consumer="c-1", count=1)
+
+    assert fake_redis.group_creates == 1
+
+
+def test_read_tasks_blocks_only_when_queue_is_empty(fake_redis: _FakeRedis) -> None:
+    tasks = streams.read_tasks(
+        stream="q:test", group="g:test", consumer="c-1", count=8, block_ms=250
+    )
+
+    assert tasks == []
+    assert fake_redis.blocking_reads == [250]
+
+
+def test_read_tasks_acks_malformed_entries(fake_redis: _FakeRedis) -> None:
+    fake_redis.stale = [("1-0", None)]
+    fake_redis.new = [("2-0", {"other": "x"}), _entry("3-0", {"ok": True})]
+
+    tasks = streams.read_tasks(stream="q:test", group="g:test", consumer="c-1", count=4)
+
+    assert [t.entry_id for t in tasks] == ["3-0"]
+    assert fake_redis.acked == [("1-0", "2-0")]
+
+
+def test_read_tasks_recreates_group_after_nogroup(fake_redis: _FakeRedis, monkeypatch) -> None:
+    def _boom(**kwargs):
+        raise redis.ResponseError("NOGROUP No such key 'q:test' or consumer group 'g:test'")
+
+    streams.ensure_group("q:test", "g:test")
+    monkeypatch.setattr(fake_redis, "register_script", lambda script: _boom)
+
+    assert streams.read_tasks(stream="q:test", group="g:test", consumer="c-1") == []
+    assert ("q:test", "g:test") not in streams._READY_GROUPS
+
+
+def test_ack_tasks_uses_single_xack(fake_redis: _FakeRedis) -> None:
+    assert streams.ack_tasks(stream="q:test", group="g:test", entry_ids=["1-0", "2-0"]) == 2
+    assert streams.ack_tasks(stream="q:test", group="g:test", entry_ids=[]) == 0
+    assert fake_redis.acked == [("1-0", "2-0")]
+
+
+def test_read_tasks_stale_fill_whole_batch(fake_redis: _FakeRedis) -> None:
+    fake_redis.stale = [_entry(f"{i}-0", {"n": i}) for i in range(3)]
+    fake_redis.new = [_entry("9-0", {"n": 9})]
+
+    tasks = streams.read_tasks(stream="q:test", group="g:test", consumer="c-1", count=2)
+
+    assert [t.entry_id for t in tasks] == ["0-0", "1-0"]
+    assert len(fake_redis.new) == 1
+
+
+def test_touch_tasks_uses_single_xclaim_justid(fake_redis: _FakeRedis) -> None:
+    assert (
+        streams.touch_tasks(
+            stream="q:test", group="g:test", consumer="c-1", entry_ids=["1-0", "2-0"]
+        )
+        == 2
+    )
+    assert streams.touch_tasks(stream="q:test", group="g:test", consumer="c-1", entry_ids=[]) == 0
+    assert fake_redis.touched == [("1-0", "2-0")]
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.storage import blob, records
+from interview_analytics_agent.storage.models import Base, Meeting, RetentionCheckpoint
+from interview_analytics_agent.storage.retention import apply_retention
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    s = get_settings()
+    monkeypatch.setattr(s, "app_env", "dev")
+    monkeypatch.setattr(s, "storage_mode", "local_fs")
+    monkeypatch.setattr(s, "chunks_dir", str(tmp_path / "chunks"))
+    monkeypatch.setattr(s, "records_dir", str(tmp_path / "records"))
+    monkeypatch.setattr(s, "retention_days_audio", 14)
+    monkeypatch.setattr(s, "retention_days_text", 90)
+    monkeypatch.setattr(s, "retention_batch_size", 3)
+    monkeypatch.setattr(s, "retention_purge_concurrency", 4)
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def scope():
+        session = factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    try:
+        yield engine, scope
+    finally:
+        engine.dispose()
+
+
+def _add_meeting(scope, meeting_id: str, age_days: int) -> None:
+    with scope() as s:
+        s.add(
+            Meeting(
+                id=meeting_id,
+                created_at=datetime.utcnow() - timedelta(days=age_days),
+                status="done",
+                consent="unknown",
+                context={},
+                raw_transcript=f"raw {meeting_id}",
+                enhanced_transcript=f"clean {meeting_id}",
+            )
+        )
+    blob.put_bytes(f"meetings/{meeting_id}/chunks/1.bin", meeting_id.encode())
+    records.write_text(meeting_id, "raw.txt", "raw")
+
+
+def test_retention_in_batches_with_checkpoints(env) -> None:
+    engine, scope = env
+    old = [f"old-{i}" for i in range(7)]
+    mid = ["mid-0", "mid-1"]
+    fresh = ["fresh-0"]
+    for i, mid_id in enumerate(old):
+        _add_meeting(scope, mid_id, 120 + i)
+    for mid_id in mid:
+        _add_meeting(scope, mid_id, 30)
+    _add_meeting(scope, fresh[0], 1)
+
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2].lower()))
+    result = apply_retention(session_scope=scope)
+
+    # аудио: 9 встреч старше 14 дней (3+3+3), текст: 7 старше 90 (3+3+1)
+    assert (result.audio_meetings, result.text_meetings, result.text_cleared) == (9, 7, 7)
+    assert result.batches == 6
+    # транскрипты/отчёты в память не грузятся: только ключи и UPDATE по диапазону
+    assert not any(
+        "raw_transcript" in sql and sql.lstrip().startswith("select") for sql in statements
+    )
+
+    with scope() as s:
+        raw = {m.id: m.raw_transcript for m in s.query(Meeting)}
+        checkpoints = {c.policy: c.meeting_id for c in s.query(RetentionCheckpoint)}
+    assert all(raw[m] == "" for m in old)
+    assert all(raw[m] == f"raw {m}" for m in mid + fresh)
+    assert checkpoints == {"audio": "mid-1", "text": "old-0"}
+
+    for m in old + mid:
+        assert not blob.exists(f"meetings/{m}/chunks/1.bin")
+    assert blob.exists("meetings/fresh-0/chunks/1.bin")
+    assert [m for m in old + mid + fresh if records.meeting_dir(m).exists()] == mid + fresh
+
+    # повторный запуск продолжает с checkpoint-ов: обработаны только новые просроченные
+    _add_meeting(scope, "late-0", 20)
+    again = apply_retention(session_scope=scope)
+    assert (again.audio_meetings, again.text_meetings) == (1, 0)
+    assert not blob.exists("meetings/late-0/chunks/1.bin")
+
+
+def test_retention_collects_unreferenced_cas_objects(env, monkeypatch) -> None:
+    _, scope = env
+    monkeypatch.setattr(get_settings(), "storage_dedup", True)
+    calls: list[int] = []
+    monkeypatch.setattr(blob, "gc_blobs", lambda: calls.append(1) or 2)
+
+    result = apply_retention(session_scope=scope)
+
+    assert calls == [1]
+    assert result.cas_objects_removed == 2
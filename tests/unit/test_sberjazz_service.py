@@ -346,24 +346,100 @@ def test_pull_live_chunks_ingests_and_saves_cursor(monkeypatch) -> None:
         }
 
     monkeypatch.setattr(fake_connector, "fetch_live_chunks", _fetch_live_chunks)
-    calls: list[tuple[str, int, str]] = []
+    calls: list[tuple[str, int, str, bytes]] = []
     monkeypatch.setattr(
         sberjazz_service,
-        "ingest_audio_chunk_b64",
-        lambda **kwargs: (
-            calls.append((kwargs["meeting_id"], kwargs["seq"], kwargs["idempotency_key"]))
+        "ingest_audio_chunks_bulk",
+        lambda **kwargs: [
+            calls.append((kwargs["meeting_id"], c.seq, c.idempotency_key, c.audio_bytes))
             or type("ChunkIngestResult", (), {"is_duplicate": False})()
-        ),
+            for c in kwargs["chunks"]
+        ],
     )
 
     result = sberjazz_service.pull_sberjazz_live_chunks(limit_sessions=10, batch_limit=10)
     assert result.connected == 1
     assert result.pulled == 1
     assert result.ingested == 1
-    assert calls == [("m-live-1", 7, "ch-1")]
+    assert calls == [("m-live-1", 7, "ch-1", b"a")]
     assert fake_redis.get(sberjazz_service._live_cursor_key("m-live-1")) == "cursor-2"
 
 
+def _live_session(monkeypatch, meeting_id: str, fetch) -> _FakeRedis:
+    fake_redis = _FakeRedis()
+    fake_connector = _FakeConnector()
+    monkeypatch.setattr(sberjazz_service, "redis_client", lambda: fake_redis)
+    monkeypatch.setattr(
+        sberjazz_service,
+        "_resolve_connector",
+        lambda: ("sberjazz_mock", fake_connector),
+    )
+    sberjazz_service._SESSIONS.clear()
+    sberjazz_service._CIRCUIT_BREAKER = None
+    sberjazz_service._SESSIONS[meeting_id] = sberjazz_service.SberJazzSessionState(
+        meeting_id=meeting_id,
+        provider="sberjazz_mock",
+        connected=True,
+        attempts=1,
+        last_error=None,
+        updated_at="2020-01-01T00:00:00+00:00",
+    )
+    monkeypatch.setattr(fake_connector, "fetch_live_chunks", fetch)
+    return fake_redis
+
+
+def test_pull_live_chunks_skips_only_undecodable_chunk(monkeypatch) -> None:
+    fake_redis = _live_session(
+        monkeypatch,
+        "m-live-5",
+        lambda meeting_id, cursor=None, limit=20: {
+            "chunks": [
+                {"id": "ch-1", "seq": 1, "content_b64": "YQ=="},
+                {"id": "ch-2", "seq": 2, "content_b64": "YQ="},
+                {"id": "ch-3", "seq": 3, "content_b64": "Yg=="},
+            ],
+            "next_cursor": "cursor-5",
+        },
+    )
+    ingested: list[tuple[int, bytes]] = []
+    monkeypatch.setattr(
+        sberjazz_service,
+        "ingest_audio_chunks_bulk",
+        lambda **kwargs: [
+            ingested.append((c.seq, c.audio_bytes))
+            or type("ChunkIngestResult", (), {"is_duplicate": False})()
+            for c in kwargs["chunks"]
+        ],
+    )
+
+    result = sberjazz_service.pull_sberjazz_live_chunks(limit_sessions=10, batch_limit=10)
+    assert result.failed == 0
+    assert result.invalid_chunks == 1
+    assert result.ingested == 2
+    assert ingested == [(1, b"a"), (3, b"b")]
+    assert fake_redis.get(sberjazz_service._live_cursor_key("m-live-5")) == "cursor-5"
+
+
+def test_pull_live_chunks_keeps_cursor_when_ingest_fails(monkeypatch) -> None:
+    fake_redis = _live_session(
+        monkeypatch,
+        "m-live-6",
+        lambda meeting_id, cursor=None, limit=20: {
+            "chunks": [{"id": "ch-1", "seq": 1, "content_b64": "YQ=="}],
+            "next_cursor": "cursor-6",
+        },
+    )
+    monkeypatch.setattr(
+        sberjazz_service,
+        "ingest_audio_chunks_bulk",
+        lambda **kwargs: (_ for _ in ()).throw(RuntimeError("redis down")),
+    )
+
+    result = sberjazz_service.pull_sberjazz_live_chunks(limit_sessions=10, batch_limit=10)
+    assert result.failed == 1
+    assert fake_redis.get(sberjazz_service._live_cursor_key("m-live-6")) is None
+
+
 def test_pull_live_chunks_marks_failed_on_invalid_payload(monkeypatch) -> None:
     fake_redis = _FakeRedis()
     fake_connector = _FakeConnector()
@@ -438,8 +514,10 @@ def test_pull_live_chunks_retries_fetch(monkeypatch) -> None:
         monkeypatch.setattr(fake_connector, "fetch_live_chunks", _fetch_live_chunks)
         monkeypatch.setattr(
             sberjazz_service,
-            "ingest_audio_chunk_b64",
-            lambda **kwargs: type("ChunkIngestResult", (), {"is_duplicate": False})(),
+            "ingest_audio_chunks_bulk",
+            lambda **kwargs: [
+                type("ChunkIngestResult", (), {"is_duplicate": False})() for _ in kwargs["chunks"]
+            ],
         )
 
         result = sberjazz_service.pull_sberjazz_live_chunks(limit_sessions=10, batch_limit=10)
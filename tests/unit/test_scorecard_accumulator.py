@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+
+from interview_analytics_agent.processing.scorecard import (
+    ScorecardAccumulator,
+    build_interview_scorecard,
+)
+from interview_analytics_agent.services.scorecard_state import changed_scorecard_segments
+
+_TEXTS = [
+    "Я выбрал такой подход, потому что latency важнее throughput",
+    "Команда делала review архитектуры, был conflict по deadline",
+    "We use a queue and event driven design to scale the service",
+    "Можешь привести пример? Да, объясню на примере cache",
+    "Для бизнеса важен customer value и roadmap",
+    "Why this tradeoff? Because database sql queries were slow",
+]
+
+
+def _segments(n: int) -> list[dict]:
+    return [
+        {"seq": i, "speaker": "candidate", "enhanced_text": _TEXTS[i % len(_TEXTS)]}
+        for i in range(n)
+    ]
+
+
+def _build(segments: list[dict], acc: ScorecardAccumulator | None = None) -> dict:
+    return build_interview_scorecard(
+        enhanced_transcript="",
+        meeting_context={},
+        report={"risk_flags": []},
+        transcript_segments=segments,
+        accumulator=acc,
+    )
+
+
+def test_incremental_fold_matches_full_rebuild() -> None:
+    segs = _segments(12)
+    acc = ScorecardAccumulator()
+    _build(segs[:5], acc)
+    # сериализация между запусками, как в worker_analytics
+    acc = ScorecardAccumulator.from_dict(json.loads(json.dumps(acc.to_dict())))
+    # сегменты могут приходить не по порядку
+    incremental = _build(segs[5:9] + segs[:5] + segs[9:], acc)
+
+    assert incremental == _build(segs)
+
+
+def test_fold_scans_only_new_rows() -> None:
+    rows = [{"seq": s["seq"], "text": s["enhanced_text"]} for s in _segments(6)]
+    acc = ScorecardAccumulator()
+    assert acc.fold(rows[:4]) == 4
+    assert acc.fold(rows) == 2
+    assert acc.fold(rows) == 0
+
+
+def test_folded_seqs_are_kept_as_ranges() -> None:
+    rows = [{"seq": s["seq"], "text": s["enhanced_text"]} for s in _segments(12)]
+    acc = ScorecardAccumulator()
+    acc.fold(rows[:4] + rows[6:])
+    assert acc.folded == [[0, 3], [6, 11]]
+
+    # поздние сегменты склеивают диапазоны
+    acc.fold(rows[4:6])
+    assert acc.folded == [[0, 11]]
+    assert acc.has_folded([5]) and not acc.has_folded([12])
+
+
+class _FakeSegmentRepo:
+    def __init__(self, segs: list[dict]) -> None:
+        self.segs = segs
+        self.calls: list[str] = []
+
+    def list_by_meeting(self, meeting_id: str) -> list[dict]:
+        self.calls.append("all")
+        return list(self.segs)
+
+    def list_by_meeting_seqs(self, meeting_id: str, seqs: list[int]) -> list[dict]:
+        self.calls.append(f"seqs:{seqs}")
+        return [s for s in self.segs if s["seq"] in seqs]
+
+
+def test_refresh_reads_only_dirty_segments() -> None:
+    segs = _segments(12)
+    # seq=3 придёт поздно, seq=11 — новый
+    repo = _FakeSegmentRepo(segs[:3] + segs[4:11])
+    acc = ScorecardAccumulator()
+    _build(changed_scorecard_segments(repo, "m-1", acc, set()), acc)
+    assert repo.calls == ["all"]  # первый запуск — вся встреча
+
+    repo.segs = segs
+    repo.calls = []
+    changed = changed_scorecard_segments(repo, "m-1", acc, {"3", "11"})
+    assert repo.calls == ["seqs:[3, 11]"]
+    assert _build(changed, acc) == _build(segs)
+
+
+def test_rewritten_segment_resets_state() -> None:
+    segs = _segments(6)
+    repo = _FakeSegmentRepo(segs)
+    acc = ScorecardAccumulator()
+    _build(changed_scorecard_segments(repo, "m-1", acc, set()), acc)
+
+    segs[1] = {"seq": 1, "speaker": "candidate", "enhanced_text": "ничего по делу"}
+    repo.calls = []
+    changed = changed_scorecard_segments(repo, "m-1", acc, {"1"})
+    assert repo.calls == ["all"]
+    assert _build(changed, acc) == _build(segs)
+
+
+def test_no_changes_keep_scorecard() -> None:
+    segs = _segments(6)
+    acc = ScorecardAccumulator()
+    full = _build(segs, acc)
+    # с аккумулятором строки транскрипта не подставляются вместо сегментов
+    assert (
+        build_interview_scorecard(
+            enhanced_transcript="python cache\nsql",
+            meeting_context={},
+            report={"risk_flags": []},
+            transcript_segments=[],
+            accumulator=acc,
+        )
+        == full
+    )
+
+
+def test_incompatible_snapshot_starts_empty() -> None:
+    acc = ScorecardAccumulator()
+    acc.fold([{"seq": 1, "text": "python cache"}])
+    data = acc.to_dict()
+    data["version"] = 0
+
+    restored = ScorecardAccumulator.from_dict(data)
+    assert restored.folded == []
+    assert sum(restored.hits.values()) == 0
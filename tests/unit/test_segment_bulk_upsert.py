@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from interview_analytics_agent.domain.enums import PipelineStatus
+from interview_analytics_agent.storage.models import Base, Meeting, TranscriptSegment
+from interview_analytics_agent.storage.repositories import (
+    MeetingRepository,
+    TranscriptSegmentRepository,
+)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        yield s
+    engine.dispose()
+
+
+def _row(seq: int, text: str, meeting_id: str = "m-1") -> dict:
+    return {
+        "meeting_id": meeting_id,
+        "seq": seq,
+        "speaker": "spk",
+        "start_ms": None,
+        "end_ms": None,
+        "raw_text": text,
+        "enhanced_text": text,
+        "confidence": 0.9,
+    }
+
+
+def _count_statements(session: Session) -> list[str]:
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, stmt, *a: statements.append(stmt),
+    )
+    return statements
+
+
+def test_upsert_many_inserts_and_rewrites_in_bulk(session: Session) -> None:
+    MeetingRepository(session).ensure_exists(meeting_id="m-1")
+    repo = TranscriptSegmentRepository(session)
+
+    repo.upsert_many([_row(0, "a"), _row(1, "b")])
+    repo.upsert_many([_row(1, "b2"), _row(2, "c"), _row(2, "c2")])
+
+    segs = repo.list_by_meeting("m-1")
+    assert [(s.seq, s.raw_text) for s in segs] == [(0, "a"), (1, "b2"), (2, "c2")]
+
+
+def test_upsert_many_updates_only_requested_columns(session: Session) -> None:
+    MeetingRepository(session).ensure_exists(meeting_id="m-1")
+    repo = TranscriptSegmentRepository(session)
+    repo.upsert_many([_row(0, "raw")])
+
+    repo.upsert_many(
+        [{"meeting_id": "m-1", "seq": 0, "enhanced_text": "Raw."}],
+        update_columns=("enhanced_text",),
+    )
+    [seg] = repo.list_by_meeting("m-1")
+    assert (seg.raw_text, seg.enhanced_text, seg.speaker) == ("raw", "Raw.", "spk")
+
+
+def test_worker_chunk_write_is_two_inserts(session: Session) -> None:
+    statements = _count_statements(session)
+    MeetingRepository(session).ensure_exists(meeting_id="m-2", status=PipelineStatus.processing)
+    TranscriptSegmentRepository(session).upsert_many([_row(0, "a", meeting_id="m-2")])
+
+    writes = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(writes) == 2
+    assert all("ON CONFLICT" in s for s in writes)
+    # ни SELECT существующих ключей, ни RETURNING
+    assert len(statements) == 2
+    assert not any("RETURNING" in s for s in statements)
+    assert session.get(Meeting, "m-2").status == PipelineStatus.processing
+
+
+def test_ensure_exists_keeps_existing_meeting(session: Session) -> None:
+    mrepo = MeetingRepository(session)
+    mrepo.ensure_exists(meeting_id="m-3", meeting_context={"source": "first"})
+    mrepo.ensure_exists(meeting_id="m-3", meeting_context={"source": "second"})
+    mrepo.ensure_exists(meeting_id="m-3", status=PipelineStatus.done)
+
+    m = session.get(Meeting, "m-3")
+    assert m.context == {"source": "first"}
+    assert m.status == PipelineStatus.done
+    assert session.query(TranscriptSegment).count() == 0
+
+
+def test_ensure_exists_updates_status_only_when_changed(session: Session) -> None:
+    mrepo = MeetingRepository(session)
+    mrepo.ensure_exists(meeting_id="m-4", status=PipelineStatus.processing)
+    statements = _count_statements(session)
+
+    mrepo.ensure_exists(meeting_id="m-4", status=PipelineStatus.processing)
+    mrepo.ensure_exists(meeting_id="m-4", status=PipelineStatus.done)
+
+    updates = [s for s in statements if s.lstrip().upper().startswith("UPDATE")]
+    assert len(updates) == 2
+    assert all("status !=" in s for s in updates)
+    assert not any("DO UPDATE" in s for s in statements)
+    session.expire_all()
+    assert session.get(Meeting, "m-4").status == PipelineStatus.done
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+
+from interview_analytics_agent.stt.audio import DecodedAudio
+from interview_analytics_agent.stt.base import STTResult
+from interview_analytics_agent.stt.batching import BatchingSTTProvider
+
+
+class _FakeBatchProvider:
+    def __init__(self) -> None:
+        self.batches: list[int] = []
+        self.single_calls = 0
+
+    def transcribe_chunk(self, *, audio: bytes, sample_rate: int, decoded=None) -> STTResult:
+        _ = audio, sample_rate, decoded
+        self.single_calls += 1
+        return STTResult(text="single")
+
+    def transcribe_batch(self, items: list[DecodedAudio], *, batch_size=None) -> list[STTResult]:
+        _ = batch_size
+        self.batches.append(len(items))
+        return [STTResult(text=f"n={int(item.samples[0])}") for item in items]
+
+
+def _decoded(n: int) -> DecodedAudio:
+    return DecodedAudio(samples=np.full(160, n, dtype=np.float32))
+
+
+def test_concurrent_calls_are_batched_and_fanned_out() -> None:
+    provider = _FakeBatchProvider()
+    batching = BatchingSTTProvider(provider, max_batch=4, max_wait_ms=2000)
+    results: dict[int, str] = {}
+
+    def _call(n: int) -> None:
+        res = batching.transcribe_chunk(audio=b"x", sample_rate=16000, decoded=_decoded(n))
+        results[n] = res.text
+
+    threads = [threading.Thread(target=_call, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert provider.batches == [4]
+    assert results == {n: f"n={n}" for n in range(4)}
+
+
+def test_partial_batch_flushes_after_max_wait() -> None:
+    provider = _FakeBatchProvider()
+    batching = BatchingSTTProvider(provider, max_batch=8, max_wait_ms=20)
+
+    res = batching.transcribe_chunk(audio=b"x", sample_rate=16000, decoded=_decoded(7))
+
+    assert res.text == "n=7"
+    assert provider.batches == [1]
+
+
+def test_undecoded_chunk_goes_to_provider_directly() -> None:
+    provider = _FakeBatchProvider()
+    batching = BatchingSTTProvider(provider, max_batch=4)
+
+    assert batching.transcribe_chunk(audio=b"x", sample_rate=16000).text == "single"
+    assert provider.batches == []
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import faster_whisper
+import pytest
+
+from interview_analytics_agent.stt import model_pool
+
+
+class _FakeWhisperModel:
+    created: list[tuple] = []
+
+    def __init__(self, model_size: str, **kwargs) -> None:
+        type(self).created.append((model_size, kwargs["compute_type"], kwargs["num_workers"]))
+
+
+@pytest.fixture(autouse=True)
+def _fake_models(monkeypatch) -> None:
+    monkeypatch.setattr(model_pool, "_MODELS", {})
+    monkeypatch.setattr(faster_whisper, "WhisperModel", _FakeWhisperModel)
+    _FakeWhisperModel.created = []
+
+
+def test_model_is_loaded_once_per_key() -> None:
+    a = model_pool.get_whisper_model(model_size="small", device="cpu", compute_type="int8", slots=2)
+    b = model_pool.get_whisper_model(model_size="small", device="cpu", compute_type="int8")
+    c = model_pool.get_whisper_model(model_size="small", device="cpu", compute_type="float32")
+
+    assert a is b
+    assert a.model is b.model
+    assert c is not a
+    assert _FakeWhisperModel.created == [("small", "int8", 2), ("small", "float32", 1)]
+
+
+def test_inference_slots_bound_concurrency() -> None:
+    pooled = model_pool.get_whisper_model(
+        model_size="tiny", device="cpu", compute_type="int8", slots=2
+    )
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def _infer() -> None:
+        with pooled.inference_slot():
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+
+    threads = [threading.Thread(target=_infer) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert state["peak"] == 2
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+
+from interview_analytics_agent.stt.base import STTResult
+from interview_analytics_agent.stt.result_cache import (
+    CachedSTTProvider,
+    DiskSTTCache,
+    RedisSTTCache,
+    cache_key,
+)
+
+
+class _CountingProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def transcribe_chunk(self, *, audio, sample_rate, decoded=None) -> STTResult:
+        _ = sample_rate, decoded
+        self.calls += 1
+        return STTResult(text=f"text-{len(audio)}", confidence=0.9)
+
+
+class _FakePipeline:
+    def __init__(self, r: _FakeRedis) -> None:
+        self.r = r
+        self.ops: list = []
+
+    def __getattr__(self, name: str):
+        def _op(*args, **kwargs):
+            self.ops.append((name, args, kwargs))
+            return self
+
+        return _op
+
+    def execute(self) -> list:
+        return [getattr(self.r, name)(*args, **kwargs) for name, args, kwargs in self.ops]
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.kv: dict[str, str] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        _ = transaction
+        return _FakePipeline(self)
+
+    def get(self, key: str):
+        return self.kv.get(key)
+
+    def set(self, key: str, value: str, ex: int | None = None) -> bool:
+        _ = ex
+        self.kv[key] = value
+        return True
+
+    def delete(self, *keys: str) -> int:
+        return sum(1 for k in keys if self.kv.pop(k, None) is not None)
+
+    def zadd(self, key: str, mapping: dict) -> int:
+        self.zsets.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    def zrem(self, key: str, *members: str) -> int:
+        return sum(1 for m in members if self.zsets.get(key, {}).pop(m, None) is not None)
+
+    def zcard(self, key: str) -> int:
+        return len(self.zsets.get(key, {}))
+
+    def zpopmin(self, key: str, count: int = 1) -> list:
+        z = self.zsets.get(key, {})
+        popped = sorted(z.items(), key=lambda kv: kv[1])[:count]
+        for member, _ in popped:
+            del z[member]
+        return popped
+
+
+def test_cached_provider_hits_on_same_bytes_and_params(tmp_path) -> None:
+    inner = _CountingProvider()
+    cache = DiskSTTCache(tmp_path, max_entries=10)
+    stt = CachedSTTProvider(inner, cache, fingerprint="whisper_local|small|ru")
+    other = CachedSTTProvider(inner, cache, fingerprint="whisper_local|medium|ru")
+
+    first = stt.transcribe_chunk(audio=b"chunk", sample_rate=16000)
+    second = stt.transcribe_chunk(audio=b"chunk", sample_rate=16000)
+    other.transcribe_chunk(audio=b"chunk", sample_rate=16000)
+
+    assert first == second == STTResult(text="text-5", confidence=0.9)
+    assert inner.calls == 2
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = DiskSTTCache(tmp_path, max_entries=2)
+    for i, key in enumerate(["aa1", "bb2", "cc3"]):
+        cache.set(key, STTResult(text=key))
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    os.utime(cache._path("aa1"), (2000, 2000))  # недавно читали
+
+    assert cache.evict() == 1
+    assert cache.get("bb2") is None
+    assert cache.get("aa1").text == "aa1"
+    assert cache.get("cc3").text == "cc3"
+
+
+def test_redis_cache_bounds_entries() -> None:
+    r = _FakeRedis()
+    cache = RedisSTTCache(r, max_entries=2, ttl_sec=60)
+    keys = [cache_key(bytes([i]), "fp") for i in range(3)]
+    for key in keys:
+        cache.set(key, STTResult(text=key[:6]))
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]).text == keys[2][:6]
+    assert r.zcard("stt:cache:lru") == 2
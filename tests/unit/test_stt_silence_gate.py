@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from interview_analytics_agent.stt.audio import DecodedAudio
+from interview_analytics_agent.stt.base import STTResult
+from interview_analytics_agent.stt.silence_gate import SilenceGate, SilenceGatedSTTProvider
+
+_SR = 16000
+
+
+def _tone(amplitude: float, seconds: float = 1.0) -> DecodedAudio:
+    t = np.arange(int(_SR * seconds)) / _SR
+    return DecodedAudio(samples=(amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32))
+
+
+def _noise(amplitude: float, seconds: float = 1.0) -> DecodedAudio:
+    rnd = np.random.default_rng(0)
+    samples = amplitude * rnd.uniform(-1.0, 1.0, int(_SR * seconds))
+    return DecodedAudio(samples=samples.astype(np.float32))
+
+
+class _CountingProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def transcribe_chunk(self, *, audio, sample_rate, decoded=None) -> STTResult:
+        _ = audio, sample_rate, decoded
+        self.calls += 1
+        return STTResult(text="речь")
+
+
+@pytest.mark.parametrize("mode", ["energy", "frames", "webrtc"])
+def test_gate_skips_silence_and_keeps_speech(mode: str) -> None:
+    gate = SilenceGate(mode=mode)
+
+    assert gate.is_silent(DecodedAudio(samples=np.zeros((0,), dtype=np.float32)))
+    assert gate.is_silent(_tone(0.001))
+    assert not gate.is_silent(_tone(0.2))
+
+
+def test_frames_mode_skips_broadband_line_noise() -> None:
+    loud_noise = _noise(0.1)
+
+    assert not SilenceGate(mode="energy").is_silent(loud_noise)
+    assert SilenceGate(mode="frames").is_silent(loud_noise)
+
+
+def test_gated_provider_does_not_call_model_for_silent_chunks() -> None:
+    inner = _CountingProvider()
+    stt = SilenceGatedSTTProvider(inner, SilenceGate(mode="frames"))
+
+    silent = stt.transcribe_chunk(audio=b"x", sample_rate=_SR, decoded=_tone(0.0005))
+    speech = stt.transcribe_chunk(audio=b"x", sample_rate=_SR, decoded=_tone(0.3))
+    undecoded = stt.transcribe_chunk(audio=b"x", sample_rate=_SR, decoded=None)
+
+    assert (silent.text, silent.silent) == ("", True)
+    assert speech.text == "речь" and not speech.silent
+    assert undecoded.text == "речь"
+    assert inner.calls == 2
+
+
+def test_unknown_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        SilenceGate(mode="loud")
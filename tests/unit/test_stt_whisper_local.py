@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+whisper_local = pytest.importorskip("interview_analytics_agent.stt.whisper_local")
+
+from interview_analytics_agent.stt.audio import DecodedAudio  # noqa: E402
+from interview_analytics_agent.stt.model_pool import ModelKey, PooledWhisperModel  # noqa: E402
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.calls: list[np.ndarray] = []
+
+    def transcribe(self, wav, **kwargs):
+        _ = kwargs
+        self.calls.append(wav)
+        return [SimpleNamespace(text=" привет "), SimpleNamespace(text="мир")], None
+
+
+def _provider(model: _FakeModel):
+    provider = whisper_local.WhisperLocalProvider.__new__(whisper_local.WhisperLocalProvider)
+    provider.pooled = PooledWhisperModel(
+        key=ModelKey(model_size="fake", device="cpu", compute_type="int8"), model=model, slots=1
+    )
+    provider.model = model
+    provider.language = "ru"
+    provider.vad_filter = False
+    provider.beam_size = 1
+    return provider
+
+
+def test_transcribe_uses_decoded_audio_without_decoding_bytes(monkeypatch) -> None:
+    monkeypatch.setattr(
+        whisper_local,
+        "decode_audio",
+        lambda *a, **k: pytest.fail("bytes must not be decoded again"),
+    )
+    model = _FakeModel()
+    decoded = DecodedAudio(samples=np.ones(1600, dtype=np.float32))
+
+    res = _provider(model).transcribe_chunk(audio=b"raw", sample_rate=16000, decoded=decoded)
+
+    assert res.text == "привет мир"
+    assert model.calls[0] is decoded.samples
+
+
+def test_transcribe_skips_model_for_empty_audio() -> None:
+    model = _FakeModel()
+    decoded = DecodedAudio(samples=np.zeros((0,), dtype=np.float32))
+
+    res = _provider(model).transcribe_chunk(audio=b"", sample_rate=16000, decoded=decoded)
+
+    assert res.text == ""
+    assert model.calls == []
+
+
+class _FakeBatchedPipeline:
+    def __init__(self) -> None:
+        self.clips: list[dict] = []
+
+    def transcribe(self, audio, **kwargs):
+        self.clips = kwargs["clip_timestamps"]
+        # по сегменту на clip, время начала — начало clip (как без таймстемпов)
+        segs = [
+            SimpleNamespace(text=f"clip{i}", start=round(c["start"], 3))
+            for i, c in enumerate(self.clips)
+        ]
+        return segs, None
+
+
+def test_transcribe_batch_maps_segments_back_to_chunks() -> None:
+    provider = _provider(_FakeModel())
+    pipeline = _FakeBatchedPipeline()
+    provider._batched = pipeline
+    items = [
+        DecodedAudio(samples=np.ones(16001, dtype=np.float32)),
+        DecodedAudio(samples=np.zeros((0,), dtype=np.float32)),
+        DecodedAudio(samples=np.ones(8000, dtype=np.float32)),
+    ]
+
+    results = provider.transcribe_batch(items)
+
+    assert [r.text for r in results] == ["clip0", "", "clip1"]
+    assert len(pipeline.clips) == 2
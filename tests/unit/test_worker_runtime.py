@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from interview_analytics_agent.queue import runtime
+from interview_analytics_agent.queue.streams import StreamTask
+
+
+@pytest.fixture(autouse=True)
+def _reset_shutdown(monkeypatch) -> None:
+    monkeypatch.setattr(runtime, "_SHUTDOWN", threading.Event())
+    monkeypatch.setattr(runtime, "promote_due_retries", lambda queue: 0)
+    monkeypatch.setattr(runtime, "promote_due_coalesced", lambda queue: 0)
+
+
+def _tasks(n: int) -> list[StreamTask]:
+    return [StreamTask(stream="q:test", entry_id=f"{i}-0", payload={"n": i}) for i in range(n)]
+
+
+def _install_queue(monkeypatch, tasks: list[StreamTask]) -> list[str]:
+    backlog = list(tasks)
+    acked: list[str] = []
+    lock = threading.Lock()
+
+    def _read_tasks(*, count: int, **kwargs):
+        _ = kwargs
+        with lock:
+            out = backlog[:count]
+            del backlog[:count]
+        if not out:
+            time.sleep(0.005)
+        return out
+
+    def _ack_tasks(*, entry_ids, **kwargs):
+        _ = kwargs
+        with lock:
+            acked.extend(entry_ids)
+        return len(entry_ids)
+
+    monkeypatch.setattr(runtime, "read_tasks", _read_tasks)
+    monkeypatch.setattr(runtime, "ack_tasks", _ack_tasks)
+    monkeypatch.setattr(runtime, "touch_tasks", lambda **kwargs: 0)
+    return acked
+
+
+def test_runtime_runs_tasks_concurrently_and_acks_each(monkeypatch) -> None:
+    acked = _install_queue(monkeypatch, _tasks(8))
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0, "done": 0}
+
+    def _handler(msg: StreamTask) -> bool:
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.03)
+        with lock:
+            state["active"] -= 1
+            state["done"] += 1
+            if state["done"] == 8:
+                runtime.request_shutdown()
+        # нечётные задачи "упали" без ретрая — ACK не нужен
+        return msg.payload["n"] % 2 == 0
+
+    runtime.WorkerRuntime(
+        service="worker-test",
+        stream="q:test",
+        group="g:test",
+        consumer="c-1",
+        handler=_handler,
+        concurrency=4,
+        batch_size=8,
+    ).run()
+
+    assert state["peak"] == 4
+    assert sorted(acked) == ["0-0", "2-0", "4-0", "6-0"]
+
+
+def test_runtime_drains_inflight_on_shutdown(monkeypatch) -> None:
+    acked = _install_queue(monkeypatch, _tasks(2))
+    started = threading.Barrier(3)
+
+    def _handler(msg: StreamTask) -> bool:
+        _ = msg
+        started.wait(timeout=1)
+        time.sleep(0.05)
+        return True
+
+    def _stop_when_started() -> None:
+        started.wait(timeout=1)
+        runtime.request_shutdown()
+
+    stopper = threading.Thread(target=_stop_when_started)
+    stopper.start()
+    runtime.WorkerRuntime(
+        service="worker-test",
+        stream="q:test",
+        group="g:test",
+        consumer="c-1",
+        handler=_handler,
+        concurrency=2,
+        shutdown_grace_sec=5,
+    ).run()
+    stopper.join()
+
+    assert sorted(acked) == ["0-0", "1-0"]
+
+
+def test_runtime_does_not_ack_when_handler_raises(monkeypatch) -> None:
+    acked = _install_queue(monkeypatch, _tasks(1))
+
+    def _handler(msg: StreamTask) -> bool:
+        _ = msg
+        runtime.request_shutdown()
+        raise RuntimeError("boom")
+
+    runtime.WorkerRuntime(
+        service="worker-test",
+        stream="q:test",
+        group="g:test",
+        consumer="c-1",
+        handler=_handler,
+    ).run()
+
+    assert acked == []
+
+
+def test_runtime_heartbeats_inflight_tasks(monkeypatch) -> None:
+    _install_queue(monkeypatch, _tasks(2))
+    touched: list[list[str]] = []
+    monkeypatch.setattr(
+        runtime, "touch_tasks", lambda *, entry_ids, **kwargs: touched.append(sorted(entry_ids))
+    )
+    release = threading.Event()
+
+    def _handler(msg: StreamTask) -> bool:
+        _ = msg
+        release.wait(timeout=1)
+        return True
+
+    def _stop_after_heartbeats() -> None:
+        deadline = time.monotonic() + 1
+        while len(touched) < 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        runtime.request_shutdown()
+        release.set()
+
+    stopper = threading.Thread(target=_stop_after_heartbeats)
+    stopper.start()
+    runtime.WorkerRuntime(
+        service="worker-test",
+        stream="q:test",
+        group="g:test",
+        consumer="c-1",
+        handler=_handler,
+        concurrency=2,
+        heartbeat_interval_sec=0.01,
+    ).run()
+    stopper.join()
+
+    assert len(touched) >= 2
+    assert touched[-1] == ["0-0", "1-0"]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from apps.worker_stt import main as worker
+from interview_analytics_agent.domain.enums import PipelineStatus
+from interview_analytics_agent.queue.streams import StreamTask
+from interview_analytics_agent.storage.meeting_cache import KnownMeetingsCache
+from interview_analytics_agent.storage.models import Base, Meeting, TranscriptSegment
+from interview_analytics_agent.stt.base import STTResult
+
+
+class _FakeSTT:
+    def transcribe_chunk(self, *, audio: bytes, sample_rate: int, decoded=None) -> STTResult:
+        return STTResult(text=audio.decode(), confidence=0.9)
+
+
+@pytest.fixture
+def env(monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    statements: list[str] = []
+    event.listen(
+        engine, "before_cursor_execute", lambda conn, cur, stmt, *a: statements.append(stmt)
+    )
+
+    @contextmanager
+    def _session():
+        with Session(engine) as s:
+            yield s
+            s.commit()
+
+    monkeypatch.setattr(worker, "db_session", _session)
+    monkeypatch.setattr(worker, "get_bytes", lambda key: key.encode())
+    monkeypatch.setattr(worker, "try_decode_audio", lambda audio: None)
+    monkeypatch.setattr(worker, "resolve_speaker", lambda **kwargs: "spk")
+    monkeypatch.setattr(worker, "_publish_update", lambda meeting_id, payload: None)
+    monkeypatch.setattr(worker, "enqueue_enhancer", lambda **kwargs: None)
+    monkeypatch.setattr(worker, "note_chunk_done", lambda meeting_id: None)
+    monkeypatch.setattr(worker, "mark_segment_dirty", lambda **kwargs: None)
+    yield engine, statements
+    engine.dispose()
+
+
+def _task(seq: int) -> StreamTask:
+    return StreamTask(
+        stream="q:stt",
+        entry_id=f"1-{seq}",
+        payload={"meeting_id": "m-1", "chunk_seq": seq, "blob_key": f"chunk-{seq}"},
+    )
+
+
+def test_steady_state_chunks_do_not_touch_meetings(env) -> None:
+    engine, statements = env
+    known = KnownMeetingsCache(ttl_sec=300)
+
+    assert worker._handle_task(_task(0), _FakeSTT(), known) is True
+    assert any("meetings" in s for s in statements)
+
+    statements.clear()
+    assert worker._handle_task(_task(1), _FakeSTT(), known) is True
+    assert statements and not any(
+        "INTO meetings" in s or "UPDATE meetings" in s for s in statements
+    )
+
+    with Session(engine) as s:
+        assert s.get(Meeting, "m-1").status == PipelineStatus.processing
+        assert [seg.raw_text for seg in s.query(TranscriptSegment).order_by("seq")] == [
+            "chunk-0",
+            "chunk-1",
+        ]
+
+
+def test_meeting_is_forgotten_after_failure(env, monkeypatch) -> None:
+    known = KnownMeetingsCache(ttl_sec=300)
+    known.remember("m-1")
+    monkeypatch.setattr(worker, "requeue_with_backoff", lambda **kwargs: True)
+    monkeypatch.setattr(
+        worker, "get_bytes", lambda key: (_ for _ in ()).throw(RuntimeError("blob lost"))
+    )
+
+    assert worker._handle_task(_task(0), _FakeSTT(), known) is True
+    assert known.known("m-1") is False
+
+
+def test_cache_expires_and_evicts(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(
+        "interview_analytics_agent.storage.meeting_cache.time.monotonic", lambda: now[0]
+    )
+    cache = KnownMeetingsCache(ttl_sec=10, max_size=2)
+    cache.remember("a")
+    cache.remember("b")
+    cache.remember("c")
+    assert (cache.known("a"), cache.known("b"), cache.known("c")) == (False, True, True)
+
+    now[0] += 11
+    assert cache.known("b") is False
+    assert KnownMeetingsCache(ttl_sec=0).known("a") is False
+
+
+def test_every_segment_write_is_marked_dirty(env, monkeypatch) -> None:
+    marked: list[int] = []
+    monkeypatch.setattr(worker, "mark_segment_dirty", lambda **kwargs: marked.append(kwargs["seq"]))
+    known = KnownMeetingsCache(ttl_sec=300)
+
+    # seq=1 раньше seq=0 и повтор seq=1: каждая запись видна enhancer-у
+    for seq in (1, 0, 1):
+        assert worker._handle_task(_task(seq), _FakeSTT(), known) is True
+    assert marked == [1, 0, 1]
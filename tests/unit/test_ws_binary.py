@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import apps.api_gateway.ws as ws_module
+from apps.api_gateway.main import app
+from interview_analytics_agent.common.config import get_settings
+from interview_analytics_agent.contracts.ws_binary import (
+    WS_SUBPROTOCOL_BINARY,
+    BinaryAudioFrame,
+    BinaryFrameError,
+    decode_audio_frame,
+    encode_audio_frame,
+    negotiate_subprotocol,
+)
+
+
+def test_frame_roundtrip() -> None:
+    frame = BinaryAudioFrame(
+        meeting_id="встреча-1",
+        seq=42,
+        audio=b"\x00\x01RIFF",
+        codec="opus",
+        sample_rate=48000,
+        channels=2,
+        idempotency_key="idem-42",
+    )
+
+    assert decode_audio_frame(encode_audio_frame(frame)) == frame
+
+
+def test_frame_without_idempotency_key() -> None:
+    frame = BinaryAudioFrame(meeting_id="m", seq=1, audio=b"")
+
+    decoded = decode_audio_frame(encode_audio_frame(frame))
+
+    assert decoded.idempotency_key is None
+    assert decoded.audio == b""
+
+
+@pytest.mark.parametrize("data", [b"", b"XX" + b"\x00" * 20, b"IA\x09" + b"\x00" * 20])
+def test_bad_frames_are_rejected(data: bytes) -> None:
+    with pytest.raises(BinaryFrameError):
+        decode_audio_frame(data)
+
+
+def test_negotiation_prefers_binary() -> None:
+    assert negotiate_subprotocol(["interview-audio.v1.json", WS_SUBPROTOCOL_BINARY]) == (
+        WS_SUBPROTOCOL_BINARY
+    )
+    assert negotiate_subprotocol(["chat"]) is None
+    assert negotiate_subprotocol(None) is None
+
+
+@pytest.fixture()
+def ws_settings():
+    s = get_settings()
+    keys = ["auth_mode", "api_keys", "service_api_keys", "queue_mode"]
+    snapshot = {k: getattr(s, k) for k in keys}
+    s.auth_mode = "api_key"
+    s.api_keys = "user-1"
+    s.service_api_keys = "svc-1"
+    s.queue_mode = "inline"
+    try:
+        yield s
+    finally:
+        for k, v in snapshot.items():
+            setattr(s, k, v)
+
+
+def test_ws_accepts_binary_frames_and_json(ws_settings, monkeypatch) -> None:
+    calls: list[dict] = []
+
+    async def _ingest(**kwargs):
+        calls.append(kwargs)
+        update = {"event_type": "transcript.update", "seq": kwargs["seq"]}
+        return SimpleNamespace(is_duplicate=False, inline_updates=[update])
+
+    monkeypatch.setattr(ws_module, "ingest_audio_chunk_bytes_async", _ingest)
+    monkeypatch.setattr(ws_module, "tenant_enforcement_enabled", lambda: False)
+
+    client = TestClient(app)
+    with client.websocket_connect(
+        "/v1/ws/internal",
+        headers={"X-API-Key": "svc-1"},
+        subprotocols=[WS_SUBPROTOCOL_BINARY],
+    ) as conn:
+        assert conn.accepted_subprotocol == WS_SUBPROTOCOL_BINARY
+        conn.send_bytes(
+            encode_audio_frame(
+                BinaryAudioFrame(meeting_id="m-1", seq=7, audio=b"raw", idempotency_key="k7")
+            )
+        )
+        ack = json.loads(conn.receive_text())
+        assert ack["event_type"] == "ingest.ack"
+        assert (ack["seq"], ack["credits"], ack["throttled"]) == (7, 8, False)
+        assert json.loads(conn.receive_text())["seq"] == 7
+
+        conn.send_text(
+            json.dumps(
+                {"event_type": "audio.chunk", "meeting_id": "m-1", "seq": 8, "content_b64": "cmF3"}
+            )
+        )
+        assert json.loads(conn.receive_text())["event_type"] == "ingest.ack"
+        assert json.loads(conn.receive_text())["seq"] == 8
+
+        conn.send_bytes(b"garbage")
+        assert json.loads(conn.receive_text())["code"] == "bad_frame"
+
+    assert [(c["seq"], c["audio_bytes"], c["idempotency_key"]) for c in calls] == [
+        (7, b"raw", "k7"),
+        (8, b"raw", None),
+    ]
+
+
+def test_ws_rejects_binary_without_subprotocol(ws_settings, monkeypatch) -> None:
+    monkeypatch.setattr(ws_module, "tenant_enforcement_enabled", lambda: False)
+
+    client = TestClient(app)
+    with client.websocket_connect("/v1/ws", headers={"X-API-Key": "user-1"}) as conn:
+        assert conn.accepted_subprotocol is None
+        conn.send_bytes(encode_audio_frame(BinaryAudioFrame(meeting_id="m", seq=1, audio=b"x")))
+        assert json.loads(conn.receive_text())["code"] == "binary_not_negotiated"
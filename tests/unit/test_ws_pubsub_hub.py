@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+from apps.api_gateway.pubsub_hub import PubSubHub
+
+
+class _FakePubSub:
+    def __init__(self) -> None:
+        self.subscribed: list[str] = []
+        self.unsubscribed: list[str] = []
+        self.inbox: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels: str) -> None:
+        self.subscribed.extend(channels)
+
+    async def unsubscribe(self, *channels: str) -> None:
+        self.unsubscribed.extend(channels)
+
+    async def get_message(self, ignore_subscribe_messages: bool = False, timeout: float = 0.0):
+        _ = ignore_subscribe_messages
+        try:
+            return await asyncio.wait_for(self.inbox.get(), timeout)
+        except TimeoutError:
+            return None
+
+    async def aclose(self) -> None:
+        return None
+
+    def publish(self, channel: str, data: str) -> None:
+        self.inbox.put_nowait({"type": "message", "channel": channel, "data": data})
+
+
+def test_hub_shares_one_subscription_per_channel() -> None:
+    async def _scenario() -> None:
+        fake = _FakePubSub()
+        hub = PubSubHub(lambda: fake)
+
+        a = await hub.subscribe("ws:m1")
+        b = await hub.subscribe("ws:m1")
+        c = await hub.subscribe("ws:m2")
+        fake.publish("ws:m1", "hello")
+        fake.publish("ws:m2", "other")
+
+        assert await asyncio.wait_for(a.get(), 1) == "hello"
+        assert await asyncio.wait_for(b.get(), 1) == "hello"
+        assert await asyncio.wait_for(c.get(), 1) == "other"
+        assert fake.subscribed == ["ws:m1", "ws:m2"]
+
+        await hub.unsubscribe("ws:m1", a)
+        assert fake.unsubscribed == []
+        await hub.unsubscribe("ws:m1", b)
+        assert fake.unsubscribed == ["ws:m1"]
+        assert hub.channels == ["ws:m2"]
+        await hub.close()
+
+    asyncio.run(_scenario())
+
+
+def test_slow_listener_drops_oldest_messages() -> None:
+    async def _scenario() -> None:
+        fake = _FakePubSub()
+        hub = PubSubHub(lambda: fake, queue_size=2)
+        queue = await hub.subscribe("ws:m1")
+
+        for i in range(4):
+            hub._dispatch("ws:m1", f"msg-{i}")
+
+        assert [queue.get_nowait(), queue.get_nowait()] == ["msg-2", "msg-3"]
+        await hub.close()
+
+    asyncio.run(_scenario())
@@ -0,0 +1,109 @@
+"""
+Benchmark: rubric evidence matching on large transcripts.
+
+Compares the previous per-competency substring scan (rows x competencies x keywords,
+text re-normalized per competency) with the compiled KeywordMatcher
+(one batched pass over all rows).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def _args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Scorecard keyword matcher benchmark")
+    p.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    p.add_argument("--words-per-row", type=int, default=40)
+    p.add_argument("--repeat", type=int, default=3)
+    p.add_argument("--seed", type=int, default=7)
+    return p.parse_args()
+
+
+def _corpus(rows: int, words_per_row: int, seed: int, keywords: list[str]) -> list[str]:
+    rnd = random.Random(seed)
+    filler = [
+        "мы", "это", "сделали", "потом", "проект", "that", "then", "we", "had",
+        "работа", "задача", "the", "and", "было", "нужно", "really", "code",
+    ]  # fmt: skip
+    out: list[str] = []
+    for _ in range(rows):
+        words = [
+            rnd.choice(keywords) if rnd.random() < 0.05 else rnd.choice(filler)
+            for _ in range(words_per_row)
+        ]
+        out.append(" ".join(words))
+    return out
+
+
+def _best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> int:
+    from interview_analytics_agent.processing import keyword_matcher
+    from interview_analytics_agent.processing.scorecard import (
+        _norm,
+        _rubric_keywords,
+        rubric_matcher,
+    )
+
+    args = _args()
+    groups = _rubric_keywords()
+    matcher = rubric_matcher()
+    all_keywords = sorted({k for kws in groups.values() for k in kws})
+
+    def _substring_scan(texts: list[str]) -> int:
+        hits = 0
+        for kws in groups.values():
+            for text in texts:
+                text_norm = _norm(text)
+                hits += len([kw for kw in kws if kw in text_norm])
+        return hits
+
+    def _compiled_scan(texts: list[str]) -> int:
+        return sum(len(v) for row in matcher.match_many(texts) for v in row.values())
+
+    results = []
+    for rows in args.rows:
+        texts = _corpus(rows, args.words_per_row, args.seed, all_keywords)
+        if _substring_scan(texts) != _compiled_scan(texts):
+            print(f"hit count mismatch on {rows} rows", file=sys.stderr)
+            return 1
+        baseline = _best_of(args.repeat, lambda t=texts: _substring_scan(t))
+        compiled = _best_of(args.repeat, lambda t=texts: _compiled_scan(t))
+        results.append(
+            {
+                "rows": rows,
+                "substring_sec": round(baseline, 4),
+                "compiled_sec": round(compiled, 4),
+                "speedup": round(baseline / compiled, 2) if compiled > 0 else None,
+            }
+        )
+
+    backend = "aho-corasick" if keyword_matcher.ahocorasick is not None else "regex-trie"
+    print(
+        json.dumps(
+            {"keywords": len(all_keywords), "backend": backend, "results": results}, indent=2
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
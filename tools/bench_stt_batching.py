@@ -0,0 +1,102 @@
+"""
+Benchmark: chunks/sec of local Whisper at different batch sizes.
+
+batch=1 is the per-chunk path (transcribe_chunk), larger batches go through
+WhisperLocalProvider.transcribe_batch (BatchedInferencePipeline).
+
+Audio: --audio files (any format PyAV can decode, cut into --chunk-sec chunks)
+or a synthetic tone/noise signal when no files are given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = PROJECT_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+
+def _args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Whisper batching benchmark")
+    p.add_argument("--audio", nargs="*", default=[], help="Audio files to cut into chunks")
+    p.add_argument("--chunks", type=int, default=32)
+    p.add_argument("--chunk-sec", type=float, default=5.0)
+    p.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    p.add_argument("--model-size", default=None)
+    p.add_argument("--compute-type", default=None)
+    p.add_argument("--vad", action="store_true", help="Enable VAD (default: off)")
+    return p.parse_args()
+
+
+def _chunks(args: argparse.Namespace):
+    import numpy as np
+
+    from interview_analytics_agent.stt.audio import DecodedAudio, decode_audio
+
+    size = int(args.chunk_sec * 16000)
+    if args.audio:
+        pcm = np.concatenate([decode_audio(Path(p).read_bytes()).samples for p in args.audio])
+        pieces = [pcm[i : i + size] for i in range(0, pcm.shape[0] - size + 1, size)]
+        pieces = (pieces * (args.chunks // max(1, len(pieces)) + 1))[: args.chunks]
+    else:
+        rnd = np.random.default_rng(0)
+        t = np.arange(size) / 16000
+        pieces = [
+            (0.2 * np.sin(2 * np.pi * (150 + 10 * i) * t) + 0.02 * rnd.standard_normal(size))
+            for i in range(args.chunks)
+        ]
+    return [DecodedAudio(samples=np.asarray(p, dtype=np.float32)) for p in pieces]
+
+
+def main() -> int:
+    from interview_analytics_agent.stt.whisper_local import WhisperLocalProvider
+
+    args = _args()
+    chunks = _chunks(args)
+    provider = WhisperLocalProvider(
+        model_size=args.model_size, compute_type=args.compute_type, vad_filter=args.vad
+    )
+    provider.vad_filter = bool(args.vad)
+    # прогрев: первая инференс-сессия заметно дольше
+    provider.transcribe_chunk(audio=b"", sample_rate=16000, decoded=chunks[0])
+
+    results = []
+    for batch in args.batch_sizes:
+        started = time.perf_counter()
+        if batch <= 1:
+            for item in chunks:
+                provider.transcribe_chunk(audio=b"", sample_rate=16000, decoded=item)
+        else:
+            for i in range(0, len(chunks), batch):
+                provider.transcribe_batch(chunks[i : i + batch], batch_size=batch)
+        elapsed = time.perf_counter() - started
+        results.append(
+            {
+                "batch_size": batch,
+                "seconds": round(elapsed, 3),
+                "chunks_per_sec": round(len(chunks) / elapsed, 3) if elapsed > 0 else None,
+            }
+        )
+
+    print(
+        json.dumps(
+            {
+                "chunks": len(chunks),
+                "chunk_sec": args.chunk_sec,
+                "model_size": args.model_size or "settings",
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())